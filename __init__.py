@@ -2,4 +2,11 @@
 
 # Modules in this package so far
 __all__ = ["actor", "game", "anim_sprite_component",
-           "bg_sprite_component", "component", "ship", "sprite_component"]
+           "bg_sprite_component", "component", "ship", "sprite_component",
+           "movement_system", "input_system", "system_registry",
+           "spatial_hash",
+           "texture_atlas", "actor_registry",
+           "actor_pool", "tracing", "replay", "asset_bundle",
+           "texture_preloader", "shader_cache", "gl_state",
+           "vertex_buffer", "view_culler",
+           "world_runner"]
@@ -1,11 +1,14 @@
 from __future__ import annotations
 from typing import List         # For hinting
 from enum import Enum           # For enum
-import ctypes
 from maths import Vector2D, Vector3D, Matrix4
 import maths
 
 
+# Moves farther than this in one tick (e.g. screen wrap) are not interpolated
+TELEPORT_DISTANCE_SQ: float = 250.0 * 250.0
+
+
 class State(Enum):
     eALIVE = 1
     ePAUSED = 2
@@ -21,13 +24,38 @@ class Actor:
 
         # Transform: start
         # Matrix4 because layout assumes vertices have a z component (x,y,z,w)
-        self._m_world_transform: Matrix4 = None
+        self._m_world_transform: Matrix4 = Matrix4()
+        # [If dirty, every descendant is dirty too]
         self._m_recompute_world_transform: bool = True
+        # Position/rotation/scale are relative to parent (if any)
         self._m_position: Vector2D = Vector2D(0.0, 0.0)
         self._m_scale: float = 1.0
         self._m_rotation: float = 0.0
         # Transform: end
 
+        # Scene graph: world transform = local transform * parent's world
+        self._m_parent: Actor = None
+        self._m_children: List[Actor] = []
+        # Local transform and its blend (allocated once actor has a parent)
+        self._m_local_transform: Matrix4 = None
+        self._m_interp_local: Matrix4 = None
+
+        # Scratch matrix for render interpolation (reused every frame)
+        self._m_interp_transform: Matrix4 = Matrix4()
+
+        # Transform at start of last tick (None until first tick)
+        self._m_prev_position: Vector2D = None
+        self._m_prev_rotation: float = 0.0
+
+        # MovementSystem row holding position/rotation (if actor moves)
+        self._m_body: Body = None
+
+        # Set by game's ActorRegistry while registered
+        self._m_handle: ActorHandle = None
+
+        # Pool this actor returns to when dead (None: deleted instead)
+        self._m_pool: ActorPool = None
+
         # Components (sorted)
         self._m_components: List[Component] = []
 
@@ -39,57 +67,134 @@ class Actor:
 
     def delete(self) -> None:
         # If container gone -> contained gone! [Composition]
+        for child in list(self._m_children):
+            child.delete()
+        self.set_parent(None)
         self._m_game.remove_actor(self)
         for c in list(self._m_components):
             c.delete()
 
+    # Pooled actor leaves the game, but keeps its components (and children)
+    def deactivate(self) -> None:
+        self._m_game.remove_actor(self)
+        # Not eDEAD, which would queue it again
+        self.set_state(State.ePAUSED)
+        for c in self._m_components:
+            c.on_deactivate()
+        for child in self._m_children:
+            child.deactivate()
+
+    # Pooled actor rejoins the game, reset as if new
+    def activate(self) -> None:
+        self.set_state(State.eALIVE)
+        self._m_game.add_actor(self)
+        for c in self._m_components:
+            c.on_activate()
+        for child in self._m_children:
+            child.activate()
+        self.reset_actor()
+
+    def reset_actor(self) -> None:
+        # Implementable (restore per-life state of pooled actors)
+        pass
+
     def update(self, dt: float) -> None:
+        # Remember where this tick started (for render interpolation)
+        # [MovementSystem does this in bulk for actors with a body]
+        if self._m_body is None:
+            if self._m_prev_position is None:
+                self._m_prev_position = Vector2D()
+            self._m_prev_position.set(self._m_position.x, self._m_position.y)
+            self._m_prev_rotation = self._m_rotation
+
+        # World transform is rebuilt on demand (once per render, not per tick)
+        # [Components are updated by game's SystemRegistry, before actors]
         if self._m_state == State.eALIVE:
-            self.compute_world_transform()
-
-            self.update_components(dt)
             self.update_actor(dt)
 
-            self.compute_world_transform()
-
-    def update_components(self, dt: float) -> None:
-        for c in self._m_components:
-            c.update(dt)
-
     def update_actor(self, dt: float) -> None:
         # Implementable
         pass
 
-    def input(self, keyb_state: ctypes.Array) -> None:
-        if self._m_state == State.eALIVE:
-            self.input_components(keyb_state)
-            self.input_actor(keyb_state)
-
-    def input_components(self, keyb_state: ctypes.Array) -> None:
-        for c in self._m_components:
-            c.input(keyb_state)
+    # Called when a subscribed action is pressed/released (InputSystem)
+    def on_action(self, action: str, pressed: bool) -> None:
+        # Implementable
+        pass
 
-    def input_actor(self, keyb_state: ctypes.Array) -> None:
+    # Called every frame a subscribed action stays down
+    def on_action_held(self, action: str) -> None:
         # Implementable
         pass
 
+    # Rebuilds world transform if dirty (parents first, each node once)
     def compute_world_transform(self) -> None:
         if self._m_recompute_world_transform:
+            parent: Actor = self._m_parent
+            if parent is not None:
+                parent.compute_world_transform()
             self._m_recompute_world_transform = False
 
-            # Calculate transformation matrices
-            temp_scale = Matrix4.create_scale_matrix_uniform(self._m_scale)
-            temp_rotation = Matrix4.create_rotation_matrix_z(self._m_rotation)
-            temp_translation = Matrix4.create_translation_matrix(
-                Vector3D(self._m_position.x, self._m_position.y, 0.0))
-
-            # Multiply in order
-            self._m_world_transform = temp_scale * temp_rotation * temp_translation
+            # Scale, rotation, translation (in that order) in one step
+            scale: float = self._m_scale
+            if parent is None:
+                self._m_world_transform.set_scale_rotation_translation(
+                    scale, scale, scale, self.get_rotation(),
+                    self._m_position.x, self._m_position.y, 0.0)
+            else:
+                self._m_local_transform.set_scale_rotation_translation(
+                    scale, scale, scale, self.get_rotation(),
+                    self._m_position.x, self._m_position.y, 0.0)
+                Matrix4.multiply(self._m_local_transform,
+                                 parent._m_world_transform, self._m_world_transform)
 
             # Inform components that world transform updated
             for comp in self._m_components:
                 comp.on_update_world_transform()
 
+    # World transform blended between previous and current tick
+    def get_interpolated_world_transform(self, alpha: float) -> Matrix4:
+        # Render may come before first tick (frame with no fixed steps)
+        self.compute_world_transform()
+
+        parent: Actor = self._m_parent
+        if parent is None:
+            local: Matrix4 = self._interpolate_local(alpha, self._m_interp_transform)
+            return self._m_world_transform if local is None else local
+
+        # Child: own blend on top of parent's
+        parent_world: Matrix4 = parent.get_interpolated_world_transform(alpha)
+        local = self._interpolate_local(alpha, self._m_interp_local)
+        if local is None:
+            if parent_world is parent._m_world_transform:
+                # Neither moved: nothing to blend
+                return self._m_world_transform
+            local = self._m_local_transform
+        return Matrix4.multiply(local, parent_world, self._m_interp_transform)
+
+    # Local transform blended into 'out', None if there is nothing to blend
+    def _interpolate_local(self, alpha: float, out: Matrix4) -> Matrix4:
+        prev: Vector2D = self._m_prev_position
+        if prev is None:
+            return None
+
+        pos_x: float = self._m_position.x
+        pos_y: float = self._m_position.y
+        rotation: float = self.get_rotation()
+        dx: float = pos_x - prev.x
+        dy: float = pos_y - prev.y
+        d_rot: float = rotation - self.get_prev_rotation()
+        # Static this tick, or teleported (nothing sensible to blend)
+        if (dx == 0.0 and dy == 0.0 and d_rot == 0.0) or \
+                dx * dx + dy * dy > TELEPORT_DISTANCE_SQ:
+            return None
+
+        # Blend from current back towards previous (alpha=1 is current)
+        t: float = 1.0 - alpha
+        scale: float = self._m_scale
+        return out.set_scale_rotation_translation(
+            scale, scale, scale, rotation - d_rot * t,
+            pos_x - dx * t, pos_y - dy * t, 0.0)
+
     def add_component(self, component: Component) -> None:
         # Add based on update order
         index = 0
@@ -102,40 +207,150 @@ class Actor:
     def remove_component(self, component: Component) -> None:
         self._m_components.remove(component)
 
+    # Store position/rotation in a MovementSystem row from now on
+    def bind_body(self, body: Body) -> None:
+        self._m_body = body
+        self._m_position = body.get_position()
+        self._m_prev_position = body.get_prev_position()
+
+    # Back to plain values (body is about to be removed)
+    def unbind_body(self) -> None:
+        body: Body = self._m_body
+        if body is None:
+            return
+        self._m_rotation = body.get_rotation()
+        self._m_position = Vector2D(self._m_position.x, self._m_position.y)
+        self._m_prev_position = None
+        self._m_body = None
+
+    def get_body(self) -> Body:
+        return self._m_body
+
+    # Dirties this actor and its subtree (stops at already-dirty subtrees)
+    def mark_transform_dirty(self) -> None:
+        if self._m_recompute_world_transform:
+            return
+        self._m_recompute_world_transform = True
+        for child in self._m_children:
+            child.mark_transform_dirty()
+
+    # Attach to parent (None detaches); transform becomes relative to it
+    def set_parent(self, parent: Actor) -> None:
+        if parent is self._m_parent:
+            return
+        # Parent can't be this actor or one of its descendants
+        ancestor: Actor = parent
+        while ancestor is not None:
+            if ancestor is self:
+                raise ValueError("Actor can't be parented to itself or its descendant")
+            ancestor = ancestor._m_parent
+        if self._m_parent is not None:
+            self._m_parent._m_children.remove(self)
+        self._m_parent = parent
+        if parent is not None:
+            parent._m_children.append(self)
+            if self._m_local_transform is None:
+                self._m_local_transform = Matrix4()
+                self._m_interp_local = Matrix4()
+        # Set flag directly: subtree may be clean under a new parent
+        self._m_recompute_world_transform = False
+        self.mark_transform_dirty()
+
+    def get_parent(self) -> Actor:
+        return self._m_parent
+
+    def get_children(self) -> List[Actor]:
+        return self._m_children
+
+    # Position in world space (position is relative to parent)
+    def get_world_position(self) -> Vector2D:
+        world: Matrix4 = self.get_world_transform()
+        return Vector2D(world.get(3, 0), world.get(3, 1))
+
+    # Skip interpolation for next frame (after spawn/teleport)
+    def snap_previous_transform(self) -> None:
+        if self._m_body is not None:
+            self._m_body.snap_previous()
+        else:
+            self._m_prev_position = None
+
     # Getters/setters
     def get_position(self) -> Vector2D:
         return self._m_position
 
     def set_position(self, pos: Vector2D) -> None:
-        self._m_position = pos
-        self._m_recompute_world_transform = True
+        # Same position: world transform still valid
+        if pos.x == self._m_position.x and pos.y == self._m_position.y:
+            return
+        # Copy (position may be a view into MovementSystem)
+        self._m_position.set(pos.x, pos.y)
+        self.mark_transform_dirty()
 
     def get_scale(self) -> float:
         return self._m_scale
 
     def set_scale(self, scale: float) -> None:
+        if scale == self._m_scale:
+            return
         self._m_scale = scale
-        self._m_recompute_world_transform = True
+        self.mark_transform_dirty()
 
     def get_rotation(self) -> float:
+        if self._m_body is not None:
+            return self._m_body.get_rotation()
         return self._m_rotation
 
     def set_rotation(self, rotation: float) -> None:
-        self._m_rotation = rotation
-        self._m_recompute_world_transform = True
-
+        if rotation == self.get_rotation():
+            return
+        if self._m_body is not None:
+            self._m_body.set_rotation(rotation)
+        else:
+            self._m_rotation = rotation
+        self.mark_transform_dirty()
+
+    def get_prev_rotation(self) -> float:
+        if self._m_body is not None:
+            return self._m_body.get_prev_rotation()
+        return self._m_prev_rotation
+
+    # Current (not interpolated) world transform, rebuilt first if dirty
     def get_world_transform(self) -> Matrix4:
+        self.compute_world_transform()
         return self._m_world_transform
 
-    def get_forward(self) -> Vector2D:
+    # Fills 'out' if given (no new vector), else returns a new one
+    def get_forward(self, out: Vector2D = None) -> Vector2D:
         # Note: equation (unit circle) returns normalized vector
-        return Vector2D(maths.cos(self._m_rotation), maths.sin(self._m_rotation))
+        rotation: float = self.get_rotation()
+        if out is None:
+            return Vector2D(maths.cos(rotation), maths.sin(rotation))
+        out.set(maths.cos(rotation), maths.sin(rotation))
+        return out
 
     def get_state(self) -> State:
         return self._m_state
 
     def set_state(self, state: State) -> None:
+        # Dying actors are queued, so game never scans for the dead
+        if state == State.eDEAD and self._m_state != State.eDEAD:
+            self._m_game.queue_dead_actor(self)
         self._m_state = state
+        # Only alive bodies are integrated
+        if self._m_body is not None:
+            self._m_body.set_active(state == State.eALIVE)
 
     def get_game(self) -> Game:
         return self._m_game
+
+    def get_pool(self) -> ActorPool:
+        return self._m_pool
+
+    def set_pool(self, pool: ActorPool) -> None:
+        self._m_pool = pool
+
+    def get_handle(self) -> ActorHandle:
+        return self._m_handle
+
+    def set_handle(self, handle: ActorHandle) -> None:
+        self._m_handle = handle
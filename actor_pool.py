@@ -0,0 +1,58 @@
+from __future__ import annotations
+from typing import Callable, List     # For hinting
+
+
+class ActorPool:
+    """
+    FREE LIST OF DEACTIVATED ACTORS OF ONE TYPE
+
+    Dead pooled actors are deactivated (unregistered, components detached
+    from game systems but kept) and reused by acquire(), so short-lived
+    actors stop allocating once the pool has warmed up.
+    """
+
+    def __init__(self, game: Game, factory: Callable[[Game], Actor]) -> None:
+        self._m_game: Game = game
+        # Creates a new actor when free list is empty (usually the class)
+        self._m_factory: Callable[[Game], Actor] = factory
+        self._m_free: List[Actor] = []
+        self._m_created: int = 0
+
+    # Reused actor (reset, alive, registered) or a new one
+    def acquire(self) -> Actor:
+        if self._m_free:
+            actor: Actor = self._m_free.pop()
+            actor.activate()
+            return actor
+
+        actor = self._m_factory(self._m_game)
+        actor.set_pool(self)
+        self._m_created += 1
+        return actor
+
+    # Called by game instead of deleting a dead pooled actor
+    def release(self, actor: Actor) -> None:
+        actor.deactivate()
+        self._m_free.append(actor)
+
+    # Create actors up front (they start deactivated)
+    def warm_up(self, count: int) -> None:
+        for _ in range(count):
+            actor = self._m_factory(self._m_game)
+            actor.set_pool(self)
+            self._m_created += 1
+            self.release(actor)
+
+    # Delete every free actor (active ones are deleted with the game's actors)
+    def clear(self) -> None:
+        while self._m_free:
+            actor: Actor = self._m_free.pop()
+            actor.set_pool(None)
+            actor.delete()
+
+    def get_free_count(self) -> int:
+        return len(self._m_free)
+
+    # Actors ever created by this pool
+    def get_created_count(self) -> int:
+        return self._m_created
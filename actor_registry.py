@@ -0,0 +1,95 @@
+from __future__ import annotations
+from typing import Iterator, List, NamedTuple     # For hinting
+
+
+class ActorHandle(NamedTuple):
+    """ Weak reference to an actor: stale once the actor is removed """
+    slot: int
+    generation: int
+
+
+class ActorRegistry:
+    """
+    DENSE ACTOR STORAGE WITH GENERATIONAL HANDLES
+
+    Actors sit in one dense list (iteration order) and are removed by
+    swap-and-pop, so add/remove are O(1). Each actor also owns a slot whose
+    generation is bumped on removal; a handle to a removed actor (or to a
+    slot reused by a newer actor) no longer resolves.
+    """
+
+    def __init__(self) -> None:
+        # Dense storage, and slot of each dense entry
+        self._m_actors: List[Actor] = []
+        self._m_dense_slots: List[int] = []
+
+        # Per slot: generation, actor (None if free) and its dense index
+        self._m_generations: List[int] = []
+        self._m_slot_actors: List[Actor] = []
+        self._m_slot_dense: List[int] = []
+        self._m_free_slots: List[int] = []
+
+    def add(self, actor: Actor) -> ActorHandle:
+        if self._m_free_slots:
+            slot: int = self._m_free_slots.pop()
+        else:
+            slot = len(self._m_generations)
+            self._m_generations.append(0)
+            self._m_slot_actors.append(None)
+            self._m_slot_dense.append(-1)
+
+        self._m_slot_actors[slot] = actor
+        self._m_slot_dense[slot] = len(self._m_actors)
+        self._m_actors.append(actor)
+        self._m_dense_slots.append(slot)
+
+        handle = ActorHandle(slot, self._m_generations[slot])
+        actor.set_handle(handle)
+        return handle
+
+    # Returns False if actor was not registered
+    def remove(self, actor: Actor) -> bool:
+        handle: ActorHandle = actor.get_handle()
+        if handle is None or self.get(handle) is not actor:
+            return False
+        slot: int = handle.slot
+
+        # Swap-and-pop dense entry
+        index: int = self._m_slot_dense[slot]
+        last: int = len(self._m_actors) - 1
+        if index != last:
+            moved_slot: int = self._m_dense_slots[last]
+            self._m_actors[index] = self._m_actors[last]
+            self._m_dense_slots[index] = moved_slot
+            self._m_slot_dense[moved_slot] = index
+        self._m_actors.pop()
+        self._m_dense_slots.pop()
+
+        # Free slot, invalidating outstanding handles
+        self._m_generations[slot] += 1
+        self._m_slot_actors[slot] = None
+        self._m_slot_dense[slot] = -1
+        self._m_free_slots.append(slot)
+        actor.set_handle(None)
+        return True
+
+    # Actor for handle, or None if it was removed
+    def get(self, handle: ActorHandle) -> Actor:
+        slot: int = handle.slot
+        if slot < len(self._m_generations) and self._m_generations[slot] == handle.generation:
+            return self._m_slot_actors[slot]
+        return None
+
+    def __contains__(self, actor: Actor) -> bool:
+        handle: ActorHandle = actor.get_handle()
+        return handle is not None and self.get(handle) is actor
+
+    def __iter__(self) -> Iterator[Actor]:
+        return iter(self._m_actors)
+
+    def __len__(self) -> int:
+        return len(self._m_actors)
+
+    # Dense list (do not modify)
+    def get_actors(self) -> List[Actor]:
+        return self._m_actors
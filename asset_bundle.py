@@ -0,0 +1,172 @@
+from __future__ import annotations
+from typing import Dict, List, Tuple     # For hinting
+import argparse
+import ctypes
+import json
+import mmap
+import os
+import struct
+import sdl2
+
+from texture import load_surface_rgba
+
+# File layout (little-endian):
+#   header: magic, version, index length
+#   index:  JSON {name: entry}, entry has offset/size of its data, plus
+#           width/height for images and source mtime/size (staleness)
+#   data:   RGBA8 pixels (rows top to bottom) or UTF-8 text, each aligned
+_MAGIC: bytes = b"AGBN"
+_VERSION: int = 1
+_HEADER = struct.Struct("<4sHI")
+_ALIGNMENT: int = 64
+
+DEFAULT_BUNDLE: str = "assets.bundle"
+
+
+def _source_stamp(file_name: str) -> Tuple[int, int]:
+    stat = os.stat(file_name)
+    return stat.st_mtime_ns, stat.st_size
+
+
+# Decode every PNG in asset_dir and read every file in shader_dir into one file
+def build_bundle(bundle_file: str = DEFAULT_BUNDLE, asset_dir: str = "assets",
+                 shader_dir: str = "shaders") -> bool:
+    index: Dict[str, dict] = {}
+    blobs: List[bytes] = []
+    offset: int = 0
+
+    def add(name: str, data: bytes, entry: dict) -> None:
+        nonlocal offset
+        entry["offset"] = offset
+        entry["size"] = len(data)
+        entry["mtime_ns"], entry["source_size"] = _source_stamp(name)
+        index[name] = entry
+        padding: int = -len(data) % _ALIGNMENT
+        blobs.append(data + b"\0" * padding)
+        offset += len(data) + padding
+
+    for file_name in sorted(os.listdir(asset_dir)):
+        if not file_name.lower().endswith(".png"):
+            continue
+        name: str = asset_dir + "/" + file_name
+        surface: sdl2.SDL_Surface = load_surface_rgba(name)
+        if surface is None:
+            return False
+        width: int = surface.contents.w
+        height: int = surface.contents.h
+        pitch: int = surface.contents.pitch
+        # Tightly packed rows (surface rows may be padded)
+        raw: bytes = ctypes.string_at(surface.contents.pixels, pitch * height)
+        pixels: bytes = b"".join(raw[row * pitch: row * pitch + width * 4]
+                                 for row in range(height))
+        sdl2.SDL_FreeSurface(surface)
+        add(name, pixels, {"kind": "image", "width": width, "height": height})
+
+    for file_name in sorted(os.listdir(shader_dir)):
+        name = shader_dir + "/" + file_name
+        with open(name, "rb") as file_obj:
+            add(name, file_obj.read(), {"kind": "text"})
+
+    index_bytes: bytes = json.dumps(index, sort_keys=True).encode()
+    # Data starts aligned too
+    index_bytes += b" " * (-(_HEADER.size + len(index_bytes)) % _ALIGNMENT)
+
+    with open(bundle_file, "wb") as file_obj:
+        file_obj.write(_HEADER.pack(_MAGIC, _VERSION, len(index_bytes)))
+        file_obj.write(index_bytes)
+        for blob in blobs:
+            file_obj.write(blob)
+    return True
+
+
+class AssetBundle:
+    """
+    MEMORY-MAPPED BUNDLE OF PRE-DECODED ASSETS
+
+    Images are stored as RGBA8 and handed to GL straight from the mapping
+    (no decode, no copy). An entry whose loose source file changed since
+    the bundle was built is stale: callers load the loose file instead.
+    """
+
+    def __init__(self) -> None:
+        self._m_file = None
+        self._m_map: mmap.mmap = None
+        self._m_index: Dict[str, dict] = {}
+        self._m_data_offset: int = 0
+
+    # False if bundle is missing or unreadable (everything loads from loose files)
+    def open(self, bundle_file: str = DEFAULT_BUNDLE) -> bool:
+        try:
+            self._m_file = open(bundle_file, "rb")
+            # Copy-on-write mapping: ctypes views need a writable buffer,
+            # but nothing writes, so pages stay shared with the file
+            self._m_map = mmap.mmap(self._m_file.fileno(), 0, access=mmap.ACCESS_COPY)
+        except (OSError, ValueError):
+            self.close()
+            return False
+
+        magic, version, index_size = _HEADER.unpack_from(self._m_map, 0)
+        if magic != _MAGIC or version != _VERSION:
+            sdl2.SDL_Log(b"Ignoring asset bundle with unknown format: ", bundle_file.encode())
+            self.close()
+            return False
+        self._m_index = json.loads(self._m_map[_HEADER.size:_HEADER.size + index_size])
+        self._m_data_offset = _HEADER.size + index_size
+        return True
+
+    # Views from get_pixels() must be dropped before closing
+    def close(self) -> None:
+        if self._m_map is not None:
+            self._m_map.close()
+            self._m_map = None
+        if self._m_file is not None:
+            self._m_file.close()
+            self._m_file = None
+        self._m_index = {}
+
+    def is_open(self) -> bool:
+        return self._m_map is not None
+
+    # Bundled and up to date with its loose file (if that file still exists)
+    def has_fresh(self, name: str) -> bool:
+        entry: dict = self._m_index.get(name)
+        if entry is None:
+            return False
+        try:
+            stamp: Tuple[int, int] = _source_stamp(name)
+        except OSError:
+            # Shipped without loose files
+            return True
+        return stamp == (entry["mtime_ns"], entry["source_size"])
+
+    def get_image_size(self, name: str) -> Tuple[int, int]:
+        entry: dict = self._m_index[name]
+        return entry["width"], entry["height"]
+
+    # Zero-copy view of an image's RGBA8 pixels
+    def get_pixels(self, name: str) -> ctypes.Array:
+        entry: dict = self._m_index[name]
+        return (ctypes.c_ubyte * entry["size"]).from_buffer(
+            self._m_map, self._m_data_offset + entry["offset"])
+
+    def get_text(self, name: str) -> str:
+        entry: dict = self._m_index[name]
+        start: int = self._m_data_offset + entry["offset"]
+        return self._m_map[start:start + entry["size"]].decode()
+
+    def get_names(self) -> List[str]:
+        return list(self._m_index)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack assets/ and shaders/ into a bundle")
+    parser.add_argument("--output", default=DEFAULT_BUNDLE)
+    args = parser.parse_args()
+
+    if not build_bundle(args.output):
+        raise SystemExit("Failed to build asset bundle")
+    print("Wrote " + args.output)
+
+
+if __name__ == "__main__":
+    main()
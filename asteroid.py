@@ -4,7 +4,6 @@ from sprite_component import SpriteComponent
 from move_component import MoveComponent
 from circle_component import CircleComponent
 from maths import Vector2D, TWO_PI, PI_OVER_TWO
-from randoms import Random
 
 
 class Asteroid(Actor):
@@ -12,17 +11,18 @@ class Asteroid(Actor):
         super().__init__(game)
 
         # Initialize position/orientation
-        rand_pos: Vector2D = Random.get_vector(
+        rand: Random = game.get_random()
+        rand_pos: Vector2D = rand.get_vector(
             Vector2D(0.0, 0.0), Vector2D(1024.0, 768.0))
         self.set_position(rand_pos)
-        self.set_rotation(Random.get_float_range(0.0, TWO_PI))
+        self.set_rotation(rand.get_float_range(0.0, TWO_PI))
 
         # Add components
         sc = SpriteComponent(self)
         sc.set_texture(self._m_game.get_texture("assets/asteroid.png"))
 
         mc = MoveComponent(self)
-        mc.set_rotation_speed(Random.get_float_range(0.0, PI_OVER_TWO))
+        mc.set_rotation_speed(rand.get_float_range(0.0, PI_OVER_TWO))
         mc.set_mass(1)
         mc.add_force(self.get_forward() * 3000.0)
 
@@ -0,0 +1,357 @@
+"""
+Benchmark suite: math hot paths, and simulation/collision scaling.
+
+Runs headless (no display or GL context needed). Micro-benchmarks report
+ops/sec; scaling benchmarks build a headless Game with N asteroids and
+report frame time percentiles, allocations per frame and ops/sec at each N.
+Results are written as JSON so runs from different commits can be compared:
+
+    python benchmarks/bench_suite.py --output before.json
+    python benchmarks/bench_suite.py --output after.json --compare before.json
+"""
+from __future__ import annotations
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import timeit
+import tracemalloc
+from typing import Callable, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from maths import Matrix4, Vector2D     # noqa: E402
+from game import Game                   # noqa: E402
+from actor import Actor                 # noqa: E402
+from asteroid import Asteroid           # noqa: E402
+from laser import Laser                 # noqa: E402
+from spatial_hash import SpatialHash    # noqa: E402
+
+DEFAULT_SIZES = [10, 100, 1000, 10000, 100000]
+NUM_LASERS = 100
+# Metrics where a larger value is better (everything else: smaller is better)
+HIGHER_IS_BETTER = ("ops_per_sec",)
+
+
+def percentiles(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    last = len(ordered) - 1
+
+    def at(fraction: float) -> float:
+        return ordered[min(last, int(round(fraction * last)))]
+    return {"p50": at(0.50), "p90": at(0.90), "p99": at(0.99),
+            "max": ordered[-1], "mean": sum(ordered) / len(ordered)}
+
+
+# Best of repeats, as ops/sec
+def ops_per_sec(func: Callable, number: int, repeat: int = 5) -> float:
+    best = min(timeit.repeat(func, number=number, repeat=repeat))
+    return number / best
+
+
+# Math: start
+def bench_math(quick: bool) -> Dict[str, Dict[str, float]]:
+    number = 5000 if quick else 50000
+    a = Matrix4.create_rotation_matrix_z(0.3)
+    b = Matrix4.create_scale_matrix_xyz(64.0, 64.0, 1.0)
+    out = Matrix4()
+    u = Vector2D(1.5, -2.0)
+    v = Vector2D(0.25, 4.0)
+    w = Vector2D(0.0, 0.0)
+
+    # Lone actor, nothing else in game (no ship/asteroids)
+    game = Game(headless=True)
+    actor = Actor(game)
+    actor.set_position(Vector2D(10.0, 20.0))
+    actor.set_rotation(0.3)
+
+    def world_transform() -> None:
+        actor.mark_transform_dirty()
+        actor.compute_world_transform()
+
+    cases = {
+        "Matrix4.__mul__": lambda: a * b,
+        "Matrix4.multiply (in-place)": lambda: Matrix4.multiply(a, b, out),
+        "Vector2D.__add__": lambda: u + v,
+        "Vector2D.__sub__": lambda: u - v,
+        "Vector2D.__mul__": lambda: u * 2.0,
+        "Vector2D.__iadd__": lambda: w.__iadd__(v),
+        "Vector2D.dot": lambda: Vector2D.dot(u, v),
+        "Vector2D.length": lambda: u.length(),
+        "Actor.compute_world_transform": world_transform,
+    }
+    results = {}
+    for name, func in cases.items():
+        results[name] = {"ops_per_sec": ops_per_sec(func, number)}
+    return results
+# Math: end
+
+
+# Scaling: start
+def create_game(num_asteroids: int) -> Game:
+    game = Game(headless=True)
+    game.initialize()
+
+    # Trim or grow the default field to exactly num_asteroids
+    asteroids = list(game.get_asteroids())
+    for asteroid in asteroids[num_asteroids:]:
+        asteroid.delete()
+    for _ in range(num_asteroids - len(asteroids)):
+        Asteroid(game)
+    # One tick registers/places everything before measuring
+    game.run_frames(1)
+    return game
+
+
+def frames_for(num_asteroids: int, quick: bool) -> int:
+    budget = 20000 if quick else 200000     # Asteroid-updates per benchmark
+    return max(5, min(300, budget // max(1, num_asteroids)))
+
+
+# Whole frames: percentiles, plus allocations measured on separate frames
+def bench_frames(game: Game, num_frames: int) -> Dict[str, float]:
+    times = []
+    for _ in range(num_frames):
+        start = time.perf_counter_ns()
+        game.run_frames(1)
+        times.append((time.perf_counter_ns() - start) / 1e6)
+    result = {"frame_ms_" + key: value for key, value in percentiles(times).items()}
+    result["frames_per_sec"] = 1000.0 / result["frame_ms_mean"]
+
+    # tracemalloc slows frames down, so they are kept out of the timings
+    # [Net blocks: objects left alive per frame; peak: transient bytes]
+    alloc_frames = max(3, num_frames // 10)
+    gc.collect()
+    tracemalloc.start()
+    blocks_before = sys.getallocatedblocks()
+    peaks = []
+    for _ in range(alloc_frames):
+        tracemalloc.reset_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        game.run_frames(1)
+        peaks.append(tracemalloc.get_traced_memory()[1] - current)
+    blocks_after = sys.getallocatedblocks()
+    tracemalloc.stop()
+    result["alloc_net_blocks_per_frame"] = (blocks_after - blocks_before) / alloc_frames
+    result["alloc_peak_bytes_per_frame"] = sum(peaks) / len(peaks)
+    return result
+
+
+def bench_movement(game: Game, num_frames: int) -> Dict[str, float]:
+    system = game.get_movement_system()
+    dt = 1.0 / game.get_tick_rate()
+    times = []
+    for _ in range(num_frames):
+        start = time.perf_counter_ns()
+        system.update(dt)
+        times.append((time.perf_counter_ns() - start) / 1e6)
+    result = {"update_ms_" + key: value for key, value in percentiles(times).items()}
+    result["bodies"] = system.get_count()
+    result["ops_per_sec"] = system.get_count() * 1000.0 / result["update_ms_mean"]
+    return result
+
+
+# Same broadphase + narrowphase test as Laser.update_actor, without killing
+def bench_collision(game: Game, num_frames: int) -> Dict[str, float]:
+    lasers = []
+    rand = game.get_random()
+    for _ in range(NUM_LASERS):
+        laser = Laser(game)
+        laser.set_position(rand.get_vector(Vector2D(-512.0, -384.0),
+                                           Vector2D(512.0, 384.0)))
+        laser.compute_world_transform()
+        lasers.append(laser)
+    grid = game.get_asteroid_grid()
+    grid.rebuild()
+
+    times = []
+    hits = 0
+    tests = 0
+    for _ in range(num_frames):
+        start = time.perf_counter_ns()
+        for laser in lasers:
+            circle = laser._m_circle
+            center = circle.get_center()
+            for other in grid.query(center.x, center.y, circle.get_radius()):
+                tests += 1
+                if circle.intersect(circle, other):
+                    hits += 1
+                    break
+        times.append((time.perf_counter_ns() - start) / 1e6)
+    result = {"frame_ms_" + key: value for key, value in percentiles(times).items()}
+    result["ops_per_sec"] = NUM_LASERS * 1000.0 / result["frame_ms_mean"]
+    result["narrowphase_tests_per_laser"] = tests / (num_frames * NUM_LASERS)
+    result["hits_per_frame"] = hits / num_frames
+    return result
+
+
+# Sprite as a circle SpatialHash can bin (grid alternative to ViewCuller)
+class SpriteCircle:
+    __slots__ = ("sprite",)
+
+    def __init__(self, sprite) -> None:
+        self.sprite = sprite
+
+    def get_center(self) -> Vector2D:
+        x, y, _ = self.sprite.get_bounds()
+        return Vector2D(x, y)
+
+    def get_radius(self) -> float:
+        return self.sprite.get_bounds()[2]
+
+
+# ViewCuller's per-sprite test, against a grid re-binned after each tick
+# (sprites move every tick) and queried with the view rectangle
+def bench_culling(game: Game, num_frames: int) -> Dict[str, float]:
+    culler = game.get_view_culler()
+    layers = game._m_sprite_layers
+    draw_orders = game._m_draw_orders
+    times = []
+    for _ in range(num_frames):
+        game.run_frames(1)
+        start = time.perf_counter_ns()
+        culler.cull(layers, draw_orders)
+        times.append((time.perf_counter_ns() - start) / 1e6)
+    result = {"cull_ms_" + key: value for key, value in percentiles(times).items()}
+    result["sprites"] = culler.get_total_count()
+    result["visible"] = culler.get_visible_count()
+    result["ops_per_sec"] = culler.get_total_count() * 1000.0 / result["cull_ms_mean"]
+
+    grid = SpatialHash(128.0)
+    for draw_order in draw_orders:
+        for sprite in layers[draw_order]:
+            grid.insert(SpriteCircle(sprite))
+    grid_times = []
+    for _ in range(num_frames):
+        game.run_frames(1)
+        start = time.perf_counter_ns()
+        grid.rebuild()
+        visible = [circle.sprite for circle in grid.query_rect(-544.0, -416.0, 544.0, 416.0)
+                   if culler.is_visible(circle.sprite)]
+        grid_times.append((time.perf_counter_ns() - start) / 1e6)
+    result["grid_cull_ms_mean"] = percentiles(grid_times)["mean"]
+    result["grid_visible"] = len(visible)
+    return result
+
+
+def bench_scaling(sizes: List[int], quick: bool) -> Dict[str, Dict[str, Dict[str, float]]]:
+    results = {"frame": {}, "movement": {}, "laser_collision": {}, "culling": {}}
+    for size in sizes:
+        num_frames = frames_for(size, quick)
+        game = create_game(size)
+        results["frame"][str(size)] = bench_frames(game, num_frames)
+        results["movement"][str(size)] = bench_movement(game, num_frames)
+        results["laser_collision"][str(size)] = bench_collision(game, num_frames)
+        results["culling"][str(size)] = bench_culling(game, num_frames)
+        game.shutdown()
+        print("  {:>7} asteroids: {:9.3f} ms/frame (p99 {:.3f})".format(
+            size, results["frame"][str(size)]["frame_ms_p50"],
+            results["frame"][str(size)]["frame_ms_p99"]), flush=True)
+    return results
+# Scaling: end
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def print_report(results: dict) -> None:
+    print("\n{:<32} {:>14}".format("micro-benchmark", "ops/sec"))
+    for name, stats in results["math"].items():
+        print("{:<32} {:>14,.0f}".format(name, stats["ops_per_sec"]))
+
+    print("\n{:>8} {:>10} {:>10} {:>10} {:>12} {:>12} {:>14} {:>14} {:>10} {:>10}".format(
+        "N", "frame p50", "frame p99", "frames/s", "net blk/fr", "peak B/fr",
+        "bodies/s", "lasers/s", "cull ms", "grid ms"))
+    scaling = results["scaling"]
+    for size in scaling["frame"]:
+        frame = scaling["frame"][size]
+        culling = scaling["culling"][size]
+        print("{:>8} {:>10.3f} {:>10.3f} {:>10.1f} {:>12.1f} {:>12.0f} {:>14,.0f} {:>14,.0f} {:>10.3f} {:>10.3f}".format(
+            int(size), frame["frame_ms_p50"], frame["frame_ms_p99"], frame["frames_per_sec"],
+            frame["alloc_net_blocks_per_frame"], frame["alloc_peak_bytes_per_frame"],
+            scaling["movement"][size]["ops_per_sec"],
+            scaling["laser_collision"][size]["ops_per_sec"],
+            culling["cull_ms_mean"], culling["grid_cull_ms_mean"]))
+
+
+# Yields (metric path, old, new, relative change; positive = worse)
+def compare(old: dict, new: dict, path: str = ""):
+    for key, new_value in new.items():
+        if key not in old:
+            continue
+        old_value = old[key]
+        key_path = path + "/" + key if path else key
+        if isinstance(new_value, dict):
+            yield from compare(old_value, new_value, key_path)
+        elif isinstance(new_value, (int, float)) and old_value:
+            change = (new_value - old_value) / abs(old_value)
+            if key.startswith(HIGHER_IS_BETTER) or key == "frames_per_sec":
+                change = -change
+            yield key_path, old_value, new_value, change
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Headless benchmark suite")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="asteroid counts for scaling benchmarks")
+    parser.add_argument("--quick", action="store_true",
+                        help="fewer iterations (smoke run)")
+    parser.add_argument("--output", default="bench_results.json",
+                        help="JSON results file")
+    parser.add_argument("--compare", metavar="FILE",
+                        help="earlier results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="relative slowdown reported as regression")
+    args = parser.parse_args()
+
+    # Game loads assets relative to repository root
+    output_file = os.path.abspath(args.output)
+    compare_file = os.path.abspath(args.compare) if args.compare else None
+    os.chdir(ROOT)
+
+    results = {
+        "meta": {"revision": git_revision(),
+                 "python": platform.python_version(),
+                 "machine": platform.machine(),
+                 "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                 "quick": args.quick},
+        "math": bench_math(args.quick),
+    }
+    print("Scaling benchmarks:")
+    results["scaling"] = bench_scaling(args.sizes, args.quick)
+    print_report(results)
+
+    with open(output_file, "w") as file_obj:
+        json.dump(results, file_obj, indent=2)
+    print("\nResults written to " + output_file)
+
+    if compare_file:
+        with open(compare_file) as file_obj:
+            old = json.load(file_obj)
+        regressions = [item for item in compare(old["math"], results["math"], "math")]
+        regressions += [item for item in compare(old["scaling"], results["scaling"], "scaling")]
+        # Only central timings/throughput (tails and counts are too noisy)
+        regressions = [item for item in regressions
+                       if item[0].endswith(("_p50", "_mean", "per_sec")) and item[3] > args.threshold]
+        print("\nCompared with {} ({}):".format(args.compare, old["meta"]["revision"]))
+        if not regressions:
+            print("  no regressions above {:.0%}".format(args.threshold))
+        for metric, old_value, new_value, change in regressions:
+            print("  REGRESSION {:<60} {:>12.4g} -> {:<12.4g} ({:+.0%})".format(
+                metric, old_value, new_value, change))
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
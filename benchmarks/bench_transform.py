@@ -0,0 +1,213 @@
+"""
+Micro-benchmark: per-actor transform cost (world transform + sprite matrix).
+
+Compares building the matrices with temporaries (three matrices, three
+multiplies, as the game used to), on the old nested-ctypes Matrix4 (copied
+below as the baseline) and on the flat one, against the fused, in-place path.
+Run from anywhere: python benchmarks/bench_transform.py
+"""
+from __future__ import annotations
+import ctypes
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from maths import Matrix4, Vector3D, cos, sin     # noqa: E402
+
+
+class LegacyMatrix4:
+    """ BASELINE: MATRIX4 BEFORE THE FLAT BUFFER (UNCHANGED COPY) """
+    def __init__(self) -> None:
+        # C array storing matrix data
+        CArray = ((ctypes.c_float * 4) * 4)
+        self.m_mat = CArray()
+
+        # Initialize array to identity matrix
+        self.m_mat[0][0] = 1.0
+        self.m_mat[0][1] = 0.0
+        self.m_mat[0][2] = 0.0
+        self.m_mat[0][3] = 0.0
+
+        self.m_mat[1][0] = 0.0
+        self.m_mat[1][1] = 1.0
+        self.m_mat[1][2] = 0.0
+        self.m_mat[1][3] = 0.0
+
+        self.m_mat[2][0] = 0.0
+        self.m_mat[2][1] = 0.0
+        self.m_mat[2][2] = 1.0
+        self.m_mat[2][3] = 0.0
+
+        self.m_mat[3][0] = 0.0
+        self.m_mat[3][1] = 0.0
+        self.m_mat[3][2] = 0.0
+        self.m_mat[3][3] = 1.0
+
+    # Matrix multiplication
+    def __mul__(self, other: LegacyMatrix4) -> LegacyMatrix4:
+        ret_val: LegacyMatrix4 = LegacyMatrix4()
+
+        # Row 0
+        ret_val.m_mat[0][0] = self.m_mat[0][0] * other.m_mat[0][0] + self.m_mat[0][1] * \
+            other.m_mat[1][0] + self.m_mat[0][2] * \
+            other.m_mat[2][0] + self.m_mat[0][3] * other.m_mat[3][0]
+
+        ret_val.m_mat[0][1] = self.m_mat[0][0] * other.m_mat[0][1] + self.m_mat[0][1] * \
+            other.m_mat[1][1] + self.m_mat[0][2] * \
+            other.m_mat[2][1] + self.m_mat[0][3] * other.m_mat[3][1]
+
+        ret_val.m_mat[0][2] = self.m_mat[0][0] * other.m_mat[0][2] + self.m_mat[0][1] * \
+            other.m_mat[1][2] + self.m_mat[0][2] * \
+            other.m_mat[2][2] + self.m_mat[0][3] * other.m_mat[3][2]
+
+        ret_val.m_mat[0][3] = self.m_mat[0][0] * other.m_mat[0][3] + self.m_mat[0][1] * \
+            other.m_mat[1][3] + self.m_mat[0][2] * \
+            other.m_mat[2][3] + self.m_mat[0][3] * other.m_mat[3][3]
+
+        # Row 1
+        ret_val.m_mat[1][0] = self.m_mat[1][0] * other.m_mat[0][0] + self.m_mat[1][1] * \
+            other.m_mat[1][0] + self.m_mat[1][2] * \
+            other.m_mat[2][0] + self.m_mat[1][3] * other.m_mat[3][0]
+
+        ret_val.m_mat[1][1] = self.m_mat[1][0] * other.m_mat[0][1] + self.m_mat[1][1] * \
+            other.m_mat[1][1] + self.m_mat[1][2] * \
+            other.m_mat[2][1] + self.m_mat[1][3] * other.m_mat[3][1]
+
+        ret_val.m_mat[1][2] = self.m_mat[1][0] * other.m_mat[0][2] + self.m_mat[1][1] * \
+            other.m_mat[1][2] + self.m_mat[1][2] * \
+            other.m_mat[2][2] + self.m_mat[1][3] * other.m_mat[3][2]
+
+        ret_val.m_mat[1][3] = self.m_mat[1][0] * other.m_mat[0][3] + self.m_mat[1][1] * \
+            other.m_mat[1][3] + self.m_mat[1][2] * \
+            other.m_mat[2][3] + self.m_mat[1][3] * other.m_mat[3][3]
+
+        # Row 2
+        ret_val.m_mat[2][0] = self.m_mat[2][0] * other.m_mat[0][0] + self.m_mat[2][1] * \
+            other.m_mat[1][0] + self.m_mat[2][2] * \
+            other.m_mat[2][0] + self.m_mat[2][3] * other.m_mat[3][0]
+
+        ret_val.m_mat[2][1] = self.m_mat[2][0] * other.m_mat[0][1] + self.m_mat[2][1] * \
+            other.m_mat[1][1] + self.m_mat[2][2] * \
+            other.m_mat[2][1] + self.m_mat[2][3] * other.m_mat[3][1]
+
+        ret_val.m_mat[2][2] = self.m_mat[2][0] * other.m_mat[0][2] + self.m_mat[2][1] * \
+            other.m_mat[1][2] + self.m_mat[2][2] * \
+            other.m_mat[2][2] + self.m_mat[2][3] * other.m_mat[3][2]
+
+        ret_val.m_mat[2][3] = self.m_mat[2][0] * other.m_mat[0][3] + self.m_mat[2][1] * \
+            other.m_mat[1][3] + self.m_mat[2][2] * \
+            other.m_mat[2][3] + self.m_mat[2][3] * other.m_mat[3][3]
+
+        # Row 3
+        ret_val.m_mat[3][0] = self.m_mat[3][0] * other.m_mat[0][0] + self.m_mat[3][1] * \
+            other.m_mat[1][0] + self.m_mat[3][2] * \
+            other.m_mat[2][0] + self.m_mat[3][3] * other.m_mat[3][0]
+
+        ret_val.m_mat[3][1] = self.m_mat[3][0] * other.m_mat[0][1] + self.m_mat[3][1] * \
+            other.m_mat[1][1] + self.m_mat[3][2] * \
+            other.m_mat[2][1] + self.m_mat[3][3] * other.m_mat[3][1]
+
+        ret_val.m_mat[3][2] = self.m_mat[3][0] * other.m_mat[0][2] + self.m_mat[3][1] * \
+            other.m_mat[1][2] + self.m_mat[3][2] * \
+            other.m_mat[2][2] + self.m_mat[3][3] * other.m_mat[3][2]
+
+        ret_val.m_mat[3][3] = self.m_mat[3][0] * other.m_mat[0][3] + self.m_mat[3][1] * \
+            other.m_mat[1][3] + self.m_mat[3][2] * \
+            other.m_mat[2][3] + self.m_mat[3][3] * other.m_mat[3][3]
+
+        return ret_val
+
+    # Create a scale matrix with x, y, and z scales
+    @staticmethod
+    def create_scale_matrix_xyz(xscale: float, yscale: float, zscale: float) -> LegacyMatrix4:
+        temp: LegacyMatrix4 = LegacyMatrix4()
+
+        temp.m_mat[0][0] = xscale
+        temp.m_mat[1][1] = yscale
+        temp.m_mat[2][2] = zscale
+        temp.m_mat[3][3] = 1.0
+
+        return temp
+
+    # Create a scale matrix with uniform factor
+    @staticmethod
+    def create_scale_matrix_uniform(scale: float) -> LegacyMatrix4:
+        return LegacyMatrix4.create_scale_matrix_xyz(scale, scale, scale)
+
+    # TODO Create rotation matrix about x-axis
+    # TODO Create rotation matrix about y-axix
+
+    # Create rotation matrix about z-axis
+    @staticmethod
+    def create_rotation_matrix_z(theta: float) -> LegacyMatrix4:
+        temp: LegacyMatrix4 = LegacyMatrix4()
+
+        temp.m_mat[0][0] = cos(theta)
+        temp.m_mat[0][1] = sin(theta)
+        temp.m_mat[1][0] = -sin(theta)
+        temp.m_mat[1][1] = cos(theta)
+        temp.m_mat[2][2] = 1.0
+        temp.m_mat[3][3] = 1.0
+
+        return temp
+
+    # Create translation matrix
+    @staticmethod
+    def create_translation_matrix(trans: Vector3D) -> LegacyMatrix4:
+        temp: LegacyMatrix4 = LegacyMatrix4()
+
+        temp.m_mat[0][0] = 1.0
+        temp.m_mat[1][1] = 1.0
+        temp.m_mat[2][2] = 1.0
+        temp.m_mat[3][0] = trans.x
+        temp.m_mat[3][1] = trans.y
+        temp.m_mat[3][2] = trans.z
+        temp.m_mat[3][3] = 1.0
+
+        return temp
+
+
+def per_actor_legacy() -> LegacyMatrix4:
+    scale = LegacyMatrix4.create_scale_matrix_uniform(1.0)
+    rotation = LegacyMatrix4.create_rotation_matrix_z(0.3)
+    translation = LegacyMatrix4.create_translation_matrix(Vector3D(10.0, 20.0, 0.0))
+    world = scale * rotation * translation
+    return LegacyMatrix4.create_scale_matrix_xyz(64.0, 64.0, 1.0) * world
+
+
+def per_actor_temporaries() -> Matrix4:
+    scale = Matrix4.create_scale_matrix_uniform(1.0)
+    rotation = Matrix4.create_rotation_matrix_z(0.3)
+    translation = Matrix4.create_translation_matrix(Vector3D(10.0, 20.0, 0.0))
+    world = scale * rotation * translation
+    return Matrix4.create_scale_matrix_xyz(64.0, 64.0, 1.0) * world
+
+
+_world = Matrix4()
+_sprite_scale = Matrix4.create_scale_matrix_xyz(64.0, 64.0, 1.0)
+_sprite_world = Matrix4()
+
+
+def per_actor_fused() -> Matrix4:
+    _world.set_scale_rotation_translation(1.0, 1.0, 1.0, 0.3, 10.0, 20.0, 0.0)
+    return Matrix4.multiply(_sprite_scale, _world, _sprite_world)
+
+
+def main() -> None:
+    # All cases build the same matrix
+    expected = [value for row in per_actor_legacy().m_mat for value in row]
+    for func in (per_actor_temporaries, per_actor_fused):
+        assert all(abs(a - b) < 1e-4 for a, b in zip(func().m_mat, expected))
+
+    number = 20000
+    for name, func in (("nested, temps", per_actor_legacy),
+                       ("flat, temps", per_actor_temporaries),
+                       ("fused in-place", per_actor_fused)):
+        best = min(timeit.repeat(func, number=number, repeat=5))
+        print("{:<16} {:8.2f} us/actor".format(name, best / number * 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -9,9 +9,12 @@ class CircleComponent(Component):
         self._m_radius: float = 0.0
 
     def intersect(self, circle_a: CircleComponent, circle_b: CircleComponent) -> bool:
-        # Compute distance squared
-        diff: Vector2D = circle_a.get_center() - circle_b.get_center()
-        dist_sq: float = diff.length_sq()
+        # Compute distance squared (no temporary vector)
+        center_a: Vector2D = circle_a.get_center()
+        center_b: Vector2D = circle_b.get_center()
+        dx: float = center_a.x - center_b.x
+        dy: float = center_a.y - center_b.y
+        dist_sq: float = dx * dx + dy * dy
 
         # Compute sum of radii squared
         radii: float = circle_a.get_radius() + circle_b.get_radius()
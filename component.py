@@ -1,5 +1,4 @@
 from __future__ import annotations
-import ctypes
 
 
 class Component:
@@ -9,17 +8,37 @@ class Component:
         self._m_owner: Actor = owner
         self._m_update_order: int = update_order
 
-        # Add self to owner's component list
+        # Add self to owner's component list, and to game's systems
         owner.add_component(self)
+        owner.get_game().get_system_registry().add_component(self)
 
     def delete(self) -> None:
         self._m_owner.remove_component(self)
+        self._m_owner.get_game().get_system_registry().remove_component(self)
 
+    # Ticked by type's pool in SystemRegistry, before actors update
+    # [Not overriding: never called. Order is the type's, see SystemRegistry]
     def update(self, dt: float) -> None:
         # Implementable
         pass
 
-    def input(self, keyb_state: ctypes.Array) -> None:
+    # Called when a subscribed action is pressed/released (InputSystem)
+    def on_action(self, action: str, pressed: bool) -> None:
+        # Implementable
+        pass
+
+    # Called every frame a subscribed action stays down
+    def on_action_held(self, action: str) -> None:
+        # Implementable
+        pass
+
+    # Called when pooled owner is returned to its pool
+    def on_deactivate(self) -> None:
+        # Implementable
+        pass
+
+    # Called when pooled owner is reused (reset component here)
+    def on_activate(self) -> None:
         # Implementable
         pass
 
@@ -30,3 +49,6 @@ class Component:
 
     def get_update_order(self) -> int:
         return self._m_update_order
+
+    def get_owner(self) -> Actor:
+        return self._m_owner
@@ -7,19 +7,52 @@ import OpenGL.GL as GL
 
 from vertex_array import VertexArray
 from shader import Shader
+from shader_cache import ShaderCache
+from gl_state import GLState
 from randoms import Random
 from maths import Vector2D, Matrix4
-from texture import Texture
+from texture import Texture, StubTexture
+from texture_atlas import TextureAtlas
+from asset_bundle import AssetBundle, DEFAULT_BUNDLE
+from texture_preloader import TexturePreloader
 import maths
 import ctypes
+import os
+import bisect
+import struct
+import zlib
+from typing import Collection, Dict, Iterator, List     # For hinting
 
 from ship import Ship
 from actor import State
 from asteroid import Asteroid
+from actor_registry import ActorRegistry, ActorHandle
+from actor_pool import ActorPool
+from tracing import Tracer
+from replay import InputRecorder
+from movement_system import MovementSystem
+from input_system import InputSystem
+from system_registry import SystemRegistry
+from spatial_hash import SpatialHash
+from view_culler import ViewCuller
+
+# Action -> key (listeners subscribe to actions, never bind keys)
+# [Order is also the order held actions are dispatched in]
+KEY_BINDINGS = (("forward", sdl2.SDL_SCANCODE_W),
+                ("back", sdl2.SDL_SCANCODE_S),
+                ("clockwise", sdl2.SDL_SCANCODE_D),
+                ("counter_clockwise", sdl2.SDL_SCANCODE_A),
+                ("fire", sdl2.SDL_SCANCODE_SPACE))
+
+# Actor fields hashed by Game.compute_state_checksum
+_ACTOR_STATE = struct.Struct("<Bddd")
 
 
 class Game:
-    def __init__(self):
+    def __init__(self, headless: bool = False, tick_rate: int = 60, seed: int = 4):
+        # Headless mode: no window, no GL context, stub textures
+        self._m_headless: bool = headless
+
         # For SDL use
         self._m_window: sdl2.SDL_Window = None
         self._m_context: sdl2.SDL_GLContext = None
@@ -27,28 +60,100 @@ class Game:
 
         # All loaded textures
         self._m_textures = {}
+        # Memory-mapped, pre-decoded assets (loose files used if absent/stale)
+        self._m_bundle: AssetBundle = AssetBundle()
+        # Decodes loose images in parallel during startup
+        self._m_preloader: TexturePreloader = TexturePreloader()
+        # Every image in assets/ packed into shared pages
+        self._m_atlas: TextureAtlas = TextureAtlas()
 
         # All actors
-        self._m_actors = []
-        self._m_pending_actors = []
+        self._m_actors: ActorRegistry = ActorRegistry()
+        # Dicts used as ordered sets (O(1) removal)
+        self._m_pending_actors: Dict[Actor, None] = {}
+        # Actors that died this tick (pushed by Actor.set_state)
+        self._m_dead_actors: Dict[Actor, None] = {}
+        # Pools of reusable short-lived actors, by actor class
+        self._m_actor_pools: Dict[type, ActorPool] = {}
+
+        # Batched movement of every MoveComponent
+        self._m_movement_system: MovementSystem = MovementSystem()
+        # Systems ticked before actors (component pools join as created)
+        self._m_systems: SystemRegistry = SystemRegistry()
+        self._m_systems.register(self._m_movement_system, 10)
+        # Key bindings, and actions dispatched to subscribed listeners
+        self._m_input_system: InputSystem = InputSystem()
+        for action, scancode in KEY_BINDINGS:
+            self._m_input_system.bind(action, scancode)
 
         # All sprites drawn
-        self._m_sprites = []
+        # [Draw order -> sprites, plus sorted draw orders to walk them in]
+        self._m_sprite_layers: Dict[int, Dict[SpriteComponent, None]] = {}
+        self._m_draw_orders: List[int] = []
+        # Only sprites overlapping the view are drawn (view is 1024x768)
+        self._m_view_culler: ViewCuller = ViewCuller(512.0, 384.0)
 
         # Sprite shader
         self._m_sprite_shader: Shader = None
+        # Linked programs kept between launches
+        self._m_shader_cache: ShaderCache = ShaderCache()
+        # Skips redundant binds/enables while drawing
+        self._m_gl_state: GLState = GLState()
+        # Instanced sprite shader (world transform per instance)
+        self._m_instanced_shader: Shader = None
+        self._m_instanced_rendering: bool = True
+        # CPU-side instance data (20 floats per sprite, grows as needed)
+        self._m_instance_data: ctypes.Array = (ctypes.c_float * 0)()
+        self._m_draw_calls: int = 0
         # Sprite mesh (represented by vertex array)
         self._m_sprite_vertices: VertexArray = None
 
         self._m_updating_actors: bool = False
         self._m_running: bool = True
-        self._m_time_then: ctypes.c_uint32 = ctypes.c_uint32()
+        self._m_time_then: int = 0
+
+        # Fixed-timestep simulation (ticks/sec)
+        self._m_tick_rate: int = tick_rate
+        self._m_tick_dt: float = 1.0 / tick_rate
+        # Unsimulated time carried over to next frame
+        self._m_accumulator: float = 0.0
+        # Catch-up limit per frame (avoids spiral of death)
+        self._m_max_ticks_per_frame: int = 5
+        # How far render is between previous and current tick [0, 1)
+        self._m_alpha: float = 0.0
+
+        # Per-frame timing spans (off unless enabled)
+        self._m_tracer: Tracer = Tracer()
+
+        # Random seed (with per-frame keys/times, determines a session)
+        self._m_seed: int = seed
+        # This game's own generator (games share no random state)
+        self._m_random: Random = Random(seed)
+        # Writes inputs to a replay log (None: not recording)
+        self._m_recorder: InputRecorder = None
 
         # Game-specific objects (refs and lists)
         self._m_ship: Ship = None
-        self._m_asteroids = []
+        self._m_asteroids: Dict[Asteroid, None] = {}
+        # Broadphase grid of asteroid circles (rebuilt every tick)
+        self._m_asteroid_grid: SpatialHash = SpatialHash()
 
     def initialize(self) -> bool:
+        # Pre-decoded assets/shaders, if a bundle was built (else loose files)
+        self._m_bundle.open(DEFAULT_BUNDLE)
+
+        if self._m_headless:
+            return self._initialize_headless()
+
+        # Initialize SDL image library
+        if sdlimage.IMG_Init(sdlimage.IMG_INIT_PNG) == 0:
+            sdl2.SDL_Log(b"Image initialization failed: ", sdl2.SDL_GetError())
+            return False
+
+        # Decode images on worker threads while window/context/shaders are created
+        self._m_preloader.start(name for name in self._get_atlas_file_names()
+                                if not self._m_bundle.has_fresh(name))
+
         # Initialize SDL library
         result = sdl2.SDL_Init(sdl2.SDL_INIT_VIDEO | sdl2.SDL_INIT_AUDIO)
         if result != 0:
@@ -86,6 +191,8 @@ class Game:
 
         # Third, create context for OpenGL (Contains color buff., textures, models, etc.)
         self._m_context = sdl2.SDL_GL_CreateContext(self._m_window)
+        # Sync swaps to display refresh (replaces fixed SDL_Delay)
+        sdl2.SDL_GL_SetSwapInterval(1)
 
         # Fourth, load shaders
         if not self._load_shaders():
@@ -95,33 +202,80 @@ class Game:
         # Fifth, create quad mesh for drawing
         self._create_sprite_vertices()
 
-        # Initialize SDL image library
-        if sdlimage.IMG_Init(sdlimage.IMG_INIT_PNG) == 0:
-            sdl2.SDL_Log(b"Image initialization failed: ", sdl2.SDL_GetError())
-            return False
-
-        # Initiate random generator class
-        Random.init(4)
+        # Restart random sequence
+        self._m_random.init(self._m_seed)
 
         self._load_data()
 
+        # Loading bound shaders/buffers/textures directly
+        self._m_gl_state.invalidate()
+
         # Initial time
-        self._m_time_then = sdl2.SDL_GetTicks()
+        self._m_time_then = sdl2.SDL_GetPerformanceCounter()
+
+        return True
+
+    def _initialize_headless(self) -> bool:
+        # Same actors as windowed mode, but without SDL video or OpenGL
+        self._m_random.init(self._m_seed)
+
+        self._load_data()
 
         return True
 
     def run_loop(self) -> None:
+        tracer: Tracer = self._m_tracer
         while self._m_running:
-            self._process_input()
-            self._process_update()
-            self._process_output()
+            tracer.begin_frame()
+            with tracer.span("Game._process_input"):
+                self._process_input()
+            with tracer.span("Game._process_update"):
+                self._process_update()
+            with tracer.span("Game._process_output"):
+                self._process_output()
+            tracer.end_frame()
+
+    # Step simulation as fast as possible (no sleep, no render)
+    # [One tick per frame, tick length defaults to 1 / tick rate]
+    def run_frames(self, num_frames: int, delta_time: float = None) -> None:
+        if delta_time is None:
+            delta_time = self._m_tick_dt
+
+        # All keys released
+        keyb_state: ctypes.Array = (ctypes.c_uint8 * sdl2.SDL_NUM_SCANCODES)()
+
+        tracer: Tracer = self._m_tracer
+        for _ in range(num_frames):
+            if not self._m_running:
+                break
+            tracer.begin_frame()
+            with tracer.span("Game._process_input"):
+                self._input_actors(keyb_state)
+            with tracer.span("Game._process_update"):
+                self._update_actors(delta_time)
+            tracer.end_frame()
+
+    # One frame from given keys and frame time (as recorded; no SDL input)
+    def step_frame(self, keyb_state: ctypes.Array, frame_time: float) -> None:
+        if self._m_recorder is not None:
+            self._m_recorder.record_keys(keyb_state)
+        self._input_actors(keyb_state)
+        self._step_fixed(frame_time)
+        if self._m_recorder is not None:
+            self._m_recorder.record_frame(self, frame_time)
 
     def shutdown(self) -> None:
         # Shutdown in reverse
+        if self._m_recorder is not None:
+            self._m_recorder.close()
         self._unload_data()
+        if self._m_headless:
+            return
         self._m_sprite_vertices.delete()
         self._m_sprite_shader.unload()
         del self._m_sprite_shader
+        self._m_instanced_shader.unload()
+        del self._m_instanced_shader
         sdlimage.IMG_Quit()
         sdl2.SDL_GL_DeleteContext(self._m_context)
         sdl2.SDL_DestroyWindow(self._m_window)
@@ -141,72 +295,172 @@ class Game:
         if keyb_state[sdl2.SDL_SCANCODE_ESCAPE]:
             self._m_running = False
         # Check states-queue for Actors
+        if self._m_recorder is not None:
+            self._m_recorder.record_keys(keyb_state)
+        self._input_actors(keyb_state)
+
+    # Only bound keys are read, only subscribers are called
+    def _input_actors(self, keyb_state: ctypes.Array) -> None:
         self._m_updating_actors = True
-        for actor in self._m_actors:
-            actor.input(keyb_state)
+        self._m_input_system.process(keyb_state)
         self._m_updating_actors = False
 
     def _process_update(self) -> None:
-        # Wait 16ms (frame limiting)
-        sdl2.SDL_Delay(16)
-
-        time_now: ctypes.c_uint32 = sdl2.SDL_GetTicks()
-        delta_time: float = (time_now - self._m_time_then) / 1000.0
-        # Clamp max delta time (for debugging)
-        if delta_time > 0.05:
-            delta_time = 0.05
+        time_now: int = sdl2.SDL_GetPerformanceCounter()
+        frame_time: float = (time_now - self._m_time_then) / \
+            sdl2.SDL_GetPerformanceFrequency()
         # Time now is time then
-        self._m_time_then: ctypes.c_uint32 = sdl2.SDL_GetTicks()
+        self._m_time_then = time_now
+
+        self._step_fixed(frame_time)
+        if self._m_recorder is not None:
+            self._m_recorder.record_frame(self, frame_time)
+
+    # Run as many fixed ticks as frame time allows, keep the remainder
+    def _step_fixed(self, frame_time: float) -> None:
+        self._m_accumulator += frame_time
+
+        ticks = 0
+        while self._m_accumulator >= self._m_tick_dt:
+            if ticks == self._m_max_ticks_per_frame:
+                # Too far behind: drop backlog instead of catching up forever
+                self._m_accumulator %= self._m_tick_dt
+                break
+            self._update_actors(self._m_tick_dt)
+            self._m_accumulator -= self._m_tick_dt
+            ticks += 1
+
+        self._m_alpha = self._m_accumulator / self._m_tick_dt
+
+    def _update_actors(self, delta_time: float) -> None:
+        tracer: Tracer = self._m_tracer
+
+        # Move all bodies at once, then other systems (before actors react)
+        self._m_systems.update(delta_time, tracer)
+        with tracer.span("SpatialHash.rebuild", "system"):
+            self._m_asteroid_grid.rebuild()
 
         # Update actors
         self._m_updating_actors = True
-        for actor in self._m_actors:
-            actor.update(delta_time)
+        if tracer.is_enabled():
+            for actor in self._m_actors:
+                with tracer.span(type(actor).__name__ + ".update", "actor"):
+                    actor.update(delta_time)
+        else:
+            for actor in self._m_actors:
+                actor.update(delta_time)
         self._m_updating_actors = False
 
         # Add pending actors
         for pending_actor in self._m_pending_actors:
+            pending_actor.snap_previous_transform()
             pending_actor.compute_world_transform()
-            self._m_actors.append(pending_actor)
+            self._m_actors.add(pending_actor)
         self._m_pending_actors.clear()
 
-        # Collect dead actors
-        dead_actors = []
-        for dead_actor in self._m_actors:
-            if dead_actor.get_state() == State.eDEAD:
-                dead_actors.append(dead_actor)
-
-        # Remove dead actors from self._m_actors
-        for da in dead_actors:
-            da.delete()
+        # Remove actors that died (queued, no scan over all actors)
+        while self._m_dead_actors:
+            dead_actor, _ = self._m_dead_actors.popitem()
+            pool: ActorPool = dead_actor.get_pool()
+            if pool is not None:
+                pool.release(dead_actor)
+            else:
+                dead_actor.delete()
 
     def _process_output(self) -> None:
+        state: GLState = self._m_gl_state
+        state.begin_frame()
+
         # Clear color-buffer to gray
-        GL.glClearColor(0.86, 0.86, 0.86, 1.0)
+        state.set_clear_color(0.86, 0.86, 0.86, 1.0)
         GL.glClear(GL.GL_COLOR_BUFFER_BIT)
 
         # Enable alpha blending on color buffer
-        GL.glEnable(GL.GL_BLEND)
-        GL.glBlendFunc(
+        state.set_blend(True)
+        state.set_blend_func(
             GL.GL_SRC_ALPHA,
             GL.GL_ONE_MINUS_SRC_ALPHA)
 
-        # First, set shader and vertex array active 'every frame'
-        self._m_sprite_shader.set_active()
-        self._m_sprite_vertices.set_active()
+        # Visible sprites of each draw order
+        with self._m_tracer.span("ViewCuller.cull", "render"):
+            visible: List[List[SpriteComponent]] = self._m_view_culler.cull(
+                self._m_sprite_layers, self._m_draw_orders)
+
+        # Draw sprites
+        if self._m_instanced_rendering:
+            self._draw_sprites_instanced(visible)
+        else:
+            # First, set shader and vertex array active 'every frame'
+            self._m_sprite_shader.set_active(state)
+            self._m_sprite_vertices.set_active(state)
 
-        # Second, draw sprites
-        for sprite in self._m_sprites:
-            sprite.draw(self._m_sprite_shader)
+            # Second, draw sprites
+            self._m_draw_calls = 0
+            for sprites in visible:
+                for sprite in sprites:
+                    sprite.draw(self._m_sprite_shader, self._m_alpha)
+                    self._m_draw_calls += 1
 
         # Swap color-buffer to display on screen
         sdl2.SDL_GL_SwapWindow(self._m_window)
 
         return True
 
+    # One instanced draw per texture within each draw order
+    def _draw_sprites_instanced(self, visible: List[List[SpriteComponent]]) -> None:
+        self._m_instanced_shader.set_active(self._m_gl_state)
+        self._m_sprite_vertices.set_active(self._m_gl_state)
+        self._m_draw_calls = 0
+
+        # Batch each draw order by texture
+        for sprites in visible:
+            batch: dict = {}
+            for sprite in sprites:
+                # Atlas regions on one page share a batch
+                texture: Texture = sprite.get_texture().get_page()
+                same_texture = batch.get(texture)
+                if same_texture is None:
+                    batch[texture] = [sprite]
+                else:
+                    same_texture.append(sprite)
+            self._draw_batches(batch)
+
+    def _draw_batches(self, batch: dict) -> None:
+        matrix_size: int = ctypes.sizeof(ctypes.c_float) * 16
+        instance_size: int = ctypes.sizeof(ctypes.c_float) * 20
+        for texture, sprites in batch.items():
+            num_instances: int = len(sprites)
+            if len(self._m_instance_data) < num_instances * 20:
+                self._m_instance_data = (
+                    ctypes.c_float * (num_instances * 40))()
+
+            # Copy each world matrix + texture rect into instance data
+            data: ctypes.Array = self._m_instance_data
+            base: int = ctypes.addressof(data)
+            for i, sprite in enumerate(sprites):
+                ctypes.memmove(base + i * instance_size,
+                               sprite.compute_world_matrix(self._m_alpha).m_mat,
+                               matrix_size)
+                rect_start: int = i * 20 + 16
+                data[rect_start:rect_start + 4] = sprite.get_texture().get_uv_rect()
+            with self._m_tracer.span("VertexArray.set_instance_data", "render"):
+                self._m_sprite_vertices.set_instance_data(
+                    self._m_instance_data, num_instances, self._m_gl_state)
+
+            texture.set_active(self._m_gl_state)
+            with self._m_tracer.span("glDrawElementsInstanced", "render"):
+                GL.glDrawElementsInstanced(
+                    GL.GL_TRIANGLES,     # Type of shape to draw
+                    6,                   # Indices in index buffer
+                    GL.GL_UNSIGNED_INT,  # Type of index
+                    None,
+                    num_instances)
+            self._m_draw_calls += 1
+
     def _load_shaders(self) -> bool:
         self._m_sprite_shader = Shader()
-        if not self._m_sprite_shader.load("shaders/sprite.vert", "shaders/sprite.frag"):
+        if not self._m_sprite_shader.load("shaders/sprite.vert", "shaders/sprite.frag",
+                                          self._m_bundle, cache=self._m_shader_cache):
             return False
         self._m_sprite_shader.set_active()
 
@@ -214,6 +468,14 @@ class Game:
         view_proj: Matrix4 = Matrix4.create_simple_view_proj(1024.0, 768.0)
         self._m_sprite_shader.set_matrix_uniform("uViewProj", view_proj)
 
+        self._m_instanced_shader = Shader()
+        if not self._m_instanced_shader.load("shaders/sprite.vert", "shaders/sprite.frag",
+                                             self._m_bundle, {"INSTANCED": 1},
+                                             self._m_shader_cache):
+            return False
+        self._m_instanced_shader.set_active()
+        self._m_instanced_shader.set_matrix_uniform("uViewProj", view_proj)
+
         return True
 
     def _create_sprite_vertices(self) -> None:
@@ -233,8 +495,15 @@ class Game:
         # Vertices describing a quad (AKA quad mesh used for all sprites!)
         self._m_sprite_vertices = VertexArray(
             vertices, 4, indices, 6)
+        # Per instance: world transform at locations 2-5, texture rect at 6
+        self._m_sprite_vertices.add_instance_buffer(2, [4, 4, 4, 4, 4])
 
     def _load_data(self) -> None:
+        # Lay out all images first, so sprites only reference atlas regions
+        # [Regions are placeholders until pixels are uploaded below]
+        page_class: type = StubTexture if self._m_headless else Texture
+        self._m_atlas.layout(self._get_atlas_file_names(), page_class, self._m_bundle)
+
         # Ship and its components (composed in constructor)
         self._m_ship = Ship(self)
         self._m_ship.set_rotation(maths.PI_OVER_TWO)
@@ -245,23 +514,55 @@ class Game:
         for i in num_asteroids:
             Asteroid(self)
 
+        # Decoded images (ready by now, mostly) go to GL on this thread
+        if not self._m_atlas.upload(self._m_preloader):
+            sdl2.SDL_Log(b"Failed to load some atlas images")
+        self._m_preloader.shutdown()
+
+    def _get_atlas_file_names(self) -> List[str]:
+        # Loose images plus bundled ones (bundle may ship without loose files)
+        names = set(name for name in self._m_bundle.get_names()
+                    if name.startswith("assets/") and name.lower().endswith(".png"))
+        if os.path.isdir("assets"):
+            names.update("assets/" + name for name in os.listdir("assets")
+                         if name.lower().endswith(".png"))
+        return sorted(names)
+
     def _unload_data(self) -> None:
         while len(self._m_actors) != 0:
-            actor = self._m_actors.pop()
+            actor = self._m_actors.get_actors()[-1]
+            actor.delete()
+        for actor in list(self._m_pending_actors):
             actor.delete()
+        self._m_dead_actors.clear()
+        for pool in self._m_actor_pools.values():
+            pool.clear()
+        self._m_actor_pools.clear()
         for texture in self._m_textures.values():
             texture.unload()
             texture.delete()
         self._m_textures.clear()
+        self._m_atlas.unload()
+        self._m_bundle.close()
 
     def get_texture(self, file_name: str) -> Texture:
+        # Packed images come from the atlas
+        region: AtlasRegion = self._m_atlas.get_region(file_name)
+        if region is not None:
+            return region
+
         # Search for texture in dic first
         texture: Texture = self._m_textures.get(file_name)
         if texture != None:
             return texture
         else:
-            texture = Texture()
-            if texture.load(file_name):
+            texture = StubTexture() if self._m_headless else Texture()
+            if self._m_bundle.has_fresh(file_name):
+                # Already decoded: no file read
+                width, height = self._m_bundle.get_image_size(file_name)
+                texture.load_pixels(width, height, self._m_bundle.get_pixels(file_name))
+                self._m_textures[file_name] = texture
+            elif texture.load(file_name):
                 # Add texture to dic
                 self._m_textures[file_name] = texture
             else:
@@ -271,36 +572,135 @@ class Game:
 
     def add_actor(self, actor: Actor) -> None:
         if self._m_updating_actors:
-            self._m_pending_actors.append(actor)
+            self._m_pending_actors[actor] = None
         else:
-            self._m_actors.append(actor)
+            self._m_actors.add(actor)
 
     def remove_actor(self, actor: Actor) -> None:
-        # Check in pending-actors list
+        # Check in pending-actors set, then in actors registry
         if actor in self._m_pending_actors:
-            self._m_pending_actors.remove(actor)
-        # Check in actors list
-        if actor in self._m_actors:
+            del self._m_pending_actors[actor]
+        else:
             self._m_actors.remove(actor)
+        # Removed with its parent before its own turn in the dead queue
+        self._m_dead_actors.pop(actor, None)
+
+    # Called by Actor.set_state() when actor becomes dead
+    def queue_dead_actor(self, actor: Actor) -> None:
+        self._m_dead_actors[actor] = None
+
+    # Pool for an actor class (created on first use)
+    def get_actor_pool(self, actor_class: type) -> ActorPool:
+        pool: ActorPool = self._m_actor_pools.get(actor_class)
+        if pool is None:
+            pool = self._m_actor_pools[actor_class] = ActorPool(
+                self, actor_class)
+        return pool
+
+    # Actor for handle, or None if it no longer exists
+    def get_actor(self, handle: ActorHandle) -> Actor:
+        return self._m_actors.get(handle)
 
     def add_sprite(self, sprite: SpriteComponent) -> None:
-        # Add based on draw order
-        index = 0
-        for i, c in enumerate(self._m_sprites):
-            index = i
-            if sprite.get_draw_order() < c.get_draw_order():
-                break
-        self._m_sprites.insert(index, sprite)
+        # Add to layer of its draw order (new draw orders kept sorted)
+        draw_order: int = sprite.get_draw_order()
+        layer = self._m_sprite_layers.get(draw_order)
+        if layer is None:
+            layer = self._m_sprite_layers[draw_order] = {}
+            bisect.insort(self._m_draw_orders, draw_order)
+        layer[sprite] = None
 
     def remove_sprite(self, sprite: SpriteComponent) -> None:
-        self._m_sprites.remove(sprite)
+        layer = self._m_sprite_layers.get(sprite.get_draw_order())
+        if layer is not None:
+            layer.pop(sprite, None)
+
+    # All sprites, in draw order
+    def get_sprites(self) -> Iterator[SpriteComponent]:
+        for draw_order in self._m_draw_orders:
+            yield from self._m_sprite_layers[draw_order]
 
     # Game-specific (add/remove asteroid)
     def add_asteroid(self, asteroid: Asteroid) -> None:
-        self._m_asteroids.append(asteroid)
+        self._m_asteroids[asteroid] = None
+        self._m_asteroid_grid.insert(asteroid.get_circle())
 
     def remove_asteroid(self, asteroid: Asteroid) -> None:
-        self._m_asteroids.remove(asteroid)
+        if asteroid in self._m_asteroids:
+            del self._m_asteroids[asteroid]
+            self._m_asteroid_grid.remove(asteroid.get_circle())
+
+    def get_asteroids(self) -> Collection[Asteroid]:
+        return self._m_asteroids.keys()
+
+    def get_asteroid_grid(self) -> SpatialHash:
+        return self._m_asteroid_grid
+
+    def set_instanced_rendering(self, instanced: bool) -> None:
+        self._m_instanced_rendering = instanced
+
+    # Draw calls issued last frame
+    def get_draw_call_count(self) -> int:
+        return self._m_draw_calls
+
+    def get_input_system(self) -> InputSystem:
+        return self._m_input_system
+
+    def get_view_culler(self) -> ViewCuller:
+        return self._m_view_culler
+
+    # CRC of every actor's type, state, position and rotation (for replays)
+    def compute_state_checksum(self) -> int:
+        checksum: int = zlib.crc32(struct.pack("<II", len(self._m_actors), len(self._m_asteroids)))
+        for actor in self._m_actors:
+            position: Vector2D = actor.get_position()
+            checksum = zlib.crc32(type(actor).__name__.encode(), checksum)
+            checksum = zlib.crc32(_ACTOR_STATE.pack(
+                actor.get_state().value, position.x, position.y, actor.get_rotation()), checksum)
+        return checksum
+
+    # Starts recording inputs (call after initialize)
+    def set_recorder(self, recorder: InputRecorder) -> None:
+        self._m_recorder = recorder
+        if recorder is not None:
+            recorder.begin(self)
+
+    def get_recorder(self) -> InputRecorder:
+        return self._m_recorder
+
+    def get_seed(self) -> int:
+        return self._m_seed
+
+    def get_random(self) -> Random:
+        return self._m_random
+
+    def get_gl_state(self) -> GLState:
+        return self._m_gl_state
+
+    def get_tracer(self) -> Tracer:
+        return self._m_tracer
+
+    def get_movement_system(self) -> MovementSystem:
+        return self._m_movement_system
+
+    def get_system_registry(self) -> SystemRegistry:
+        return self._m_systems
+
+    def get_actors(self) -> List[Actor]:
+        return self._m_actors.get_actors()
+
+    def is_headless(self) -> bool:
+        return self._m_headless
+
+    def get_tick_rate(self) -> int:
+        return self._m_tick_rate
+
+    def set_tick_rate(self, tick_rate: int) -> None:
+        self._m_tick_rate = tick_rate
+        self._m_tick_dt = 1.0 / tick_rate
+
+    def get_max_ticks_per_frame(self) -> int:
+        return self._m_max_ticks_per_frame
 
-    def get_asteroids(self) -> List[Asteroid]:
-        return self._m_asteroids
+    def set_max_ticks_per_frame(self, max_ticks: int) -> None:
+        self._m_max_ticks_per_frame = max_ticks
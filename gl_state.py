@@ -0,0 +1,123 @@
+from __future__ import annotations
+import OpenGL.GL as GL
+from typing import Dict, Tuple  # For hinting
+
+
+class GLState:
+    """
+    CACHE OF CURRENT GL CONTEXT STATE
+
+    Binds/enables go through here and are skipped when the requested state
+    is already current (each PyOpenGL call costs Python overhead even when
+    the driver does nothing). Code that changes state behind the cache's
+    back must call invalidate().
+    """
+
+    def __init__(self) -> None:
+        # None: unknown (next set always issues the call)
+        self._m_program: int = None
+        self._m_vertex_array: int = None
+        self._m_array_buffer: int = None
+        self._m_active_unit: int = None
+        # Texture unit -> bound 2D texture
+        self._m_textures: Dict[int, int] = {}
+        self._m_blend: bool = None
+        self._m_blend_func: Tuple[int, int] = None
+        self._m_clear_color: Tuple[float, float, float, float] = None
+
+        # Calls issued/avoided this frame, and since creation
+        self._m_issued: int = 0
+        self._m_avoided: int = 0
+        self._m_total_issued: int = 0
+        self._m_total_avoided: int = 0
+
+    # Forget everything (after GL calls that bypassed this cache)
+    def invalidate(self) -> None:
+        self._m_program = None
+        self._m_vertex_array = None
+        self._m_array_buffer = None
+        self._m_active_unit = None
+        self._m_textures.clear()
+        self._m_blend = None
+        self._m_blend_func = None
+        self._m_clear_color = None
+
+    def begin_frame(self) -> None:
+        self._m_total_issued += self._m_issued
+        self._m_total_avoided += self._m_avoided
+        self._m_issued = 0
+        self._m_avoided = 0
+
+    def use_program(self, program: int) -> None:
+        if program == self._m_program:
+            self._m_avoided += 1
+            return
+        self._m_program = program
+        self._m_issued += 1
+        GL.glUseProgram(program)
+
+    def bind_vertex_array(self, vertex_array: int) -> None:
+        if vertex_array == self._m_vertex_array:
+            self._m_avoided += 1
+            return
+        self._m_vertex_array = vertex_array
+        self._m_issued += 1
+        GL.glBindVertexArray(vertex_array)
+
+    def bind_array_buffer(self, buffer: int) -> None:
+        if buffer == self._m_array_buffer:
+            self._m_avoided += 1
+            return
+        self._m_array_buffer = buffer
+        self._m_issued += 1
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, buffer)
+
+    def bind_texture(self, texture: int, unit: int = 0) -> None:
+        if self._m_textures.get(unit) == texture:
+            self._m_avoided += 1
+            return
+        if unit != self._m_active_unit:
+            self._m_active_unit = unit
+            self._m_issued += 1
+            GL.glActiveTexture(GL.GL_TEXTURE0 + unit)
+        self._m_textures[unit] = texture
+        self._m_issued += 1
+        GL.glBindTexture(GL.GL_TEXTURE_2D, texture)
+
+    def set_blend(self, enabled: bool) -> None:
+        if enabled == self._m_blend:
+            self._m_avoided += 1
+            return
+        self._m_blend = enabled
+        self._m_issued += 1
+        if enabled:
+            GL.glEnable(GL.GL_BLEND)
+        else:
+            GL.glDisable(GL.GL_BLEND)
+
+    def set_blend_func(self, source: int, destination: int) -> None:
+        func: Tuple[int, int] = (source, destination)
+        if func == self._m_blend_func:
+            self._m_avoided += 1
+            return
+        self._m_blend_func = func
+        self._m_issued += 1
+        GL.glBlendFunc(source, destination)
+
+    def set_clear_color(self, r: float, g: float, b: float, a: float) -> None:
+        color: Tuple[float, float, float, float] = (r, g, b, a)
+        if color == self._m_clear_color:
+            self._m_avoided += 1
+            return
+        self._m_clear_color = color
+        self._m_issued += 1
+        GL.glClearColor(r, g, b, a)
+
+    # (issued, avoided) since begin_frame()
+    def get_frame_stats(self) -> Tuple[int, int]:
+        return (self._m_issued, self._m_avoided)
+
+    # (issued, avoided) since creation
+    def get_total_stats(self) -> Tuple[int, int]:
+        return (self._m_total_issued + self._m_issued,
+                self._m_total_avoided + self._m_avoided)
@@ -1,11 +1,10 @@
 from __future__ import annotations
 from move_component import MoveComponent
 from maths import Vector2D
-import ctypes
 
 
 class InputMoveComponent(MoveComponent):
-    """ CONTROLS MOVEMENT BASED ON KEYS """
+    """ CONTROLS MOVEMENT BASED ON ACTIONS (KEYS ARE BOUND BY GAME) """
 
     def __init__(self, owner: Actor) -> None:
         super().__init__(owner)
@@ -14,35 +13,71 @@ class InputMoveComponent(MoveComponent):
         self._m_forward_speed: float = 0.0
         self._m_max_rotation_speed: float = None
 
-        # Keys for forward/rotation movements
-        self._m_forward_key: int = 0
-        self._m_back_key: int = 0
-        self._m_clockwise_key: int = 0
-        self._m_counter_clockwise_key: int = 0
+        # Actions for forward/rotation movements (see Game's key bindings)
+        self._m_input: InputSystem = owner.get_game().get_input_system()
+        self._m_forward_action: str = "forward"
+        self._m_back_action: str = "back"
+        self._m_clockwise_action: str = "clockwise"
+        self._m_counter_clockwise_action: str = "counter_clockwise"
+        self._subscribe()
+
+        # Scratch vector for forces (reused every frame)
+        self._m_force: Vector2D = Vector2D()
+
+    def delete(self) -> None:
+        super().delete()
+        self._m_input.unsubscribe_all(self)
+
+    def on_deactivate(self) -> None:
+        super().on_deactivate()
+        self._m_input.unsubscribe_all(self)
+
+    def on_activate(self) -> None:
+        super().on_activate()
+        self._subscribe()
+
+    # Implements
+    def on_action(self, action: str, pressed: bool) -> None:
+        # Texture follows forward/back keys (back wins while both are down)
+        if action == self._m_forward_action or action == self._m_back_action:
+            if pressed:
+                self._m_owner.change_texture_to(
+                    "forward" if action == self._m_forward_action else "backward")
+            elif self._m_input.is_held(self._m_back_action):
+                self._m_owner.change_texture_to("backward")
+            elif self._m_input.is_held(self._m_forward_action):
+                self._m_owner.change_texture_to("forward")
+
+        # Rotation speed only changes when a rotation key does
+        elif action == self._m_clockwise_action or action == self._m_counter_clockwise_action:
+            rotation_speed = 0.0
+            if self._m_input.is_held(self._m_clockwise_action):
+                rotation_speed -= self._m_max_rotation_speed
+            if self._m_input.is_held(self._m_counter_clockwise_action):
+                rotation_speed += self._m_max_rotation_speed
+            self.set_rotation_speed(rotation_speed)
 
     # Implements
-    def input(self, keyb_state: ctypes.Array) -> None:
-        # Control MoveComponent based on keys:
-        # Forward/back movement
-        if keyb_state[self._m_forward_key]:
-            self.add_force(self._m_owner.get_forward()
-                           * self._m_forward_speed)
-            # Forward texture
-            self._m_owner.change_texture_to("forward")
-        if keyb_state[self._m_back_key]:
-            self.add_force(self._m_owner.get_forward()
-                           * -self._m_forward_speed)
-
-            # Backward texture
-            self._m_owner.change_texture_to("backward")
-
-        # Rotation movement
-        rotation_speed = 0.0
-        if keyb_state[self._m_clockwise_key]:
-            rotation_speed -= self._m_max_rotation_speed
-        if keyb_state[self._m_counter_clockwise_key]:
-            rotation_speed += self._m_max_rotation_speed
-        self.set_rotation_speed(rotation_speed)
+    def on_action_held(self, action: str) -> None:
+        # Forward/back force while key is down
+        if action == self._m_forward_action:
+            self._m_owner.get_forward(self._m_force)
+            self._m_force *= self._m_forward_speed
+            self.add_force(self._m_force)
+        elif action == self._m_back_action:
+            self._m_owner.get_forward(self._m_force)
+            self._m_force *= -self._m_forward_speed
+            self.add_force(self._m_force)
+
+    def _subscribe(self) -> None:
+        for action in (self._m_forward_action, self._m_back_action,
+                       self._m_clockwise_action, self._m_counter_clockwise_action):
+            self._m_input.subscribe(action, self, self._m_owner)
+
+    # Switch one action to another name (e.g. a second player's bindings)
+    def _resubscribe(self, old_action: str, new_action: str) -> None:
+        self._m_input.unsubscribe(old_action, self)
+        self._m_input.subscribe(new_action, self, self._m_owner)
 
     def get_forward_speed(self) -> float:
         return self._m_forward_speed
@@ -50,17 +85,17 @@ class InputMoveComponent(MoveComponent):
     def get_max_rotation_speed(self) -> float:
         return self._m_max_rotation_speed
 
-    def get_forward_key(self) -> int:
-        return self._m_forward_key
+    def get_forward_action(self) -> str:
+        return self._m_forward_action
 
-    def get_back_key(self) -> int:
-        return self._m_back_key
+    def get_back_action(self) -> str:
+        return self._m_back_action
 
-    def get_clockwise_key(self) -> int:
-        return self._m_clockwise_key
+    def get_clockwise_action(self) -> str:
+        return self._m_clockwise_action
 
-    def get_counter_clockwise_key(self) -> int:
-        return self._m_counter_clockwise_key
+    def get_counter_clockwise_action(self) -> str:
+        return self._m_counter_clockwise_action
 
     def set_forward_speed(self, speed: float) -> None:
         self._m_forward_speed = speed
@@ -68,14 +103,19 @@ class InputMoveComponent(MoveComponent):
     def set_max_rotation_speed(self, speed: float) -> None:
         self._m_max_rotation_speed = speed
 
-    def set_forward_key(self, key: int) -> None:
-        self._m_forward_key = key
+    # Listen to other actions (keys stay bound by Game)
+    def set_forward_action(self, action: str) -> None:
+        self._resubscribe(self._m_forward_action, action)
+        self._m_forward_action = action
 
-    def set_back_key(self, key: int) -> None:
-        self._m_back_key = key
+    def set_back_action(self, action: str) -> None:
+        self._resubscribe(self._m_back_action, action)
+        self._m_back_action = action
 
-    def set_clockwise_key(self, key: int) -> None:
-        self._m_clockwise_key = key
+    def set_clockwise_action(self, action: str) -> None:
+        self._resubscribe(self._m_clockwise_action, action)
+        self._m_clockwise_action = action
 
-    def set_counter_clockwise_key(self, key: int) -> None:
-        self._m_counter_clockwise_key = key
+    def set_counter_clockwise_action(self, action: str) -> None:
+        self._resubscribe(self._m_counter_clockwise_action, action)
+        self._m_counter_clockwise_action = action
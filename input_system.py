@@ -0,0 +1,118 @@
+from __future__ import annotations
+from typing import Dict, List   # For hinting
+import ctypes
+
+from actor import State
+
+
+class InputSystem:
+    """
+    MAPS SCANCODES TO NAMED ACTIONS AND DISPATCHES THEM
+
+    Each frame only bound scancodes are read. Listeners (components or
+    actors) subscribe to actions and get on_action() when an action is
+    pressed or released, and on_action_held() every frame it stays down.
+    An action is down while any of its keys is. Nothing is polled for
+    actors without subscriptions.
+
+    Bindings are game config; listeners only subscribe. Presses and held
+    frames reach a listener only while its owner actor is alive. A press
+    the listener missed (owner paused, or subscribed while the action was
+    already down) is sent before its next held frame, and a release goes
+    to every listener that got the press.
+    """
+
+    def __init__(self) -> None:
+        # Scancode -> action, and action -> its scancodes
+        self._m_bindings: Dict[int, str] = {}
+        self._m_action_keys: Dict[str, List[int]] = {}
+        # Action -> listener -> owner actor (ordered by subscription)
+        self._m_listeners: Dict[str, Dict[object, Actor]] = {}
+        # Actions currently down
+        self._m_held: Dict[str, None] = {}
+        # Action -> listeners sent its press (owed a release)
+        self._m_pressed: Dict[str, Dict[object, None]] = {}
+
+    def bind(self, action: str, scancode: int) -> None:
+        old_action: str = self._m_bindings.get(scancode)
+        if old_action is not None:
+            self._m_action_keys[old_action].remove(scancode)
+        self._m_bindings[scancode] = action
+        self._m_action_keys.setdefault(action, []).append(scancode)
+
+    # Action loses all its keys (listeners get a release if it was down)
+    def unbind(self, action: str) -> None:
+        for scancode in self._m_action_keys.pop(action, ()):
+            del self._m_bindings[scancode]
+        if action in self._m_held:
+            self._set_held(action, False)
+
+    # Replaces action's keys with given one
+    def rebind(self, action: str, scancode: int) -> None:
+        self.unbind(action)
+        self.bind(action, scancode)
+
+    def get_keys(self, action: str) -> List[int]:
+        return self._m_action_keys.get(action, [])
+
+    # Owner: actor whose state gates delivery (listener itself if an actor)
+    def subscribe(self, action: str, listener, owner: Actor) -> None:
+        self._m_listeners.setdefault(action, {})[listener] = owner
+
+    def unsubscribe(self, action: str, listener) -> None:
+        listeners: Dict[object, Actor] = self._m_listeners.get(action)
+        if listeners is not None:
+            listeners.pop(listener, None)
+        pressed: Dict[object, None] = self._m_pressed.get(action)
+        if pressed is not None:
+            pressed.pop(listener, None)
+
+    def unsubscribe_all(self, listener) -> None:
+        for listeners in self._m_listeners.values():
+            listeners.pop(listener, None)
+        for pressed in self._m_pressed.values():
+            pressed.pop(listener, None)
+
+    def is_held(self, action: str) -> bool:
+        return action in self._m_held
+
+    # Edge events for actions whose keys changed, then held events
+    def process(self, keyb_state: ctypes.Array) -> None:
+        held: Dict[str, None] = self._m_held
+        for action, scancodes in self._m_action_keys.items():
+            down: bool = False
+            for scancode in scancodes:
+                if keyb_state[scancode]:
+                    down = True
+                    break
+            if down != (action in held):
+                self._set_held(action, down)
+
+        # In binding order [Copy: listeners may (un)bind while handling]
+        alive: State = State.eALIVE
+        for action in list(self._m_action_keys):
+            listeners: Dict[object, Actor] = self._m_listeners.get(action)
+            if listeners and action in held:
+                pressed: Dict[object, None] = self._m_pressed.setdefault(action, {})
+                for listener, owner in list(listeners.items()):
+                    if owner.get_state() == alive:
+                        # Press missed while paused or before subscribing
+                        if listener not in pressed:
+                            pressed[listener] = None
+                            listener.on_action(action, True)
+                        listener.on_action_held(action)
+
+    def _set_held(self, action: str, down: bool) -> None:
+        if down:
+            self._m_held[action] = None
+            listeners: Dict[object, Actor] = self._m_listeners.get(action)
+            if listeners:
+                pressed: Dict[object, None] = self._m_pressed.setdefault(action, {})
+                for listener, owner in list(listeners.items()):
+                    if owner.get_state() == State.eALIVE:
+                        pressed[listener] = None
+                        listener.on_action(action, True)
+        else:
+            del self._m_held[action]
+            for listener in list(self._m_pressed.pop(action, ())):
+                listener.on_action(action, False)
@@ -21,6 +21,10 @@ class Laser(Actor):
         self._m_circle = CircleComponent(self)
         self._m_circle.set_radius(11.0)
 
+    # Implements (laser reused from pool)
+    def reset_actor(self) -> None:
+        self._m_death_timer = 1.0
+
     # Implements
     def update_actor(self, dt: float) -> None:
         # Laser is dead after x time
@@ -28,12 +32,15 @@ class Laser(Actor):
         if self._m_death_timer <= 0.0:
             self.set_state(State.eDEAD)
         else:
-            # Check for intersection
-            for ast in self.get_game().get_asteroids():
-                if self._m_circle.intersect(self._m_circle, ast.get_circle()):
+            # Check for intersection (only asteroids in nearby grid cells)
+            center: Vector2D = self._m_circle.get_center()
+            candidates = self.get_game().get_asteroid_grid().query(
+                center.x, center.y, self._m_circle.get_radius())
+            for circle in candidates:
+                if self._m_circle.intersect(self._m_circle, circle):
                     # Both actors are dead
                     self.set_state(State.eDEAD)
-                    ast.set_state(State.eDEAD)
+                    circle.get_owner().set_state(State.eDEAD)
                     break
 
     def apply_force(self, force: Vector2D) -> None:
@@ -1,10 +1,55 @@
 from game import Game
+from replay import InputRecorder, InputReplayer
+import argparse
+import time
 
 
 def main():
-    game = Game()
+    parser = argparse.ArgumentParser(description="Spaceship Shooter 3D")
+    parser.add_argument("--headless", action="store_true",
+                        help="simulate without a window or OpenGL context")
+    parser.add_argument("--frames", type=int, default=1000,
+                        help="frames to simulate in headless mode")
+    parser.add_argument("--tick-rate", type=int, default=60,
+                        help="fixed simulation ticks per second")
+    parser.add_argument("--trace", metavar="FILE",
+                        help="record timing spans, write Chrome trace JSON to FILE")
+    parser.add_argument("--record", metavar="FILE",
+                        help="record seed, keys and frame times of a windowed session")
+    parser.add_argument("--replay", metavar="FILE",
+                        help="replay a recorded session headlessly and verify it")
+    args = parser.parse_args()
+
+    replayer = None
+    if args.replay:
+        replayer = InputReplayer(args.replay)
+        game = Game(headless=True, tick_rate=replayer.get_tick_rate(),
+                    seed=replayer.get_seed())
+    else:
+        game = Game(headless=args.headless, tick_rate=args.tick_rate)
+    if args.trace:
+        game.get_tracer().set_enabled(True)
     if game.initialize():
-        game.run_loop()
+        if replayer is not None:
+            result = replayer.run(game)
+            print("Replayed {} frames in {:.3f}s ({:.0f} frames/s)".format(
+                result.frames, result.elapsed, result.get_frames_per_sec()))
+            if result.is_diverged():
+                print("Diverged at frame {} (checksum {:08x}, expected {:08x})".format(
+                    result.diverged_frame, result.actual_checksum, result.expected_checksum))
+        elif args.headless:
+            start = time.perf_counter()
+            game.run_frames(args.frames)
+            elapsed = time.perf_counter() - start
+            print("Simulated {} frames in {:.3f}s ({:.0f} frames/s)".format(
+                args.frames, elapsed, args.frames / elapsed if elapsed > 0 else 0.0))
+        else:
+            if args.record:
+                game.set_recorder(InputRecorder(args.record))
+            game.run_loop()
+        if args.trace:
+            game.get_tracer().export_chrome_trace(args.trace)
+            print(game.get_tracer().format_summary())
     game.shutdown()
 
 
@@ -62,7 +62,13 @@ def atan2(y: float, x: float) -> float:
 ### Math classes ###
 
 
+# Scalars accepted by vector operators
+_SCALAR_TYPES = (int, float)
+
+
 class Vector2D:
+    __slots__ = ("x", "y")
+
     def __init__(self, x: float = 0.0, y: float = 0.0) -> None:
         self.x: float = x
         self.y: float = y
@@ -71,6 +77,10 @@ class Vector2D:
         self.x = x
         self.y = y
 
+    def copy_from(self, other: Vector2D) -> Vector2D:
+        self.set(other.x, other.y)
+        return self
+
     def __add__(self, other: Vector2D) -> Vector2D:
         return Vector2D(self.x + other.x, self.y + other.y)
 
@@ -78,14 +88,46 @@ class Vector2D:
         return Vector2D(self.x - other.x, self.y - other.y)
 
     def __mul__(self, other: Vector2D) -> Vector2D:
-        if isinstance(other, Vector2D):
+        if isinstance(other, _SCALAR_TYPES):
+            # Vector and scalar
+            return Vector2D(self.x * other, self.y * other)
+        elif isinstance(other, Vector2D):
             # Two vectors
             return Vector2D(self.x * other.x, self.y * other.y)
-        elif isinstance(other, float):
-            # Vector and scalar
+        else:
+            return NotImplemented
+
+    # Scalar on the left (e.g. 2.0 * v)
+    def __rmul__(self, other: float) -> Vector2D:
+        if isinstance(other, _SCALAR_TYPES):
             return Vector2D(self.x * other, self.y * other)
+        return NotImplemented
+
+    def __neg__(self) -> Vector2D:
+        return Vector2D(-self.x, -self.y)
+
+    # In-place operators (no new vector)
+    def __iadd__(self, other: Vector2D) -> Vector2D:
+        self.set(self.x + other.x, self.y + other.y)
+        return self
+
+    def __isub__(self, other: Vector2D) -> Vector2D:
+        self.set(self.x - other.x, self.y - other.y)
+        return self
+
+    def __imul__(self, other: Vector2D) -> Vector2D:
+        if isinstance(other, _SCALAR_TYPES):
+            self.set(self.x * other, self.y * other)
+        elif isinstance(other, Vector2D):
+            self.set(self.x * other.x, self.y * other.y)
         else:
-            raise NotImplementedError()
+            return NotImplemented
+        return self
+
+    # Fused multiply-add in place: self += other * scale
+    def add_scaled(self, other: Vector2D, scale: float) -> Vector2D:
+        self.set(self.x + other.x * scale, self.y + other.y * scale)
+        return self
 
     # Alternative to length()
     def length_sq(self) -> float:
@@ -128,6 +170,8 @@ class Vector2D:
 
 
 class Vector3D:
+    __slots__ = ("x", "y", "z")
+
     def __init__(self, x: float = 0.0, y: float = 0.0, z: float = 0.0) -> None:
         self.x: float = x
         self.y: float = y
@@ -138,6 +182,10 @@ class Vector3D:
         self.y = y
         self.z = z
 
+    def copy_from(self, other: Vector3D) -> Vector3D:
+        self.set(other.x, other.y, other.z)
+        return self
+
     # Addition
     def __add__(self, other: Vector3D) -> Vector3D:
         return Vector3D(self.x + other.x, self.y + other.y, self.z + other.z)
@@ -148,14 +196,47 @@ class Vector3D:
 
     # Component-wise multiplication
     def __mul__(self, other: Vector3D) -> Vector3D:
-        if isinstance(other, Vector3D):
+        if isinstance(other, _SCALAR_TYPES):
+            # Vector and scalar
+            return Vector3D(self.x * other, self.y * other, self.z * other)
+        elif isinstance(other, Vector3D):
             # Two vectors
             return Vector3D(self.x * other.x, self.y * other.y, self.z * other.z)
-        elif isinstance(other, float):
-            # Vector and scalar
+        else:
+            return NotImplemented
+
+    # Scalar on the left (e.g. 2.0 * v)
+    def __rmul__(self, other: float) -> Vector3D:
+        if isinstance(other, _SCALAR_TYPES):
             return Vector3D(self.x * other, self.y * other, self.z * other)
+        return NotImplemented
+
+    def __neg__(self) -> Vector3D:
+        return Vector3D(-self.x, -self.y, -self.z)
+
+    # In-place operators (no new vector)
+    def __iadd__(self, other: Vector3D) -> Vector3D:
+        self.set(self.x + other.x, self.y + other.y, self.z + other.z)
+        return self
+
+    def __isub__(self, other: Vector3D) -> Vector3D:
+        self.set(self.x - other.x, self.y - other.y, self.z - other.z)
+        return self
+
+    def __imul__(self, other: Vector3D) -> Vector3D:
+        if isinstance(other, _SCALAR_TYPES):
+            self.set(self.x * other, self.y * other, self.z * other)
+        elif isinstance(other, Vector3D):
+            self.set(self.x * other.x, self.y * other.y, self.z * other.z)
         else:
-            raise NotImplementedError()
+            return NotImplemented
+        return self
+
+    # Fused multiply-add in place: self += other * scale
+    def add_scaled(self, other: Vector3D, scale: float) -> Vector3D:
+        self.set(self.x + other.x * scale, self.y + other.y * scale,
+                 self.z + other.z * scale)
+        return self
 
     # Alternative to length()
     def length_sq(self) -> float:
@@ -202,13 +283,10 @@ class Vector3D:
     @staticmethod
     def transform(vec: Vector3D, mat: Matrix4, w: float = 1.0) -> Vector3D:
         ret_val: Vector3D = Vector3D()
-        ret_val.x = vec.x * mat.mat[0][0] + \
-            vec.y * mat.mat[1][0] + vec.z * mat.mat[2][0] + w * mat.mat[3][0]
-        ret_val.y = vec.x * mat.mat[0][1] + \
-            vec.y * mat.mat[1][1] + vec.z * mat.mat[2][1] + w * mat.mat[3][1]
-        ret_val.z = vec.x * \
-            mat.mat[0][2] + vec.y * mat.mat[1][2] + \
-            vec.z * mat.mat[2][2] + w * mat.mat[3][2]
+        m = mat.m_mat
+        ret_val.x = vec.x * m[0] + vec.y * m[4] + vec.z * m[8] + w * m[12]
+        ret_val.y = vec.x * m[1] + vec.y * m[5] + vec.z * m[9] + w * m[13]
+        ret_val.z = vec.x * m[2] + vec.y * m[6] + vec.z * m[10] + w * m[14]
         # Ignore w since we are not returning a new value for it
         return ret_val
 
@@ -228,116 +306,104 @@ class Vector3D:
 # 4x4 Matrix
 # [No need to define 3x3 Matrix because OpenGL vertex layout]
 # [uses 4D vectors for everthing]
+# [Stored row-major in one contiguous float32 C array: element (row, col)]
+# [is m_mat[row * 4 + col]. Passes to glUniformMatrix4fv without a copy.]
 class Matrix4:
-    def __init__(self) -> None:
-        # C array storing matrix data
-        CArray = ((ctypes.c_float * 4) * 4)
-        self.m_mat = CArray()
-
-        # Initialize array to identity matrix
-        self.m_mat[0][0] = 1.0
-        self.m_mat[0][1] = 0.0
-        self.m_mat[0][2] = 0.0
-        self.m_mat[0][3] = 0.0
-
-        self.m_mat[1][0] = 0.0
-        self.m_mat[1][1] = 1.0
-        self.m_mat[1][2] = 0.0
-        self.m_mat[1][3] = 0.0
-
-        self.m_mat[2][0] = 0.0
-        self.m_mat[2][1] = 0.0
-        self.m_mat[2][2] = 1.0
-        self.m_mat[2][3] = 0.0
-
-        self.m_mat[3][0] = 0.0
-        self.m_mat[3][1] = 0.0
-        self.m_mat[3][2] = 0.0
-        self.m_mat[3][3] = 1.0
-
-    # Matrix multiplication
-    def __mul__(self, other: Matrix4) -> Matrix4:
-        ret_val: Matrix4 = Matrix4()
-
-        # Row 0
-        ret_val.m_mat[0][0] = self.m_mat[0][0] * other.m_mat[0][0] + self.m_mat[0][1] * \
-            other.m_mat[1][0] + self.m_mat[0][2] * \
-            other.m_mat[2][0] + self.m_mat[0][3] * other.m_mat[3][0]
-
-        ret_val.m_mat[0][1] = self.m_mat[0][0] * other.m_mat[0][1] + self.m_mat[0][1] * \
-            other.m_mat[1][1] + self.m_mat[0][2] * \
-            other.m_mat[2][1] + self.m_mat[0][3] * other.m_mat[3][1]
-
-        ret_val.m_mat[0][2] = self.m_mat[0][0] * other.m_mat[0][2] + self.m_mat[0][1] * \
-            other.m_mat[1][2] + self.m_mat[0][2] * \
-            other.m_mat[2][2] + self.m_mat[0][3] * other.m_mat[3][2]
-
-        ret_val.m_mat[0][3] = self.m_mat[0][0] * other.m_mat[0][3] + self.m_mat[0][1] * \
-            other.m_mat[1][3] + self.m_mat[0][2] * \
-            other.m_mat[2][3] + self.m_mat[0][3] * other.m_mat[3][3]
-
-        # Row 1
-        ret_val.m_mat[1][0] = self.m_mat[1][0] * other.m_mat[0][0] + self.m_mat[1][1] * \
-            other.m_mat[1][0] + self.m_mat[1][2] * \
-            other.m_mat[2][0] + self.m_mat[1][3] * other.m_mat[3][0]
+    __slots__ = ("m_mat", "m_bytes")
 
-        ret_val.m_mat[1][1] = self.m_mat[1][0] * other.m_mat[0][1] + self.m_mat[1][1] * \
-            other.m_mat[1][1] + self.m_mat[1][2] * \
-            other.m_mat[2][1] + self.m_mat[1][3] * other.m_mat[3][1]
-
-        ret_val.m_mat[1][2] = self.m_mat[1][0] * other.m_mat[0][2] + self.m_mat[1][1] * \
-            other.m_mat[1][2] + self.m_mat[1][2] * \
-            other.m_mat[2][2] + self.m_mat[1][3] * other.m_mat[3][2]
-
-        ret_val.m_mat[1][3] = self.m_mat[1][0] * other.m_mat[0][3] + self.m_mat[1][1] * \
-            other.m_mat[1][3] + self.m_mat[1][2] * \
-            other.m_mat[2][3] + self.m_mat[1][3] * other.m_mat[3][3]
-
-        # Row 2
-        ret_val.m_mat[2][0] = self.m_mat[2][0] * other.m_mat[0][0] + self.m_mat[2][1] * \
-            other.m_mat[1][0] + self.m_mat[2][2] * \
-            other.m_mat[2][0] + self.m_mat[2][3] * other.m_mat[3][0]
-
-        ret_val.m_mat[2][1] = self.m_mat[2][0] * other.m_mat[0][1] + self.m_mat[2][1] * \
-            other.m_mat[1][1] + self.m_mat[2][2] * \
-            other.m_mat[2][1] + self.m_mat[2][3] * other.m_mat[3][1]
+    def __init__(self) -> None:
+        # C array storing matrix data, initialized to identity matrix
+        self.m_mat = _Float16(*_IDENTITY)
+        # Byte view of m_mat (compare/copy values without allocating)
+        self.m_bytes = memoryview(self.m_mat).cast("B")
 
-        ret_val.m_mat[2][2] = self.m_mat[2][0] * other.m_mat[0][2] + self.m_mat[2][1] * \
-            other.m_mat[1][2] + self.m_mat[2][2] * \
-            other.m_mat[2][2] + self.m_mat[2][3] * other.m_mat[3][2]
+    def get(self, row: int, col: int) -> float:
+        return self.m_mat[row * 4 + col]
 
-        ret_val.m_mat[2][3] = self.m_mat[2][0] * other.m_mat[0][3] + self.m_mat[2][1] * \
-            other.m_mat[1][3] + self.m_mat[2][2] * \
-            other.m_mat[2][3] + self.m_mat[2][3] * other.m_mat[3][3]
+    def set(self, row: int, col: int, value: float) -> None:
+        self.m_mat[row * 4 + col] = value
 
-        # Row 3
-        ret_val.m_mat[3][0] = self.m_mat[3][0] * other.m_mat[0][0] + self.m_mat[3][1] * \
-            other.m_mat[1][0] + self.m_mat[3][2] * \
-            other.m_mat[2][0] + self.m_mat[3][3] * other.m_mat[3][0]
+    def set_identity(self) -> Matrix4:
+        self.m_mat[:] = _IDENTITY
+        return self
 
-        ret_val.m_mat[3][1] = self.m_mat[3][0] * other.m_mat[0][1] + self.m_mat[3][1] * \
-            other.m_mat[1][1] + self.m_mat[3][2] * \
-            other.m_mat[2][1] + self.m_mat[3][3] * other.m_mat[3][1]
+    def copy_from(self, other: Matrix4) -> Matrix4:
+        ctypes.memmove(self.m_mat, other.m_mat, _MATRIX_BYTES)
+        return self
 
-        ret_val.m_mat[3][2] = self.m_mat[3][0] * other.m_mat[0][2] + self.m_mat[3][1] * \
-            other.m_mat[1][2] + self.m_mat[3][2] * \
-            other.m_mat[2][2] + self.m_mat[3][3] * other.m_mat[3][2]
+    # Matrix multiplication (new matrix)
+    def __mul__(self, other: Matrix4) -> Matrix4:
+        return Matrix4.multiply(self, other, Matrix4())
 
-        ret_val.m_mat[3][3] = self.m_mat[3][0] * other.m_mat[0][3] + self.m_mat[3][1] * \
-            other.m_mat[1][3] + self.m_mat[3][2] * \
-            other.m_mat[2][3] + self.m_mat[3][3] * other.m_mat[3][3]
+    # Matrix multiplication (in place: self = self * other)
+    def __imul__(self, other: Matrix4) -> Matrix4:
+        return Matrix4.multiply(self, other, self)
 
-        return ret_val
+    # out = a * b [out may be a or b, inputs are read first]
+    @staticmethod
+    def multiply(a: Matrix4, b: Matrix4, out: Matrix4) -> Matrix4:
+        (a00, a01, a02, a03,
+         a10, a11, a12, a13,
+         a20, a21, a22, a23,
+         a30, a31, a32, a33) = a.m_mat
+        (b00, b01, b02, b03,
+         b10, b11, b12, b13,
+         b20, b21, b22, b23,
+         b30, b31, b32, b33) = b.m_mat
+
+        out.m_mat[:] = (
+            # Row 0
+            a00 * b00 + a01 * b10 + a02 * b20 + a03 * b30,
+            a00 * b01 + a01 * b11 + a02 * b21 + a03 * b31,
+            a00 * b02 + a01 * b12 + a02 * b22 + a03 * b32,
+            a00 * b03 + a01 * b13 + a02 * b23 + a03 * b33,
+            # Row 1
+            a10 * b00 + a11 * b10 + a12 * b20 + a13 * b30,
+            a10 * b01 + a11 * b11 + a12 * b21 + a13 * b31,
+            a10 * b02 + a11 * b12 + a12 * b22 + a13 * b32,
+            a10 * b03 + a11 * b13 + a12 * b23 + a13 * b33,
+            # Row 2
+            a20 * b00 + a21 * b10 + a22 * b20 + a23 * b30,
+            a20 * b01 + a21 * b11 + a22 * b21 + a23 * b31,
+            a20 * b02 + a21 * b12 + a22 * b22 + a23 * b32,
+            a20 * b03 + a21 * b13 + a22 * b23 + a23 * b33,
+            # Row 3
+            a30 * b00 + a31 * b10 + a32 * b20 + a33 * b30,
+            a30 * b01 + a31 * b11 + a32 * b21 + a33 * b31,
+            a30 * b02 + a31 * b12 + a32 * b22 + a33 * b32,
+            a30 * b03 + a31 * b13 + a32 * b23 + a33 * b33)
+
+        return out
+
+    # Scale, then rotate about z, then translate, in one step
+    # [Same as scale * rotation_z * translation, without the temporaries]
+    def set_scale_rotation_translation(self, xscale: float, yscale: float, zscale: float,
+                                       theta: float, x: float, y: float, z: float) -> Matrix4:
+        c: float = math.cos(theta)
+        s: float = math.sin(theta)
+
+        self.m_mat[:] = (
+            xscale * c, xscale * s, 0.0, 0.0,
+            -yscale * s, yscale * c, 0.0, 0.0,
+            0.0, 0.0, zscale, 0.0,
+            x, y, z, 1.0)
+
+        return self
+
+    # New scale-rotation-translation matrix (see set_scale_rotation_translation)
+    @staticmethod
+    def create_scale_rotation_translation(xscale: float, yscale: float, zscale: float,
+                                          theta: float, x: float, y: float, z: float) -> Matrix4:
+        return Matrix4().set_scale_rotation_translation(xscale, yscale, zscale, theta, x, y, z)
 
     # Create a scale matrix with x, y, and z scales
     @staticmethod
     def create_scale_matrix_xyz(xscale: float, yscale: float, zscale: float) -> Matrix4:
         temp: Matrix4 = Matrix4()
 
-        temp.m_mat[0][0] = xscale
-        temp.m_mat[1][1] = yscale
-        temp.m_mat[2][2] = zscale
-        temp.m_mat[3][3] = 1.0
+        temp.m_mat[0] = xscale
+        temp.m_mat[5] = yscale
+        temp.m_mat[10] = zscale
 
         return temp
 
@@ -354,12 +420,10 @@ class Matrix4:
     def create_rotation_matrix_z(theta: float) -> Matrix4:
         temp: Matrix4 = Matrix4()
 
-        temp.m_mat[0][0] = cos(theta)
-        temp.m_mat[0][1] = sin(theta)
-        temp.m_mat[1][0] = -sin(theta)
-        temp.m_mat[1][1] = cos(theta)
-        temp.m_mat[2][2] = 1.0
-        temp.m_mat[3][3] = 1.0
+        temp.m_mat[0] = cos(theta)
+        temp.m_mat[1] = sin(theta)
+        temp.m_mat[4] = -sin(theta)
+        temp.m_mat[5] = cos(theta)
 
         return temp
 
@@ -368,13 +432,9 @@ class Matrix4:
     def create_translation_matrix(trans: Vector3D) -> Matrix4:
         temp: Matrix4 = Matrix4()
 
-        temp.m_mat[0][0] = 1.0
-        temp.m_mat[1][1] = 1.0
-        temp.m_mat[2][2] = 1.0
-        temp.m_mat[3][0] = trans.x
-        temp.m_mat[3][1] = trans.y
-        temp.m_mat[3][2] = trans.z
-        temp.m_mat[3][3] = 1.0
+        temp.m_mat[12] = trans.x
+        temp.m_mat[13] = trans.y
+        temp.m_mat[14] = trans.z
 
         return temp
 
@@ -383,12 +443,19 @@ class Matrix4:
     def create_simple_view_proj(width: float, height: float) -> Matrix4:
         temp: Matrix4 = Matrix4()
 
-        temp.m_mat[0][0] = 2.0 / width
-        temp.m_mat[1][1] = 2.0 / height
-        temp.m_mat[2][2] = 1.0
-        temp.m_mat[3][2] = 1.0
-        temp.m_mat[3][3] = 1.0
+        temp.m_mat[0] = 2.0 / width
+        temp.m_mat[5] = 2.0 / height
+        temp.m_mat[14] = 1.0
 
         return temp
 
     # TODO, add additional matrix4 operations
+
+
+# Matrix4 storage helpers
+_Float16 = ctypes.c_float * 16
+_MATRIX_BYTES: int = ctypes.sizeof(_Float16)
+_IDENTITY = (1.0, 0.0, 0.0, 0.0,
+             0.0, 1.0, 0.0, 0.0,
+             0.0, 0.0, 1.0, 0.0,
+             0.0, 0.0, 0.0, 1.0)
@@ -0,0 +1,274 @@
+from __future__ import annotations
+from typing import List         # For hinting
+import numpy as np
+from maths import Vector2D
+
+
+class BodyVector2D(Vector2D):
+    """
+    Vector2D whose x/y live in a row of a MovementSystem (N, 2) array.
+    Reads/writes go straight to the array, so no copy is ever made.
+    """
+    __slots__ = ("_m_array", "_m_index")
+
+    def __init__(self, array: np.ndarray, index: int) -> None:
+        self._m_array: np.ndarray = array
+        self._m_index: int = index
+
+    # Point view at a new array/row (after growth or swap-and-pop)
+    def rebind(self, array: np.ndarray, index: int) -> None:
+        self._m_array = array
+        self._m_index = index
+
+    @property
+    def x(self) -> float:
+        return float(self._m_array[self._m_index, 0])
+
+    @x.setter
+    def x(self, value: float) -> None:
+        self._m_array[self._m_index, 0] = value
+
+    @property
+    def y(self) -> float:
+        return float(self._m_array[self._m_index, 1])
+
+    @y.setter
+    def y(self, value: float) -> None:
+        self._m_array[self._m_index, 1] = value
+
+    def set(self, x: float, y: float) -> None:
+        row = self._m_array[self._m_index]
+        row[0] = x
+        row[1] = y
+
+
+class Body:
+    """
+    Handle to one moving actor's row in MovementSystem.
+    Index changes when other bodies are removed, so never cache it.
+    """
+
+    def __init__(self, system: MovementSystem, index: int) -> None:
+        self._m_system: MovementSystem = system
+        self._m_index: int = index
+
+        # Views (kept valid by system on growth/removal)
+        self._m_position = BodyVector2D(system._m_positions, index)
+        self._m_prev_position = BodyVector2D(system._m_prev_positions, index)
+        self._m_velocity = BodyVector2D(system._m_velocities, index)
+
+    def _rebind(self, index: int) -> None:
+        system: MovementSystem = self._m_system
+        self._m_index = index
+        self._m_position.rebind(system._m_positions, index)
+        self._m_prev_position.rebind(system._m_prev_positions, index)
+        self._m_velocity.rebind(system._m_velocities, index)
+
+    def get_index(self) -> int:
+        return self._m_index
+
+    def get_position(self) -> BodyVector2D:
+        return self._m_position
+
+    def get_prev_position(self) -> BodyVector2D:
+        return self._m_prev_position
+
+    def get_velocity(self) -> BodyVector2D:
+        return self._m_velocity
+
+    def get_rotation(self) -> float:
+        return float(self._m_system._m_rotations[self._m_index])
+
+    def set_rotation(self, rotation: float) -> None:
+        self._m_system._m_rotations[self._m_index] = rotation
+
+    def get_prev_rotation(self) -> float:
+        return float(self._m_system._m_prev_rotations[self._m_index])
+
+    def get_rotation_speed(self) -> float:
+        return float(self._m_system._m_rotation_speeds[self._m_index])
+
+    def set_rotation_speed(self, speed: float) -> None:
+        self._m_system._m_rotation_speeds[self._m_index] = speed
+
+    def get_mass(self) -> float:
+        return 1.0 / float(self._m_system._m_inv_masses[self._m_index])
+
+    def set_mass(self, mass: float) -> None:
+        self._m_system._m_inv_masses[self._m_index] = 1.0 / mass
+
+    def add_force(self, x: float, y: float) -> None:
+        row = self._m_system._m_forces[self._m_index]
+        row[0] += x
+        row[1] += y
+
+    # At rest: no velocity, no pending forces
+    def reset_motion(self) -> None:
+        system: MovementSystem = self._m_system
+        system._m_velocities[self._m_index] = 0.0
+        system._m_forces[self._m_index] = 0.0
+
+    def set_active(self, active: bool) -> None:
+        self._m_system._m_active[self._m_index] = active
+
+    # Previous tick transform = current (e.g. after spawn/teleport)
+    def snap_previous(self) -> None:
+        system: MovementSystem = self._m_system
+        system._m_prev_positions[self._m_index] = system._m_positions[self._m_index]
+        system._m_prev_rotations[self._m_index] = system._m_rotations[self._m_index]
+
+
+class MovementSystem:
+    """
+    BATCHED MOVEMENT FOR ALL MOVE COMPONENTS
+
+    Position, velocity, force, mass and rotation of every body are kept in
+    contiguous NumPy arrays (dense, swap-and-pop on removal), so one tick
+    is a handful of array operations instead of per-object Vector2D math.
+    """
+
+    def __init__(self, capacity: int = 64, half_width: float = 550.0, half_height: float = 450.0) -> None:
+        # Screen wrapping bounds
+        self._m_half_width: float = half_width
+        self._m_half_height: float = half_height
+
+        self._m_count: int = 0
+        self._m_capacity: int = 0
+        self._m_bodies: List[Body] = []
+        # Owner actor of each body (same order as arrays)
+        self._m_owners: List[Actor] = []
+
+        self._m_positions: np.ndarray = None
+        self._m_prev_positions: np.ndarray = None
+        self._m_velocities: np.ndarray = None
+        self._m_forces: np.ndarray = None
+        self._m_inv_masses: np.ndarray = None
+        self._m_rotations: np.ndarray = None
+        self._m_prev_rotations: np.ndarray = None
+        self._m_rotation_speeds: np.ndarray = None
+        self._m_active: np.ndarray = None
+        self._grow(max(capacity, 1))
+
+    def add(self, owner: Actor) -> Body:
+        if self._m_count == self._m_capacity:
+            self._grow(self._m_capacity * 2)
+
+        index: int = self._m_count
+        self._m_count += 1
+
+        # Start from owner's current transform, at rest
+        pos: Vector2D = owner.get_position()
+        self._m_positions[index] = (pos.x, pos.y)
+        self._m_prev_positions[index] = (pos.x, pos.y)
+        self._m_velocities[index] = 0.0
+        self._m_forces[index] = 0.0
+        self._m_inv_masses[index] = 1.0
+        self._m_rotations[index] = owner.get_rotation()
+        self._m_prev_rotations[index] = owner.get_rotation()
+        self._m_rotation_speeds[index] = 0.0
+        self._m_active[index] = True
+
+        body = Body(self, index)
+        self._m_bodies.append(body)
+        self._m_owners.append(owner)
+        return body
+
+    def remove(self, body: Body) -> None:
+        index: int = body.get_index()
+        last: int = self._m_count - 1
+
+        # Swap-and-pop: move last row into the hole
+        if index != last:
+            for array in self._arrays():
+                array[index] = array[last]
+            moved: Body = self._m_bodies[last]
+            self._m_bodies[index] = moved
+            self._m_owners[index] = self._m_owners[last]
+            moved._rebind(index)
+        self._m_bodies.pop()
+        self._m_owners.pop()
+        self._m_count = last
+
+    def update(self, dt: float) -> None:
+        n: int = self._m_count
+        if n == 0:
+            return
+
+        pos = self._m_positions[:n]
+        vel = self._m_velocities[:n]
+        forces = self._m_forces[:n]
+        rot = self._m_rotations[:n]
+        rot_speed = self._m_rotation_speeds[:n]
+        active = self._m_active[:n]
+
+        # Start of tick (for render interpolation)
+        self._m_prev_positions[:n] = pos
+        self._m_prev_rotations[:n] = rot
+
+        # Paused/dead bodies get zero time step
+        step = active * dt
+
+        # Simple rotation
+        rot += rot_speed * step
+
+        ## Velocity Verlet Integration: start ##
+        # Compute acceleration (F = m * a), then reset forces of active bodies
+        acceleration = forces * self._m_inv_masses[:n, None]
+        forces[active] = 0.0
+        # Compute delta-v & delta-p (dv=a*dt, dp=v/2*dt)
+        new_vel = vel + acceleration * step[:, None]
+        pos += (vel + new_vel) * (0.5 * step[:, None])
+        vel[:] = new_vel
+        ## Velocity Verlet Integration: end ##
+
+        # Screen wrapping
+        x = pos[:, 0]
+        y = pos[:, 1]
+        x[x < -self._m_half_width] = self._m_half_width
+        x[x > self._m_half_width] = -self._m_half_width
+        y[y < -self._m_half_height] = self._m_half_height
+        y[y > self._m_half_height] = -self._m_half_height
+
+        # Only owners that actually moved need a new world transform
+        moved = active & ((pos != self._m_prev_positions[:n]).any(axis=1)
+                          | (rot != self._m_prev_rotations[:n]))
+        owners: List[Actor] = self._m_owners
+        for index in np.flatnonzero(moved).tolist():
+            owners[index].mark_transform_dirty()
+
+    def get_count(self) -> int:
+        return self._m_count
+
+    # Live (N, 2) positions of all bodies
+    def get_positions(self) -> np.ndarray:
+        return self._m_positions[:self._m_count]
+
+    def _arrays(self) -> List[np.ndarray]:
+        return [self._m_positions, self._m_prev_positions, self._m_velocities,
+                self._m_forces, self._m_inv_masses, self._m_rotations,
+                self._m_prev_rotations, self._m_rotation_speeds, self._m_active]
+
+    def _grow(self, capacity: int) -> None:
+        def resized(array: np.ndarray, shape: tuple, dtype) -> np.ndarray:
+            new_array = np.zeros(shape, dtype=dtype)
+            if array is not None:
+                new_array[:self._m_count] = array[:self._m_count]
+            return new_array
+
+        self._m_positions = resized(self._m_positions, (capacity, 2), np.float64)
+        self._m_prev_positions = resized(
+            self._m_prev_positions, (capacity, 2), np.float64)
+        self._m_velocities = resized(self._m_velocities, (capacity, 2), np.float64)
+        self._m_forces = resized(self._m_forces, (capacity, 2), np.float64)
+        self._m_inv_masses = resized(self._m_inv_masses, (capacity,), np.float64)
+        self._m_rotations = resized(self._m_rotations, (capacity,), np.float64)
+        self._m_prev_rotations = resized(
+            self._m_prev_rotations, (capacity,), np.float64)
+        self._m_rotation_speeds = resized(
+            self._m_rotation_speeds, (capacity,), np.float64)
+        self._m_active = resized(self._m_active, (capacity,), np.bool_)
+        self._m_capacity = capacity
+
+        # Existing views must point at the new arrays
+        for body in self._m_bodies:
+            body._rebind(body.get_index())
@@ -5,31 +5,29 @@ import random
 
 class Random:
     """ 
-    Cannot be instantiated.
-    init() Creates an instance of random.Random class. 
+    Random generator owned by one game (no shared state between games).
     Basically, a wrapper for random.Random members. 
     """
-    _m_random: random.Random = None
 
-    @classmethod
-    def init(cls, seed: int) -> None:
-        cls._m_random = random.Random(seed)
+    def __init__(self, seed: int) -> None:
+        self._m_random: random.Random = random.Random(seed)
 
-    @classmethod
-    def get_float(cls) -> float:
-        return cls._m_random.random()
+    # Restarts sequence
+    def init(self, seed: int) -> None:
+        self._m_random.seed(seed)
 
-    @classmethod
-    def get_float_range(cls, min: float, max: float) -> float:
-        return cls._m_random.uniform(min, max)
+    def get_float(self) -> float:
+        return self._m_random.random()
 
-    @classmethod
-    def get_int_range(cls, min: int, max: int) -> int:
-        return cls._m_random.randint(min, max)
+    def get_float_range(self, min: float, max: float) -> float:
+        return self._m_random.uniform(min, max)
 
-    @classmethod
-    def get_vector(cls, min: Vector2D, max: Vector2D) -> Vector2D:
-        random_vector = Vector2D(cls.get_float(), cls.get_float())
-        return min + (max - min) * random_vector
+    def get_int_range(self, min: int, max: int) -> int:
+        return self._m_random.randint(min, max)
+
+    def get_vector(self, min: Vector2D, max: Vector2D) -> Vector2D:
+        # min + (max - min) * random, without temporary vectors
+        return Vector2D(min.x + (max.x - min.x) * self.get_float(),
+                        min.y + (max.y - min.y) * self.get_float())
 
         # TODO Handle Vector3D also
@@ -0,0 +1,157 @@
+from __future__ import annotations
+from typing import BinaryIO, List, NamedTuple, Tuple     # For hinting
+import ctypes
+import struct
+import time
+import sdl2
+
+# Log layout (little-endian):
+#   header: magic, version, seed, tick rate, checksum interval
+#   frame:  frame time (double), pressed key count (uint8), scancodes
+#           (uint16 each), then state checksum (uint32) on checksum frames
+_MAGIC: bytes = b"AGRP"
+_VERSION: int = 1
+_HEADER = struct.Struct("<4sHIHH")
+_FRAME = struct.Struct("<dB")
+_CHECKSUM = struct.Struct("<I")
+
+
+class ReplayFrame(NamedTuple):
+    frame_time: float
+    pressed_keys: Tuple[int, ...]
+    checksum: int       # None on frames without a checksum
+
+
+class ReplayResult(NamedTuple):
+    frames: int
+    elapsed: float      # Seconds spent replaying
+    diverged_frame: int     # First frame whose checksum differs (-1: none)
+    expected_checksum: int
+    actual_checksum: int
+
+    def is_diverged(self) -> bool:
+        return self.diverged_frame >= 0
+
+    def get_frames_per_sec(self) -> float:
+        return self.frames / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class InputRecorder:
+    """
+    WRITES A GAME'S INPUTS TO A BINARY LOG
+
+    Seed, per-frame time and pressed keys fully determine a session;
+    state checksums are stored alongside so a replay can detect divergence.
+    """
+
+    def __init__(self, file_name: str, checksum_interval: int = 1) -> None:
+        self._m_file: BinaryIO = open(file_name, "wb")
+        self._m_checksum_interval: int = checksum_interval
+        self._m_pressed_keys: List[int] = []
+        self._m_frame_count: int = 0
+
+    # Called once before first frame
+    def begin(self, game: Game) -> None:
+        self._m_file.write(_HEADER.pack(_MAGIC, _VERSION, game.get_seed(),
+                                        game.get_tick_rate(), self._m_checksum_interval))
+
+    # Keys passed to actors this frame
+    def record_keys(self, keyb_state: ctypes.Array) -> None:
+        self._m_pressed_keys = [code for code in range(sdl2.SDL_NUM_SCANCODES)
+                                if keyb_state[code]][:255]
+
+    # Frame time the simulation consumed this frame (after it was stepped)
+    def record_frame(self, game: Game, frame_time: float) -> None:
+        keys = self._m_pressed_keys
+        self._m_file.write(_FRAME.pack(frame_time, len(keys)))
+        if keys:
+            self._m_file.write(struct.pack("<%dH" % len(keys), *keys))
+        if self._m_frame_count % self._m_checksum_interval == 0:
+            self._m_file.write(_CHECKSUM.pack(game.compute_state_checksum()))
+        self._m_frame_count += 1
+
+    def get_frame_count(self) -> int:
+        return self._m_frame_count
+
+    def close(self) -> None:
+        if not self._m_file.closed:
+            self._m_file.close()
+
+
+class InputReplayer:
+    """
+    FEEDS A RECORDED LOG BACK THROUGH A HEADLESS GAME
+
+    Frames run back to back (no rendering, no waiting), through the same
+    Actor.input/fixed-step update as the live game, and each recorded
+    checksum is compared with the replayed state.
+    """
+
+    def __init__(self, file_name: str) -> None:
+        self._m_seed: int = 0
+        self._m_tick_rate: int = 60
+        self._m_frames: List[ReplayFrame] = []
+        self._load(file_name)
+
+    def _load(self, file_name: str) -> None:
+        with open(file_name, "rb") as file_obj:
+            data: bytes = file_obj.read()
+
+        magic, version, self._m_seed, self._m_tick_rate, checksum_interval = \
+            _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("Not a replay log (or unsupported version): " + file_name)
+
+        offset: int = _HEADER.size
+        index: int = 0
+        while offset < len(data):
+            frame_time, key_count = _FRAME.unpack_from(data, offset)
+            offset += _FRAME.size
+            keys: Tuple[int, ...] = struct.unpack_from("<%dH" % key_count, data, offset)
+            offset += 2 * key_count
+            checksum: int = None
+            if index % checksum_interval == 0:
+                checksum = _CHECKSUM.unpack_from(data, offset)[0]
+                offset += _CHECKSUM.size
+            self._m_frames.append(ReplayFrame(frame_time, keys, checksum))
+            index += 1
+
+    # Replays into game (initialized, headless, created with get_seed()/get_tick_rate())
+    # [stop_on_divergence=False keeps going, e.g. to profile a diverged log]
+    def run(self, game: Game, verify: bool = True,
+            stop_on_divergence: bool = True) -> ReplayResult:
+        keyb_state: ctypes.Array = (ctypes.c_uint8 * sdl2.SDL_NUM_SCANCODES)()
+        released: Tuple[int, ...] = ()
+        diverged: Tuple[int, int, int] = (-1, 0, 0)
+
+        start: float = time.perf_counter()
+        frames: int = 0
+        for frame in self._m_frames:
+            # Only touch keys that changed since last frame
+            for code in released:
+                keyb_state[code] = 0
+            for code in frame.pressed_keys:
+                keyb_state[code] = 1
+            released = frame.pressed_keys
+
+            game.step_frame(keyb_state, frame.frame_time)
+            frames += 1
+
+            if verify and frame.checksum is not None and diverged[0] < 0:
+                checksum: int = game.compute_state_checksum()
+                if checksum != frame.checksum:
+                    diverged = (frames - 1, frame.checksum, checksum)
+                    if stop_on_divergence:
+                        break
+        elapsed: float = time.perf_counter() - start
+
+        return ReplayResult(frames, elapsed, *diverged)
+
+    def get_seed(self) -> int:
+        return self._m_seed
+
+    def get_tick_rate(self) -> int:
+        return self._m_tick_rate
+
+    def get_frames(self) -> List[ReplayFrame]:
+        return self._m_frames
@@ -2,6 +2,13 @@ from __future__ import annotations
 import OpenGL.GL as GL
 import sdl2
 import ctypes
+import posixpath
+import re
+from typing import Dict, List, Tuple  # For hinting
+
+# Preprocessor lines handled before GLSL compiler sees the source
+_INCLUDE_LINE = re.compile(r'^[ \t]*#include[ \t]+"([^"]+)"')
+_VERSION_LINE = re.compile(r'^[ \t]*#version[^\n]*\n', re.MULTILINE)
 
 
 class Shader:
@@ -18,26 +25,66 @@ class Shader:
         self._m_frag_shader_id: ctypes.c_uint = ctypes.c_uint()
         self._m_shader_program_id: ctypes.c_uint = ctypes.c_uint()
 
+        # Active uniforms found at link time: name -> (location, GL type)
+        self._m_uniforms: Dict[str, Tuple[int, int]] = {}
+        # Last uploaded value per location (to skip redundant uploads)
+        self._m_uniform_values: Dict[int, object] = {}
+        # Same for matrices: a byte buffer per location, overwritten in place
+        self._m_matrix_values: Dict[int, memoryview] = {}
+        self._m_uploads_issued: int = 0
+        self._m_uploads_skipped: int = 0
+
+        # Source of shader files (None: loose files only)
+        self._m_bundle: AssetBundle = None
+
     def delete(self) -> None:
         # TODO: Perhaps self.unload()? Currently unused
         raise NotImplementedError
 
-    # Load vertex & frag shaders
-    def load(self, vert_name: str, frag_name: str) -> bool:
+    # Load vertex & frag shaders (sources fresh in bundle are not read from disk)
+    # [defines select a variant; cache skips compile/link when it has the program]
+    def load(self, vert_name: str, frag_name: str, bundle: AssetBundle = None,
+             defines: Dict[str, object] = None, cache: ShaderCache = None) -> bool:
+        self._m_bundle = bundle
+
+        # Preprocess both sources (#include, #define)
+        vert_source: bytes = self._load_source(vert_name, defines)
+        frag_source: bytes = self._load_source(frag_name, defines)
+        if vert_source is None or frag_source is None:
+            return False
+
+        # Reuse linked program from an earlier launch
+        key: str = None
+        if cache is not None and cache.is_supported():
+            key = cache.make_key(vert_source, frag_source)
+            self._m_shader_program_id = cache.load_program(key)
+            if self._m_shader_program_id:
+                self._reflect_uniforms()
+                return True
+
         # Compile vertex & pixel shaders
-        if (self._compile_shader(vert_name, GL.GL_VERTEX_SHADER, "vertex") == False
-                or self._compile_shader(frag_name, GL.GL_FRAGMENT_SHADER, "frag") == False):
+        if (self._compile_shader(vert_name, GL.GL_VERTEX_SHADER, "vertex", vert_source) == False
+                or self._compile_shader(frag_name, GL.GL_FRAGMENT_SHADER, "frag", frag_source) == False):
             return False
 
         # Link them together to create a 'shader program'
         self._m_shader_program_id = GL.glCreateProgram()
+        if key is not None:
+            # Ask driver to keep binary retrievable for the cache
+            GL.glProgramParameteri(self._m_shader_program_id,
+                                   GL.GL_PROGRAM_BINARY_RETRIEVABLE_HINT, GL.GL_TRUE)
         GL.glAttachShader(self._m_shader_program_id, self._m_vertex_shader_id)
         GL.glAttachShader(self._m_shader_program_id, self._m_frag_shader_id)
         GL.glLinkProgram(self._m_shader_program_id)
 
         # Verify that program linked
-        if not self._is_valid_program:
+        if not self._is_valid_program():
             return False
+
+        if key is not None:
+            cache.save_program(key, self._m_shader_program_id)
+
+        self._reflect_uniforms()
         return True
 
     def unload(self) -> None:
@@ -46,14 +93,31 @@ class Shader:
         GL.glDeleteShader(self._m_vertex_shader_id)
         GL.glDeleteShader(self._m_frag_shader_id)
 
-    # Sets active shader program
-    def set_active(self) -> None:
-        GL.glUseProgram(self._m_shader_program_id)
+    # Sets active shader program (through state cache if given)
+    def set_active(self, state: GLState = None) -> None:
+        if state is not None:
+            state.use_program(self._m_shader_program_id)
+        else:
+            GL.glUseProgram(self._m_shader_program_id)
 
     def set_matrix_uniform(self, name: str, matrix: Matrix4) -> None:
-        # Find uniform shader variable
-        loc: GL.GLuint = GL.glGetUniformLocation(
-            self._m_shader_program_id, name)
+        # Find uniform shader variable (cached at link time)
+        uniform = self._m_uniforms.get(name)
+        if uniform is None:
+            # Not active in program (unused or optimized out)
+            return
+        loc: int = uniform[0]
+
+        # Skip upload if program already holds this value
+        # [Byte views compared/copied: nothing allocated per call]
+        last: memoryview = self._m_matrix_values.get(loc)
+        if last is None:
+            last = self._m_matrix_values[loc] = memoryview(bytearray(len(matrix.m_bytes)))
+        elif last == matrix.m_bytes:
+            self._m_uploads_skipped += 1
+            return
+        last[:] = matrix.m_bytes
+        self._m_uploads_issued += 1
 
         # Send matrix data to uniform variable
         GL.glUniformMatrix4fv(
@@ -69,57 +133,133 @@ class Shader:
         # GL.glGetUniformfv(self._m_shader_program_id, loc, p)
         # print(list(p[0]))
 
-    # Compile specified shader, [TODO simplify this func.]
-    def _compile_shader(self, file_name: str, shader_type: GL.GLenum, name: str) -> bool:
-        if name == "vertex":
-            # Open file
-            source_file_obj = open(file_name, "r")
-            if source_file_obj:
-                # Read file to byte object
-                source_byte_obj = source_file_obj.read().encode()
-                source_file_obj.close()
-
-                # Create a shader of specific type
-                self._m_vertex_shader_id = GL.glCreateShader(shader_type)
-                # Set a source code for this shader
-                GL.glShaderSource(self._m_vertex_shader_id, source_byte_obj)
-                # Try to compile this shader
-                GL.glCompileShader(self._m_vertex_shader_id)
-
-                if not self._is_compiled(self._m_vertex_shader_id):
-                    sdl2.SDL_Log(b"Failed to compile shader: ", file_name)
-                    return False
-            else:
-                sdl2.SDL_Log(b"Shader file not found: ", file_name)
-                return False
-            return True
+    def set_vector4_uniform(self, name: str, x: float, y: float, z: float, w: float) -> None:
+        uniform = self._m_uniforms.get(name)
+        if uniform is None:
+            return
+        loc: int = uniform[0]
+
+        # Skip upload if program already holds this value
+        value = (x, y, z, w)
+        if self._m_uniform_values.get(loc) == value:
+            self._m_uploads_skipped += 1
+            return
+        self._m_uniform_values[loc] = value
+        self._m_uploads_issued += 1
+
+        GL.glUniform4f(loc, x, y, z, w)
+
+    # Location of an active uniform (-1 if not active)
+    def get_uniform_location(self, name: str) -> int:
+        uniform = self._m_uniforms.get(name)
+        if uniform is None:
+            return -1
+        return uniform[0]
 
+    # Active uniforms: name -> (location, GL type)
+    def get_uniforms(self) -> Dict[str, Tuple[int, int]]:
+        return self._m_uniforms
+
+    # (uploads issued, uploads skipped) since last reset
+    def get_upload_stats(self) -> Tuple[int, int]:
+        return (self._m_uploads_issued, self._m_uploads_skipped)
+
+    def reset_upload_stats(self) -> None:
+        self._m_uploads_issued = 0
+        self._m_uploads_skipped = 0
+
+    # Enumerate active uniforms once, so setters never query GL by name
+    def _reflect_uniforms(self) -> None:
+        self._m_uniforms.clear()
+        self._m_uniform_values.clear()
+        self._m_matrix_values.clear()
+
+        count: int = GL.glGetProgramiv(self._m_shader_program_id,
+                                       GL.GL_ACTIVE_UNIFORMS)
+        for i in range(count):
+            name, size, uniform_type = GL.glGetActiveUniform(
+                self._m_shader_program_id, i)
+            if isinstance(name, bytes):
+                name = name.decode()
+            # Arrays are reported as 'name[0]'
+            if name.endswith("[0]"):
+                name = name[:-3]
+            loc: int = GL.glGetUniformLocation(self._m_shader_program_id, name)
+            self._m_uniforms[name] = (loc, int(uniform_type))
+
+    # Compile specified shader from its (preprocessed) source
+    def _compile_shader(self, file_name: str, shader_type: GL.GLenum, name: str,
+                        source_byte_obj: bytes) -> bool:
+        # Create a shader of specific type
+        shader_id = GL.glCreateShader(shader_type)
+        if name == "vertex":
+            self._m_vertex_shader_id = shader_id
         elif name == "frag":
-            # Open file
-            source_file_obj = open(file_name, "r")
-            if source_file_obj:
-                # Read file to byte object
-                source_byte_obj = source_file_obj.read().encode()
-                source_file_obj.close()
-
-                # Create a shader of specific type
-                self._m_frag_shader_id = GL.glCreateShader(shader_type)
-                # Set a source code for this shader
-                GL.glShaderSource(self._m_frag_shader_id, source_byte_obj)
-                # Try to compile this shader
-                GL.glCompileShader(self._m_frag_shader_id)
-
-                if not self._is_compiled(self._m_frag_shader_id):
-                    sdl2.SDL_Log(b"Failed to compile shader: ", file_name)
-                    return False
-            else:
-                sdl2.SDL_Log(b"Shader file not found: ", file_name)
-                return False
-
-            return True
+            self._m_frag_shader_id = shader_id
         else:
             raise NotImplementedError()
 
+        # Set a source code for this shader
+        GL.glShaderSource(shader_id, source_byte_obj)
+        # Try to compile this shader
+        GL.glCompileShader(shader_id)
+
+        if not self._is_compiled(shader_id):
+            sdl2.SDL_Log(b"Failed to compile shader: ", file_name.encode())
+            return False
+        return True
+
+    # Source with each #include "file" expanded (path relative to including
+    # file) and defines inserted after #version; None if a file is missing
+    def _load_source(self, file_name: str, defines: Dict[str, object] = None) -> bytes:
+        source: str = self._expand_includes(file_name, [])
+        if source is None:
+            return None
+
+        if defines:
+            define_lines: str = "".join("#define {} {}\n".format(name, value)
+                                        for name, value in sorted(defines.items()))
+            # #version must stay the first directive
+            version = _VERSION_LINE.search(source)
+            at: int = version.end() if version else 0
+            source = source[:at] + define_lines + source[at:]
+        return source.encode()
+
+    def _expand_includes(self, file_name: str, include_stack: List[str]) -> str:
+        if file_name in include_stack:
+            sdl2.SDL_Log(b"Shader include cycle: ", file_name.encode())
+            return None
+        source: str = self._read_source(file_name)
+        if source is None:
+            sdl2.SDL_Log(b"Shader file not found: ", file_name.encode())
+            return None
+
+        include_stack.append(file_name)
+        directory: str = posixpath.dirname(file_name)
+        lines: List[str] = []
+        for line in source.splitlines(keepends=True):
+            include = _INCLUDE_LINE.match(line)
+            if include is None:
+                lines.append(line)
+                continue
+            included: str = self._expand_includes(
+                posixpath.normpath(posixpath.join(directory, include.group(1))), include_stack)
+            if included is None:
+                return None
+            lines.append(included if included.endswith("\n") else included + "\n")
+        include_stack.pop()
+        return "".join(lines)
+
+    # Source from bundle if fresh there, else from file (None if missing)
+    def _read_source(self, file_name: str) -> str:
+        if self._m_bundle is not None and self._m_bundle.has_fresh(file_name):
+            return self._m_bundle.get_text(file_name)
+        try:
+            with open(file_name, "r") as source_file_obj:
+                return source_file_obj.read()
+        except OSError:
+            return None
+
     # Test whether shader is compiled
     def _is_compiled(self, shader_id: ctypes.c_uint) -> bool:
         # Query compile status
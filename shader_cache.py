@@ -0,0 +1,139 @@
+from __future__ import annotations
+import OpenGL.GL as GL
+import ctypes
+import hashlib
+import os
+import struct
+import sdl2
+from typing import Tuple  # For hinting
+
+# Cache file: binary format (uint32), then driver's program binary
+_FORMAT = struct.Struct("<I")
+
+
+class ShaderCache:
+    """
+    ON-DISK CACHE OF LINKED SHADER PROGRAMS
+
+    Keyed by a hash of the preprocessed sources plus GL vendor, renderer
+    and version, so a driver update never sees another driver's binary.
+    A binary the driver still rejects is deleted and the caller compiles
+    from source.
+    """
+
+    def __init__(self, directory: str = ".shader_cache") -> None:
+        self._m_directory: str = directory
+        # Driver identity and binary formats, read once a context exists
+        self._m_driver: bytes = None
+        self._m_supported: bool = None
+        self._m_formats: Tuple[int, ...] = None
+
+        self._m_hits: int = 0
+        self._m_misses: int = 0
+        self._m_rejected: int = 0
+
+    # Driver offers at least one binary format (needs current context)
+    def is_supported(self) -> bool:
+        if self._m_supported is None:
+            self._m_supported = GL.glGetIntegerv(GL.GL_NUM_PROGRAM_BINARY_FORMATS) > 0
+        return self._m_supported
+
+    def make_key(self, *sources: bytes) -> str:
+        if self._m_driver is None:
+            self._m_driver = b"\0".join(GL.glGetString(name) or b"" for name in
+                                        (GL.GL_VENDOR, GL.GL_RENDERER, GL.GL_VERSION))
+        digest = hashlib.sha256(self._m_driver)
+        for source in sources:
+            # Length prefix, so (a, bc) and (ab, c) differ
+            digest.update(struct.pack("<Q", len(source)))
+            digest.update(source)
+        return digest.hexdigest()
+
+    # Linked program from cache, or 0 (not cached, or rejected by driver)
+    def load_program(self, key: str) -> int:
+        file_name: str = self._get_file_name(key)
+        try:
+            with open(file_name, "rb") as file_obj:
+                data: bytes = file_obj.read()
+        except OSError:
+            self._m_misses += 1
+            return 0
+        if len(data) <= _FORMAT.size:
+            self._reject(file_name)
+            return 0
+
+        binary_format: int = _FORMAT.unpack_from(data, 0)[0]
+        if binary_format not in self._get_formats():
+            # Written by another driver (or corrupted)
+            self._reject(file_name)
+            return 0
+        binary = (ctypes.c_ubyte * (len(data) - _FORMAT.size)).from_buffer_copy(data, _FORMAT.size)
+
+        program: int = GL.glCreateProgram()
+        try:
+            GL.glProgramBinary(program, binary_format, binary, len(binary))
+        except GL.GLError:
+            GL.glDeleteProgram(program)
+            self._reject(file_name)
+            return 0
+        # Loading a binary sets link status, like glLinkProgram
+        if GL.glGetProgramiv(program, GL.GL_LINK_STATUS) != GL.GL_TRUE:
+            GL.glDeleteProgram(program)
+            self._reject(file_name)
+            return 0
+
+        self._m_hits += 1
+        return program
+
+    # Call after linking a program created with the retrievable hint set
+    def save_program(self, key: str, program: int) -> bool:
+        length: int = GL.glGetProgramiv(program, GL.GL_PROGRAM_BINARY_LENGTH)
+        if length <= 0:
+            return False
+        binary = (ctypes.c_ubyte * length)()
+        written = GL.GLsizei(0)
+        binary_format = GL.GLenum(0)
+        GL.glGetProgramBinary(program, length, ctypes.byref(written),
+                              ctypes.byref(binary_format), binary)
+
+        try:
+            os.makedirs(self._m_directory, exist_ok=True)
+            # Write aside then rename (other processes may be reading)
+            file_name: str = self._get_file_name(key)
+            temp_name: str = "{}.{}.tmp".format(file_name, os.getpid())
+            with open(temp_name, "wb") as file_obj:
+                file_obj.write(_FORMAT.pack(binary_format.value))
+                file_obj.write(bytes(binary)[:written.value])
+            os.replace(temp_name, file_name)
+        except OSError:
+            sdl2.SDL_Log(b"Could not write shader cache: ", self._m_directory.encode())
+            return False
+        return True
+
+    # (hits, misses, rejected binaries)
+    def get_stats(self) -> Tuple[int, int, int]:
+        return (self._m_hits, self._m_misses, self._m_rejected)
+
+    def get_directory(self) -> str:
+        return self._m_directory
+
+    # Binary formats the current driver accepts
+    def _get_formats(self) -> Tuple[int, ...]:
+        if self._m_formats is None:
+            count: int = GL.glGetIntegerv(GL.GL_NUM_PROGRAM_BINARY_FORMATS)
+            formats = (GL.GLint * max(count, 1))()
+            if count > 0:
+                GL.glGetIntegerv(GL.GL_PROGRAM_BINARY_FORMATS, formats)
+            # Enums are unsigned, GLint may read them as negative
+            self._m_formats = tuple(value & 0xFFFFFFFF for value in formats[:count])
+        return self._m_formats
+
+    def _get_file_name(self, key: str) -> str:
+        return os.path.join(self._m_directory, key + ".bin")
+
+    def _reject(self, file_name: str) -> None:
+        self._m_rejected += 1
+        try:
+            os.remove(file_name)
+        except OSError:
+            pass
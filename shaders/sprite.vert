@@ -1,16 +1,25 @@
 // Request GLSL 3.3
 #version 330
+// Variants: INSTANCED reads world transform/texture rect per instance
+// [Defines and #include are expanded by Shader.load]
 
-// Uniforms (AKA unchanging!) world transform and view-proj matrices
-uniform mat4 uWorldTransform;
+// Uniform (AKA unchanging!) view-proj matrix
 uniform mat4 uViewProj;
 
-// Vertex attributes 
-layout(location=0) in vec3 inPosition;
-layout(location=1) in vec2 inTexCoord;
+#include "sprite_inputs.glsl"
 
-// Add texture coordinate as output
-out vec2 fragTexCoord;
+#ifdef INSTANCED
+// Per-instance world transform (locations 2-5, one vec4 each)
+// [Row-major matrix read as columns, so this is the transpose of uWorldTransform]
+layout(location=2) in mat4 inWorldTransform;
+// Per-instance sub-rectangle of texture (atlas region): xy = UV offset, zw = UV size
+layout(location=6) in vec4 inTexRect;
+#else
+// Uniform world transform
+uniform mat4 uWorldTransform;
+// Sub-rectangle of texture (atlas region): xy = UV offset, zw = UV size
+uniform vec4 uTexRect;
+#endif
 
 void main()
 {
@@ -18,8 +27,15 @@ void main()
  vec4 pos = vec4(inPosition, 1.0);
 
  // Outputs:
+#ifdef INSTANCED
+ // Transform position to world space (transposed, so multiply on left), then clip space
+ gl_Position = (inWorldTransform * pos) * uViewProj;
+ // Pass texture coord. to frag shader
+ fragTexCoord = inTexRect.xy + inTexCoord * inTexRect.zw; 
+#else
  // Transform position to world space, then clip space
  gl_Position = pos * uWorldTransform * uViewProj;
  // Pass texture coord. to frag shader
- fragTexCoord = inTexCoord; 
-}
\ No newline at end of file
+ fragTexCoord = uTexRect.xy + inTexCoord * uTexRect.zw; 
+#endif
+}
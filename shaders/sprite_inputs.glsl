@@ -0,0 +1,8 @@
+// Shared by sprite shader variants (see #include in sprite.vert)
+
+// Vertex attributes 
+layout(location=0) in vec3 inPosition;
+layout(location=1) in vec2 inTexCoord;
+
+// Add texture coordinate as output
+out vec2 fragTexCoord;
@@ -0,0 +1,104 @@
+from __future__ import annotations
+from typing import Dict, Iterator, List, Tuple     # For hinting
+import math
+
+
+class SpatialHash:
+    """
+    UNIFORM GRID OF CIRCLE COMPONENTS (BROADPHASE)
+
+    Each circle is stored in the cell holding its center. Queries widen the
+    searched cells by the largest stored radius, so only nearby circles are
+    returned as candidates. Call rebuild() once per tick after things move.
+    """
+
+    def __init__(self, cell_size: float = 100.0) -> None:
+        self._m_cell_size: float = cell_size
+        self._m_inv_cell_size: float = 1.0 / cell_size
+
+        # Cell key -> circles in it
+        self._m_cells: Dict[Tuple[int, int], List[CircleComponent]] = {}
+        # Circle -> its cell key (also the membership set)
+        self._m_cell_of: Dict[CircleComponent, Tuple[int, int]] = {}
+        self._m_max_radius: float = 0.0
+
+    def insert(self, circle: CircleComponent) -> None:
+        key = self._cell_key(circle.get_center())
+        self._m_cell_of[circle] = key
+        self._m_cells.setdefault(key, []).append(circle)
+        self._m_max_radius = max(self._m_max_radius, circle.get_radius())
+
+    def remove(self, circle: CircleComponent) -> None:
+        key = self._m_cell_of.pop(circle, None)
+        if key is not None:
+            self._m_cells[key].remove(circle)
+
+    # Re-bin every circle from its current center
+    # [Cell lists are emptied and reused, not reallocated]
+    def rebuild(self) -> None:
+        inv: float = self._m_inv_cell_size
+        floor = math.floor
+        cells: Dict[Tuple[int, int], List[CircleComponent]] = self._m_cells
+        cell_of: Dict[CircleComponent, Tuple[int, int]] = self._m_cell_of
+        max_radius: float = 0.0
+
+        for bucket in cells.values():
+            bucket.clear()
+
+        for circle in cell_of:
+            center: Vector2D = circle.get_center()
+            key = (floor(center.x * inv), floor(center.y * inv))
+            cell_of[circle] = key
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [circle]
+            else:
+                bucket.append(circle)
+            radius: float = circle.get_radius()
+            if radius > max_radius:
+                max_radius = radius
+
+        self._m_max_radius = max_radius
+
+    # Candidates that may overlap circle at (x, y) with given radius
+    def query(self, x: float, y: float, radius: float) -> Iterator[CircleComponent]:
+        inv: float = self._m_inv_cell_size
+        reach: float = radius + self._m_max_radius
+        min_cx: int = math.floor((x - reach) * inv)
+        max_cx: int = math.floor((x + reach) * inv)
+        min_cy: int = math.floor((y - reach) * inv)
+        max_cy: int = math.floor((y + reach) * inv)
+
+        cells = self._m_cells
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    yield from bucket
+
+    # Candidates that may overlap rectangle [min_x, max_x] x [min_y, max_y]
+    def query_rect(self, min_x: float, min_y: float,
+                   max_x: float, max_y: float) -> Iterator[CircleComponent]:
+        inv: float = self._m_inv_cell_size
+        reach: float = self._m_max_radius
+        min_cx: int = math.floor((min_x - reach) * inv)
+        max_cx: int = math.floor((max_x + reach) * inv)
+        min_cy: int = math.floor((min_y - reach) * inv)
+        max_cy: int = math.floor((max_y + reach) * inv)
+
+        cells = self._m_cells
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    yield from bucket
+
+    def get_cell_size(self) -> float:
+        return self._m_cell_size
+
+    def __len__(self) -> int:
+        return len(self._m_cell_of)
+
+    def _cell_key(self, center: Vector2D) -> Tuple[int, int]:
+        inv: float = self._m_inv_cell_size
+        return (math.floor(center.x * inv), math.floor(center.y * inv))
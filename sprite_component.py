@@ -1,8 +1,10 @@
 from __future__ import annotations
 import sdl2
+from typing import Tuple   # For hinting
 import OpenGL.GL as GL
-from maths import Matrix4
+from maths import Matrix4, Vector2D
 import ctypes
+import math
 from component import Component
 from shader import Shader
 
@@ -14,6 +16,16 @@ class SpriteComponent(Component):
         self.m_draw_order: int = draw_order
         self.m_text_width: int = 0
         self.m_text_height: int = 0
+        # Radius of circle around quad, before owner's scale
+        self._m_half_diagonal: float = 0.0
+
+        # Texture-size scale, and final world matrix for owner's current
+        # transform (cached until owner's transform or texture changes)
+        self._m_scale_mat: Matrix4 = Matrix4()
+        self._m_world_mat: Matrix4 = Matrix4()
+        self._m_world_mat_dirty: bool = True
+        # Final matrix while owner is between ticks (reused every frame)
+        self._m_interp_mat: Matrix4 = Matrix4()
 
         self._m_owner.get_game().add_sprite(self)
 
@@ -23,23 +35,49 @@ class SpriteComponent(Component):
         # Remove from game's list
         self._m_owner.get_game().remove_sprite(self)
 
-    def draw(self, shader: Shader) -> None:
-        # Scale quad mesh by width/height of texture
-        scale_mat: Matrix4 = Matrix4.create_scale_matrix_xyz(
-            float(self.m_text_width),
-            float(self.m_text_height),
-            1.0)
-        # Calculate world transform matrix
-        world_mat: Matrix4 = scale_mat * self._m_owner.get_world_transform()
+    # Alpha blends owner between previous and current tick
+    # [Returned matrix is reused, copy it to keep it]
+    def compute_world_matrix(self, alpha: float = 1.0) -> Matrix4:
+        world: Matrix4 = self._m_owner.get_interpolated_world_transform(alpha)
+
+        # Scale quad mesh by width/height of texture, then world transform
+        if world is not self._m_owner.get_world_transform():
+            # Blended transform differs every frame
+            return Matrix4.multiply(self._m_scale_mat, world, self._m_interp_mat)
+        # Static sprites reuse last result (no matrix math)
+        if self._m_world_mat_dirty:
+            Matrix4.multiply(self._m_scale_mat, world, self._m_world_mat)
+            self._m_world_mat_dirty = False
+        return self._m_world_mat
+
+    # Implements
+    def on_update_world_transform(self) -> None:
+        self._m_world_mat_dirty = True
+
+    # Hidden while owner sits in a pool (no re-sort on return)
+    def on_deactivate(self) -> None:
+        self._m_owner.get_game().remove_sprite(self)
+
+    def on_activate(self) -> None:
+        self._m_owner.get_game().add_sprite(self)
+
+    # Draws this sprite alone [Game normally draws sprites instanced]
+    def draw(self, shader: Shader, alpha: float = 1.0) -> None:
+        with self._m_owner.get_game().get_tracer().span("SpriteComponent.draw", "render"):
+            self._draw(shader, alpha)
+
+    def _draw(self, shader: Shader, alpha: float) -> None:
+        world_mat: Matrix4 = self.compute_world_matrix(alpha)
 
         # Note: since sprites use the same shader/mesh,
         # the game first sets them active before sprite draws
 
-        # Set world transform matrix in shader
+        # Set world transform matrix and texture sub-rect in shader
         shader.set_matrix_uniform("uWorldTransform", world_mat)
+        shader.set_vector4_uniform("uTexRect", *self.m_texture.get_uv_rect())
 
         # Set current texture [can set diff. texture for each draw!]
-        self.m_texture.set_active()
+        self.m_texture.set_active(self._m_owner.get_game().get_gl_state())
 
         # Draw quad mesh
         GL.glDrawElements(
@@ -55,6 +93,25 @@ class SpriteComponent(Component):
         # Set width/height
         self.m_text_width = texture.get_width()
         self.m_text_height = texture.get_height()
+        self._m_half_diagonal = 0.5 * math.hypot(self.m_text_width, self.m_text_height)
+        self._m_scale_mat.set(0, 0, float(self.m_text_width))
+        self._m_scale_mat.set(1, 1, float(self.m_text_height))
+        self._m_world_mat_dirty = True
+
+    # Bounding circle (x, y, radius) of quad in world space, at owner's
+    # current tick [Circle contains the quad at any rotation]
+    def get_bounds(self) -> Tuple[float, float, float]:
+        owner: Actor = self._m_owner
+        if owner.get_parent() is None:
+            # Root actor: no world matrix needed (culled sprites never build one)
+            pos: Vector2D = owner.get_position()
+            return pos.x, pos.y, owner.get_scale() * self._m_half_diagonal
+        mat = owner.get_world_transform().m_mat
+        # World scale includes parents'
+        return mat[12], mat[13], math.hypot(mat[0], mat[1]) * self._m_half_diagonal
+
+    def get_texture(self) -> Texture:
+        return self.m_texture
 
     def get_draw_order(self) -> int:
         return self.m_draw_order
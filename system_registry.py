@@ -0,0 +1,107 @@
+from __future__ import annotations
+from typing import Dict, List   # For hinting
+import bisect
+
+from actor import State
+from component import Component
+
+
+class ComponentPool:
+    """
+    Every component of one type that implements update(), in a dense list
+    (swap-and-pop on removal). Ticked as one system.
+    """
+
+    def __init__(self, component_type: type) -> None:
+        self._m_type: type = component_type
+        self._m_components: List[Component] = []
+        # Component -> its index in list
+        self._m_indices: Dict[Component, int] = {}
+
+    def add(self, component: Component) -> None:
+        self._m_indices[component] = len(self._m_components)
+        self._m_components.append(component)
+
+    def remove(self, component: Component) -> None:
+        index: int = self._m_indices.pop(component, None)
+        if index is None:
+            return
+        last: Component = self._m_components.pop()
+        if last is not component:
+            self._m_components[index] = last
+            self._m_indices[last] = index
+
+    # [Components are deleted with dead actors, after all updates]
+    def update(self, dt: float) -> None:
+        alive: State = State.eALIVE
+        for component in self._m_components:
+            if component.get_owner().get_state() == alive:
+                component.update(dt)
+
+    def get_type(self) -> type:
+        return self._m_type
+
+    def __len__(self) -> int:
+        return len(self._m_components)
+
+
+class SystemRegistry:
+    """
+    SYSTEMS TICKED ONCE PER TICK, IN UPDATE ORDER
+
+    A system is anything with update(dt) (e.g. MovementSystem). Components
+    register here on creation: types that implement update() get a
+    ComponentPool system of their own; types with the no-op update() are
+    never visited.
+
+    Ordering differs from per-actor updates:
+    - All systems (so all component updates) run before any actor's
+      update_actor(), not each actor's components just before it.
+    - Update order is per type: a pool takes the update order of the first
+      component of its type, and later components' orders are ignored.
+    """
+
+    def __init__(self) -> None:
+        # Sorted by update order (equal orders keep registration order)
+        self._m_orders: List[int] = []
+        self._m_systems: List[object] = []
+        self._m_names: List[str] = []
+        # Component type -> its pool
+        self._m_pools: Dict[type, ComponentPool] = {}
+
+    def register(self, system, update_order: int, name: str = None) -> None:
+        index: int = bisect.bisect_right(self._m_orders, update_order)
+        self._m_orders.insert(index, update_order)
+        self._m_systems.insert(index, system)
+        self._m_names.insert(index, name or type(system).__name__)
+
+    def add_component(self, component: Component) -> None:
+        component_type: type = type(component)
+        if component_type.update is Component.update:
+            return
+        pool: ComponentPool = self._m_pools.get(component_type)
+        if pool is None:
+            pool = self._m_pools[component_type] = ComponentPool(component_type)
+            self.register(pool, component.get_update_order(), component_type.__name__)
+        pool.add(component)
+
+    def remove_component(self, component: Component) -> None:
+        pool: ComponentPool = self._m_pools.get(type(component))
+        if pool is not None:
+            pool.remove(component)
+
+    def update(self, dt: float, tracer: Tracer) -> None:
+        if tracer.is_enabled():
+            for system, name in zip(self._m_systems, self._m_names):
+                with tracer.span(name + ".update", "system"):
+                    system.update(dt)
+        else:
+            for system in self._m_systems:
+                system.update(dt)
+
+    # Systems in the order they are ticked
+    def get_systems(self) -> List[object]:
+        return list(self._m_systems)
+
+    def get_pool(self, component_type: type) -> ComponentPool:
+        return self._m_pools.get(component_type)
@@ -0,0 +1,19 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from game import Game   # noqa: E402
+
+
+# Headless game (no window or GL context), assets loaded from repository root
+@pytest.fixture
+def game(monkeypatch):
+    monkeypatch.chdir(ROOT)
+    headless_game = Game(headless=True)
+    assert headless_game.initialize()
+    yield headless_game
+    headless_game.shutdown()
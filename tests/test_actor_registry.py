@@ -0,0 +1,73 @@
+from actor import State
+from actor_registry import ActorHandle, ActorRegistry
+
+
+class FakeActor:
+    """ Only the handle storage ActorRegistry needs """
+
+    def __init__(self, name):
+        self.name = name
+        self._handle = None
+
+    def set_handle(self, handle):
+        self._handle = handle
+
+    def get_handle(self):
+        return self._handle
+
+
+def test_handles_resolve_until_removed():
+    registry = ActorRegistry()
+    a, b = FakeActor("a"), FakeActor("b")
+    handle_a = registry.add(a)
+    handle_b = registry.add(b)
+
+    assert registry.get(handle_a) is a and registry.get(handle_b) is b
+    assert a in registry and len(registry) == 2
+
+    assert registry.remove(a)
+    assert registry.get(handle_a) is None
+    assert a not in registry and a.get_handle() is None
+    assert registry.get(handle_b) is b
+    # Second removal is refused
+    assert not registry.remove(a)
+
+
+def test_reused_slot_does_not_resolve_stale_handle():
+    registry = ActorRegistry()
+    old = FakeActor("old")
+    old_handle = registry.add(old)
+    registry.remove(old)
+
+    new = FakeActor("new")
+    new_handle = registry.add(new)
+    assert new_handle.slot == old_handle.slot
+    assert new_handle.generation == old_handle.generation + 1
+    assert registry.get(old_handle) is None
+    assert registry.get(new_handle) is new
+
+
+def test_swap_and_pop_keeps_dense_iteration_and_handles():
+    registry = ActorRegistry()
+    actors = [FakeActor(str(i)) for i in range(5)]
+    handles = [registry.add(actor) for actor in actors]
+
+    registry.remove(actors[1])
+    registry.remove(actors[0])
+    assert sorted(actor.name for actor in registry) == ["2", "3", "4"]
+    for actor, handle in zip(actors[2:], handles[2:]):
+        assert registry.get(handle) is actor
+
+
+def test_unknown_slot_is_not_found():
+    assert ActorRegistry().get(ActorHandle(7, 0)) is None
+
+
+def test_game_resolves_handles_of_dead_actors_to_none(game):
+    asteroid = next(iter(game.get_asteroids()))
+    handle = asteroid.get_handle()
+    assert game.get_actor(handle) is asteroid
+
+    asteroid.set_state(State.eDEAD)
+    game.run_frames(1)
+    assert game.get_actor(handle) is None
@@ -0,0 +1,94 @@
+import pytest
+
+from actor import Actor
+from maths import Vector2D
+from spatial_hash import SpatialHash
+from sprite_component import SpriteComponent
+from view_culler import ViewCuller
+
+
+class FakeCircle:
+    def __init__(self, x, y, radius):
+        self.center = Vector2D(x, y)
+        self.radius = radius
+
+    def get_center(self):
+        return self.center
+
+    def get_radius(self):
+        return self.radius
+
+
+class FakeSprite:
+    def __init__(self, x, y, radius):
+        self.bounds = (x, y, radius)
+
+    def get_bounds(self):
+        return self.bounds
+
+
+def test_query_rect_returns_everything_that_may_overlap():
+    grid = SpatialHash(cell_size=100.0)
+    inside = FakeCircle(50.0, 50.0, 5.0)
+    # Center outside the rect, but radius reaches into it
+    reaching = FakeCircle(-130.0, 50.0, 40.0)
+    far = FakeCircle(1000.0, 1000.0, 5.0)
+    for circle in (inside, reaching, far):
+        grid.insert(circle)
+
+    candidates = set(grid.query_rect(-100.0, -100.0, 100.0, 100.0))
+    assert {inside, reaching} <= candidates
+    assert far not in candidates
+
+
+def test_query_rect_follows_rebuild():
+    grid = SpatialHash(cell_size=100.0)
+    circle = FakeCircle(1000.0, 0.0, 1.0)
+    grid.insert(circle)
+    assert list(grid.query_rect(-10.0, -10.0, 10.0, 10.0)) == []
+
+    circle.center.set(0.0, 0.0)
+    grid.rebuild()
+    assert list(grid.query_rect(-10.0, -10.0, 10.0, 10.0)) == [circle]
+
+    grid.remove(circle)
+    assert list(grid.query_rect(-10.0, -10.0, 10.0, 10.0)) == []
+
+
+def test_cull_keeps_draw_order_and_drops_off_screen():
+    culler = ViewCuller(512.0, 384.0, margin=0.0)
+    visible_a = FakeSprite(0.0, 0.0, 10.0)
+    edge = FakeSprite(520.0, 0.0, 10.0)        # Overlaps right edge
+    outside = FakeSprite(523.0, 0.0, 10.0)
+    visible_b = FakeSprite(-100.0, 300.0, 10.0)
+    layers = {100: {visible_a: None, edge: None, outside: None}, 150: {visible_b: None}}
+
+    assert culler.cull(layers, [100, 150]) == [[visible_a, edge], [visible_b]]
+    assert culler.get_visible_count() == 3
+    assert culler.get_total_count() == 4
+
+    # Margin widens the view
+    assert ViewCuller(512.0, 384.0, margin=5.0).is_visible(outside)
+
+
+def test_sprite_bounds_use_texture_size_and_world_scale(game):
+    texture = next(iter(game.get_sprites())).get_texture()
+    half_diagonal = 0.5 * (texture.get_width() ** 2 + texture.get_height() ** 2) ** 0.5
+
+    parent = Actor(game)
+    parent.set_position(Vector2D(100.0, 0.0))
+    parent.set_scale(2.0)
+    child = Actor(game)
+    child.set_parent(parent)
+    child.set_position(Vector2D(10.0, 0.0))
+    child.set_scale(1.5)
+    sprite = SpriteComponent(child)
+    sprite.set_texture(texture)
+
+    x, y, radius = sprite.get_bounds()
+    assert (x, y) == pytest.approx((120.0, 0.0))
+    assert radius == pytest.approx(3.0 * half_diagonal)
+
+    # Moved out of view with its parent
+    parent.set_position(Vector2D(2000.0, 0.0))
+    assert not game.get_view_culler().is_visible(sprite)
@@ -0,0 +1,246 @@
+import ctypes
+
+import pytest
+import sdl2
+
+from actor import Actor, State
+from input_move_component import InputMoveComponent
+from input_system import InputSystem
+from laser import Laser
+
+W, S, A, SPACE = (sdl2.SDL_SCANCODE_W, sdl2.SDL_SCANCODE_S,
+                  sdl2.SDL_SCANCODE_A, sdl2.SDL_SCANCODE_SPACE)
+
+
+class Owner:
+    def __init__(self):
+        self.state = State.eALIVE
+
+    def get_state(self):
+        return self.state
+
+
+class Listener:
+    def __init__(self):
+        self.events = []
+
+    def on_action(self, action, pressed):
+        self.events.append((action, "pressed" if pressed else "released"))
+
+    def on_action_held(self, action):
+        self.events.append((action, "held"))
+
+
+@pytest.fixture
+def keys():
+    return (ctypes.c_uint8 * sdl2.SDL_NUM_SCANCODES)()
+
+
+def test_edges_then_held_every_frame(keys):
+    system = InputSystem()
+    system.bind("jump", W)
+    listener = Listener()
+    system.subscribe("jump", listener, Owner())
+
+    system.process(keys)
+    keys[W] = 1
+    system.process(keys)
+    system.process(keys)
+    keys[W] = 0
+    system.process(keys)
+    assert listener.events == [("jump", "pressed"), ("jump", "held"),
+                               ("jump", "held"), ("jump", "released")]
+    assert not system.is_held("jump")
+
+
+def test_action_is_down_while_any_key_is(keys):
+    system = InputSystem()
+    system.bind("fire", W)
+    system.bind("fire", SPACE)
+    listener = Listener()
+    system.subscribe("fire", listener, Owner())
+
+    keys[W] = 1
+    system.process(keys)
+    keys[SPACE] = 1
+    keys[W] = 0
+    system.process(keys)
+    assert listener.events == [("fire", "pressed"), ("fire", "held"), ("fire", "held")]
+
+
+def test_only_subscribers_of_an_action_are_called(keys):
+    system = InputSystem()
+    system.bind("a", W)
+    system.bind("b", S)
+    a_listener, b_listener = Listener(), Listener()
+    system.subscribe("a", a_listener, Owner())
+    system.subscribe("b", b_listener, Owner())
+
+    keys[W] = 1
+    system.process(keys)
+    assert b_listener.events == []
+
+    system.unsubscribe_all(a_listener)
+    system.process(keys)
+    assert a_listener.events == [("a", "pressed"), ("a", "held")]
+
+
+def test_held_events_follow_binding_order(keys):
+    system = InputSystem()
+    system.bind("first", S)
+    system.bind("second", W)
+    listener = Listener()
+    system.subscribe("second", listener, Owner())
+    system.subscribe("first", listener, Owner())
+
+    keys[W] = 1
+    system.process(keys)
+    keys[S] = 1
+    listener.events.clear()
+    system.process(keys)
+    assert listener.events == [("first", "pressed"), ("first", "held"), ("second", "held")]
+
+
+def test_owner_not_alive_gets_no_press_or_held(keys):
+    system = InputSystem()
+    system.bind("fire", SPACE)
+    owner, listener = Owner(), Listener()
+    system.subscribe("fire", listener, owner)
+
+    owner.state = State.ePAUSED
+    keys[SPACE] = 1
+    system.process(keys)
+    system.process(keys)
+    keys[SPACE] = 0
+    system.process(keys)
+    assert listener.events == []
+
+
+def test_release_reaches_owner_paused_after_press(keys):
+    system = InputSystem()
+    system.bind("fire", SPACE)
+    owner, listener = Owner(), Listener()
+    system.subscribe("fire", listener, owner)
+
+    keys[SPACE] = 1
+    system.process(keys)
+    owner.state = State.ePAUSED
+    system.process(keys)
+    keys[SPACE] = 0
+    system.process(keys)
+    assert listener.events == [("fire", "pressed"), ("fire", "held"), ("fire", "released")]
+
+
+def test_press_missed_while_paused_is_sent_once_alive(keys):
+    system = InputSystem()
+    system.bind("fire", SPACE)
+    owner, listener = Owner(), Listener()
+    system.subscribe("fire", listener, owner)
+
+    owner.state = State.ePAUSED
+    keys[SPACE] = 1
+    system.process(keys)
+    owner.state = State.eALIVE
+    system.process(keys)
+    system.process(keys)
+    assert listener.events == [("fire", "pressed"), ("fire", "held"), ("fire", "held")]
+
+
+def test_subscribing_while_held_sends_the_press(keys):
+    system = InputSystem()
+    system.bind("fire", SPACE)
+    keys[SPACE] = 1
+    system.process(keys)
+
+    listener = Listener()
+    system.subscribe("fire", listener, Owner())
+    system.process(keys)
+    keys[SPACE] = 0
+    system.process(keys)
+    assert listener.events == [("fire", "pressed"), ("fire", "held"), ("fire", "released")]
+
+
+def test_binding_a_key_moves_it_between_actions(keys):
+    system = InputSystem()
+    system.bind("old", W)
+    system.bind("new", W)
+    assert system.get_keys("old") == [] and system.get_keys("new") == [W]
+
+    listener = Listener()
+    system.subscribe("new", listener, Owner())
+    keys[W] = 1
+    system.process(keys)
+    # Unbinding a held action releases it
+    system.unbind("new")
+    assert listener.events == [("new", "pressed"), ("new", "held"), ("new", "released")]
+
+
+def test_paused_ship_neither_fires_nor_thrusts(game, keys):
+    ship = game._m_ship
+    ship.set_state(State.ePAUSED)
+    pool = game.get_actor_pool(Laser)
+    in_use = pool.get_created_count() - pool.get_free_count()
+    keys[SPACE] = 1
+    keys[W] = 1
+    for _ in range(90):
+        game.step_frame(keys, 1 / 60)
+    assert pool.get_created_count() - pool.get_free_count() == in_use
+    assert ship.get_body().get_velocity().x == 0.0
+    assert ship.get_body().get_velocity().y == 0.0
+
+
+def test_thrust_texture_returns_when_back_is_released(game, keys):
+    ship = game._m_ship
+
+    def showing_thrust():
+        return ship._m_sprite.get_texture() is ship._m_thrust_texture
+
+    keys[W] = 1
+    game.step_frame(keys, 1 / 60)
+    assert showing_thrust()
+    keys[S] = 1
+    game.step_frame(keys, 1 / 60)
+    assert not showing_thrust()
+    keys[S] = 0
+    game.step_frame(keys, 1 / 60)
+    assert showing_thrust()
+
+
+def test_second_mover_listens_to_its_own_actions(game, keys):
+    game.get_input_system().bind("p2_counter_clockwise", sdl2.SDL_SCANCODE_LEFT)
+    other = Actor(game)
+    mover = InputMoveComponent(other)
+    mover.set_max_rotation_speed(1.0)
+    mover.set_counter_clockwise_action("p2_counter_clockwise")
+
+    # Ship's key turns only the ship
+    keys[A] = 1
+    game.step_frame(keys, 1 / 60)
+    assert mover.get_rotation_speed() == 0.0
+    assert game._m_ship.get_body().get_rotation_speed() != 0.0
+
+    keys[sdl2.SDL_SCANCODE_LEFT] = 1
+    game.step_frame(keys, 1 / 60)
+    assert mover.get_rotation_speed() == 1.0
+    assert game.get_input_system().get_keys("counter_clockwise") == [A]
+
+
+def test_rotation_key_held_across_pause(game, keys):
+    ship = game._m_ship
+    ship.set_state(State.ePAUSED)
+    keys[A] = 1
+    game.step_frame(keys, 1 / 60)
+    ship.set_state(State.eALIVE)
+    for _ in range(5):
+        game.step_frame(keys, 1 / 60)
+    assert ship.get_body().get_rotation_speed() != 0.0
+
+
+def test_mover_created_while_key_held(game, keys):
+    keys[A] = 1
+    game.step_frame(keys, 1 / 60)
+    other = Actor(game)
+    mover = InputMoveComponent(other)
+    mover.set_max_rotation_speed(1.0)
+    game.step_frame(keys, 1 / 60)
+    assert mover.get_rotation_speed() == 1.0
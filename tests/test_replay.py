@@ -0,0 +1,83 @@
+import ctypes
+import random
+import struct
+
+import pytest
+import sdl2
+
+from game import Game
+from maths import Vector2D
+from replay import InputRecorder, InputReplayer
+
+KEYS = (sdl2.SDL_SCANCODE_W, sdl2.SDL_SCANCODE_S, sdl2.SDL_SCANCODE_A,
+        sdl2.SDL_SCANCODE_D, sdl2.SDL_SCANCODE_SPACE)
+
+
+def record_session(game, file_name, num_frames=300):
+    game.set_recorder(InputRecorder(file_name))
+    keyb_state = (ctypes.c_uint8 * sdl2.SDL_NUM_SCANCODES)()
+    rand = random.Random(3)
+    for _ in range(num_frames):
+        if rand.random() < 0.2:
+            keyb_state[rand.choice(KEYS)] ^= 1
+        game.step_frame(keyb_state, rand.choice((1 / 60, 1 / 30, 1 / 120)))
+    game.get_recorder().close()
+    return game.compute_state_checksum()
+
+
+def replay_game(replayer):
+    game = Game(headless=True, tick_rate=replayer.get_tick_rate(), seed=replayer.get_seed())
+    assert game.initialize()
+    return game
+
+
+def test_round_trip_matches_every_checksum(game, tmp_path):
+    log = str(tmp_path / "session.rec")
+    final_checksum = record_session(game, log)
+
+    replayer = InputReplayer(log)
+    assert replayer.get_seed() == game.get_seed()
+    assert len(replayer.get_frames()) == 300
+    # Keys were pressed at some point (not a trivially idle session)
+    assert any(frame.pressed_keys for frame in replayer.get_frames())
+
+    replayed = replay_game(replayer)
+    result = replayer.run(replayed)
+    assert not result.is_diverged()
+    assert result.frames == 300
+    assert replayed.compute_state_checksum() == final_checksum
+    replayed.shutdown()
+
+
+def test_checksum_tracks_actor_state(game):
+    before = game.compute_state_checksum()
+    assert game.compute_state_checksum() == before
+    next(iter(game.get_asteroids())).set_position(Vector2D(1.0, 2.0))
+    assert game.compute_state_checksum() != before
+
+
+def test_tampered_log_reports_divergence(game, tmp_path):
+    log = tmp_path / "session.rec"
+    record_session(game, str(log), num_frames=60)
+
+    # Double the first frame's time (first frame starts right after header)
+    data = bytearray(log.read_bytes())
+    header_size = struct.calcsize("<4sHIHH")
+    frame_time = struct.unpack_from("<d", data, header_size)[0]
+    struct.pack_into("<d", data, header_size, frame_time * 4.0)
+    log.write_bytes(bytes(data))
+
+    replayer = InputReplayer(str(log))
+    replayed = replay_game(replayer)
+    result = replayer.run(replayed)
+    assert result.is_diverged()
+    assert result.diverged_frame == 0
+    assert result.actual_checksum != result.expected_checksum
+    replayed.shutdown()
+
+
+def test_rejects_files_that_are_not_replays(tmp_path):
+    log = tmp_path / "junk.rec"
+    log.write_bytes(b"not a replay log at all")
+    with pytest.raises(ValueError):
+        InputReplayer(str(log))
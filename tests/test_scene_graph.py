@@ -0,0 +1,129 @@
+import math
+
+import pytest
+
+from actor import Actor, State
+from maths import Matrix4, Vector2D
+
+
+def world_xy(actor):
+    position = actor.get_world_position()
+    return position.x, position.y
+
+
+@pytest.fixture
+def chain(game):
+    parent, child, grandchild = Actor(game), Actor(game), Actor(game)
+    child.set_parent(parent)
+    grandchild.set_parent(child)
+    parent.set_position(Vector2D(100.0, 0.0))
+    parent.set_rotation(math.pi / 2)
+    parent.set_scale(2.0)
+    child.set_position(Vector2D(10.0, 0.0))
+    grandchild.set_position(Vector2D(1.0, 0.0))
+    return parent, child, grandchild
+
+
+def test_world_transform_composes_through_parents(chain):
+    parent, child, grandchild = chain
+    assert world_xy(parent) == pytest.approx((100.0, 0.0))
+    # Rotated 90 degrees and scaled 2x by parent
+    assert world_xy(child) == pytest.approx((100.0, 20.0))
+    assert world_xy(grandchild) == pytest.approx((100.0, 22.0))
+    assert parent.get_children() == [child] and grandchild.get_parent() is child
+
+
+def test_parent_change_dirties_subtree_only(chain, monkeypatch):
+    parent, child, grandchild = chain
+    grandchild.get_world_transform()
+    sibling = Actor(parent.get_game())
+    sibling.set_parent(parent)
+    sibling.get_world_transform()
+
+    multiplies = []
+    original = Matrix4.multiply
+    monkeypatch.setattr(Matrix4, "multiply", staticmethod(
+        lambda a, b, out: multiplies.append(out) or original(a, b, out)))
+
+    # Clean tree: nothing recomputed
+    assert grandchild.get_world_transform() is grandchild.get_world_transform()
+    assert multiplies == []
+
+    # Moving child leaves parent and sibling clean, each dirty node built once
+    child.set_position(Vector2D(0.0, 5.0))
+    grandchild.get_world_transform()
+    child.get_world_transform()
+    sibling.get_world_transform()
+    assert len(multiplies) == 2
+    assert world_xy(grandchild) == pytest.approx((90.0, 2.0))
+
+
+def test_reparent_and_detach(chain):
+    parent, child, grandchild = chain
+    grandchild.set_parent(parent)
+    assert parent.get_children() == [child, grandchild]
+    assert child.get_children() == []
+    assert world_xy(grandchild) == pytest.approx((100.0, 2.0))
+
+    grandchild.set_parent(None)
+    assert grandchild.get_parent() is None
+    assert world_xy(grandchild) == pytest.approx((1.0, 0.0))
+
+
+def test_parent_cycle_is_rejected(chain):
+    parent, child, grandchild = chain
+    for new_parent in (parent, child, grandchild):
+        with pytest.raises(ValueError):
+            parent.set_parent(new_parent)
+    # Hierarchy untouched
+    assert parent.get_parent() is None
+    assert grandchild.get_parent() is child
+    assert world_xy(grandchild) == pytest.approx((100.0, 22.0))
+
+
+def test_interpolation_blends_child_on_parents_blend(chain):
+    parent, child, grandchild = chain
+    parent.set_rotation(0.0)
+    parent.set_scale(1.0)
+    # Tick start: remembers previous transforms
+    parent.update(1 / 60)
+    child.update(1 / 60)
+
+    # Parent moves 8 units this tick, child is static relative to it
+    parent.set_position(Vector2D(108.0, 0.0))
+    blended = child.get_interpolated_world_transform(0.5)
+    assert (blended.get(3, 0), blended.get(3, 1)) == pytest.approx((114.0, 0.0))
+    # alpha 1 is the current tick
+    current = child.get_interpolated_world_transform(1.0)
+    assert current.get(3, 0) == pytest.approx(118.0)
+
+    # Nothing moved: the world transform itself is returned
+    parent.update(1 / 60)
+    assert child.get_interpolated_world_transform(0.5) is child.get_world_transform()
+
+
+def test_delete_cascades_to_children(chain, game):
+    parent, child, grandchild = chain
+    game.run_frames(1)
+    parent.delete()
+    assert parent.get_children() == [] and child.get_parent() is None
+    for actor in chain:
+        assert actor.get_handle() is None
+
+
+def test_child_dying_with_its_parent_is_deleted_once(game):
+    deletes = []
+
+    class Counted(Actor):
+        def delete(self):
+            deletes.append(self)
+            super().delete()
+
+    parent, child = Counted(game), Counted(game)
+    child.set_parent(parent)
+    game.run_frames(1)
+    # Parent leaves dead queue first and deletes child, still queued itself
+    child.set_state(State.eDEAD)
+    parent.set_state(State.eDEAD)
+    game.run_frames(1)
+    assert deletes == [parent, child]
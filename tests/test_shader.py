@@ -0,0 +1,222 @@
+import os
+from types import SimpleNamespace
+
+import OpenGL.GL as GL
+import pytest
+import sdl2
+
+from shader import Shader
+import shader
+import shader_cache
+from maths import Matrix4
+from shader_cache import ShaderCache
+
+VERTEX = """#version 330
+#include "inputs.glsl"
+void main()
+{
+ gl_Position = vec4(inPosition, SCALE);
+}
+"""
+FRAGMENT = """#version 330
+out vec4 outColor;
+void main()
+{
+ outColor = vec4(1.0);
+}
+"""
+
+
+def write(directory, name, text):
+    path = directory / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return str(path)
+
+
+def load_source(path, defines=None):
+    source = Shader()._load_source(path, defines)
+    return None if source is None else source.decode()
+
+
+# Preprocessor (no GL needed)
+
+def test_include_paths_are_relative_to_including_file(tmp_path):
+    write(tmp_path, "common/consts.glsl", "const float ONE = 1.0;")
+    write(tmp_path, "sprite/inputs.glsl", '#include "../common/consts.glsl"\nin vec3 inPosition;\n')
+    main = write(tmp_path, "sprite/main.vert", '#version 330\n  #include "inputs.glsl"\nvoid main() {}\n')
+    assert load_source(main) == ("#version 330\nconst float ONE = 1.0;\n"
+                                 "in vec3 inPosition;\nvoid main() {}\n")
+
+
+def test_same_file_may_be_included_twice(tmp_path):
+    write(tmp_path, "a.glsl", "float a;\n")
+    main = write(tmp_path, "main.vert", '#include "a.glsl"\n#include "a.glsl"\n')
+    assert load_source(main) == "float a;\nfloat a;\n"
+
+
+def test_include_cycle_fails(tmp_path):
+    write(tmp_path, "a.glsl", '#include "b.glsl"\n')
+    write(tmp_path, "b.glsl", '#include "a.glsl"\n')
+    main = write(tmp_path, "main.vert", '#include "a.glsl"\n')
+    assert load_source(main) is None
+    # A file including itself
+    assert load_source(write(tmp_path, "self.glsl", '#include "self.glsl"\n')) is None
+
+
+def test_missing_file_fails(tmp_path):
+    assert load_source(str(tmp_path / "missing.vert")) is None
+    main = write(tmp_path, "main.vert", '#version 330\n#include "gone.glsl"\n')
+    assert load_source(main) is None
+
+
+def test_defines_follow_version_line(tmp_path):
+    main = write(tmp_path, "main.vert", "// Header\n#version 330\nvoid main() {}\n")
+    assert load_source(main, {"INSTANCED": 1, "COUNT": 4}) == (
+        "// Header\n#version 330\n#define COUNT 4\n#define INSTANCED 1\nvoid main() {}\n")
+    # Without #version, defines come first
+    plain = write(tmp_path, "plain.vert", "void main() {}\n")
+    assert load_source(plain, {"A": 1}) == "#define A 1\nvoid main() {}\n"
+    assert load_source(plain) == "void main() {}\n"
+
+
+def test_matrix_upload_skipped_only_for_same_values(monkeypatch):
+    uploads = []
+    monkeypatch.setattr(shader, "GL", SimpleNamespace(
+        GL_TRUE=GL.GL_TRUE,
+        glUniformMatrix4fv=lambda loc, count, transpose, values: uploads.append(values[12])))
+    program = Shader()
+    program._m_uniforms["uWorldTransform"] = (3, GL.GL_FLOAT_MAT4)
+
+    matrix = Matrix4()
+    program.set_matrix_uniform("uWorldTransform", matrix)
+    program.set_matrix_uniform("uWorldTransform", matrix)
+    # Same values in another matrix
+    program.set_matrix_uniform("uWorldTransform", Matrix4())
+    # Same matrix, changed in place
+    matrix.set(3, 0, 5.0)
+    program.set_matrix_uniform("uWorldTransform", matrix)
+    program.set_matrix_uniform("uUnused", matrix)
+    assert uploads == [0.0, 5.0]
+    assert program.get_upload_stats() == (2, 2)
+
+
+# Program binary cache (needs a GL context, e.g. Mesa llvmpipe)
+
+@pytest.fixture(scope="module")
+def gl_context():
+    if sdl2.SDL_InitSubSystem(sdl2.SDL_INIT_VIDEO) != 0:
+        pytest.skip("No SDL video")
+    sdl2.SDL_GL_SetAttribute(sdl2.SDL_GL_CONTEXT_PROFILE_MASK,
+                             sdl2.SDL_GL_CONTEXT_PROFILE_CORE)
+    sdl2.SDL_GL_SetAttribute(sdl2.SDL_GL_CONTEXT_MAJOR_VERSION, 3)
+    sdl2.SDL_GL_SetAttribute(sdl2.SDL_GL_CONTEXT_MINOR_VERSION, 3)
+    window = sdl2.SDL_CreateWindow(b"test", 0, 0, 16, 16,
+                                   sdl2.SDL_WINDOW_OPENGL | sdl2.SDL_WINDOW_HIDDEN)
+    context = sdl2.SDL_GL_CreateContext(window) if window else None
+    if not context:
+        if window:
+            sdl2.SDL_DestroyWindow(window)
+        sdl2.SDL_QuitSubSystem(sdl2.SDL_INIT_VIDEO)
+        pytest.skip("No OpenGL 3.3 context")
+    if not (GL.glProgramParameteri and GL.glProgramBinary):
+        # e.g. PyOpenGL loading through GLX for an EGL context (set PYOPENGL_PLATFORM)
+        sdl2.SDL_GL_DeleteContext(context)
+        sdl2.SDL_DestroyWindow(window)
+        sdl2.SDL_QuitSubSystem(sdl2.SDL_INIT_VIDEO)
+        pytest.skip("Program binary functions not loaded")
+    # VAO needed by core profile validation on some drivers
+    GL.glBindVertexArray(GL.glGenVertexArrays(1))
+    yield
+    sdl2.SDL_GL_DeleteContext(context)
+    sdl2.SDL_DestroyWindow(window)
+    sdl2.SDL_QuitSubSystem(sdl2.SDL_INIT_VIDEO)
+
+
+@pytest.fixture
+def cache(gl_context, tmp_path):
+    cache = ShaderCache(str(tmp_path / "cache"))
+    if not cache.is_supported():
+        pytest.skip("Driver has no program binary formats")
+    return cache
+
+
+@pytest.fixture
+def sources(tmp_path):
+    write(tmp_path, "inputs.glsl", "layout(location=0) in vec3 inPosition;\n")
+    return (write(tmp_path, "test.vert", VERTEX), write(tmp_path, "test.frag", FRAGMENT))
+
+
+def load_shader(sources, cache):
+    shader = Shader()
+    assert shader.load(*sources, defines={"SCALE": 1.0}, cache=cache)
+    shader.unload()
+
+
+def cached_files(cache):
+    return [os.path.join(cache.get_directory(), name)
+            for name in os.listdir(cache.get_directory())]
+
+
+def test_cache_miss_then_hit(cache, sources):
+    load_shader(sources, cache)
+    assert cache.get_stats() == (0, 1, 0)
+    assert len(cached_files(cache)) == 1
+
+    load_shader(sources, cache)
+    assert cache.get_stats() == (1, 1, 0)
+
+
+def test_garbled_binary_is_rejected_and_recompiled(cache, sources):
+    load_shader(sources, cache)
+    [file_name] = cached_files(cache)
+    # Keep format header, garble the driver's binary
+    with open(file_name, "r+b") as file_obj:
+        file_obj.seek(4)
+        file_obj.write(b"\xff" * 64)
+        file_obj.truncate(4 + 64)
+
+    # Shader still loads (from source) and the cache is rewritten
+    load_shader(sources, cache)
+    hits, misses, rejected = cache.get_stats()
+    assert (hits, rejected) == (0, 1)
+    load_shader(sources, cache)
+    assert cache.get_stats()[0] == 1
+
+
+@pytest.mark.parametrize("contents", [b"", b"\x01\x00", b"\xef\xbe\xad\xde" + b"\x00" * 32])
+def test_short_or_foreign_binary_is_rejected(cache, contents):
+    os.makedirs(cache.get_directory(), exist_ok=True)
+    key = cache.make_key(b"vertex", b"fragment")
+    file_name = os.path.join(cache.get_directory(), key + ".bin")
+    with open(file_name, "wb") as file_obj:
+        file_obj.write(contents)
+
+    assert cache.load_program(key) == 0
+    assert cache.get_stats() == (0, 0, 1)
+    assert not os.path.exists(file_name)
+
+
+def test_program_binary_error_deletes_program(tmp_path, monkeypatch):
+    deleted = []
+
+    def program_binary(program, binary_format, binary, length):
+        raise GL.GLError(GL.GL_INVALID_ENUM, "glProgramBinary")
+
+    monkeypatch.setattr(shader_cache, "GL", SimpleNamespace(
+        GLError=GL.GLError, GLint=GL.GLint,
+        GL_NUM_PROGRAM_BINARY_FORMATS=GL.GL_NUM_PROGRAM_BINARY_FORMATS,
+        GL_PROGRAM_BINARY_FORMATS=GL.GL_PROGRAM_BINARY_FORMATS,
+        glGetIntegerv=lambda name, values=None: values.__setitem__(0, 7) if values else 1,
+        glCreateProgram=lambda: 5,
+        glProgramBinary=program_binary,
+        glDeleteProgram=deleted.append))
+    cache = ShaderCache(str(tmp_path))
+    file_name = str(tmp_path / "key.bin")
+    with open(file_name, "wb") as file_obj:
+        file_obj.write(shader_cache._FORMAT.pack(7) + b"binary")
+
+    assert cache.load_program("key") == 0
+    assert deleted == [5]
+    assert cache.get_stats() == (0, 0, 1)
+    assert not os.path.exists(file_name)
@@ -0,0 +1,122 @@
+from actor import Actor, State
+from component import Component
+from circle_component import CircleComponent
+from sprite_component import SpriteComponent
+from movement_system import MovementSystem
+
+
+class CountingComponent(Component):
+    def __init__(self, owner, update_order=100):
+        super().__init__(owner, update_order)
+        self.updates = 0
+
+    def update(self, dt):
+        self.updates += 1
+
+
+class KillerComponent(Component):
+    """ Kills its owner on first update (deleted when dead actors are removed) """
+
+    def update(self, dt):
+        self._m_owner.set_state(State.eDEAD)
+
+
+def test_no_op_components_are_never_pooled(game):
+    registry = game.get_system_registry()
+    assert registry.get_pool(SpriteComponent) is None
+    assert registry.get_pool(CircleComponent) is None
+    assert [type(system) for system in registry.get_systems()] == [MovementSystem]
+
+
+def test_pool_ticks_each_component_once_per_tick(game):
+    components = [CountingComponent(Actor(game)) for _ in range(3)]
+    game.run_frames(4)
+    assert [c.updates for c in components] == [4, 4, 4]
+    assert len(game.get_system_registry().get_pool(CountingComponent)) == 3
+
+
+def test_pool_skips_paused_and_dead_owners(game):
+    alive = CountingComponent(Actor(game))
+    paused = CountingComponent(Actor(game))
+    game.run_frames(1)
+    paused.get_owner().set_state(State.ePAUSED)
+    game.run_frames(2)
+    assert alive.updates == 3
+    assert paused.updates == 1
+
+    # Killed by an earlier pool: skipped for the rest of that tick, then removed
+    dying = CountingComponent(Actor(game))
+    KillerComponent(dying.get_owner(), update_order=50)
+    game.run_frames(1)
+    assert dying.updates == 0
+    assert len(game.get_system_registry().get_pool(CountingComponent)) == 2
+
+
+def test_swap_and_pop_removal_keeps_remaining_components(game):
+    owners = [Actor(game) for _ in range(4)]
+    components = [CountingComponent(owner) for owner in owners]
+    pool = game.get_system_registry().get_pool(CountingComponent)
+
+    # Teardown of first and a middle actor (last entries move into holes)
+    owners[0].set_state(State.eDEAD)
+    owners[2].set_state(State.eDEAD)
+    game.run_frames(1)
+    assert len(pool) == 2
+
+    before = [c.updates for c in components]
+    game.run_frames(1)
+    after = [c.updates for c in components]
+    assert [a - b for a, b in zip(after, before)] == [0, 1, 0, 1]
+
+    # Removing again (already gone) is harmless
+    pool.remove(components[0])
+    assert len(pool) == 2
+
+
+def test_systems_run_in_update_order_before_actors(game):
+    calls = []
+
+    class Early(Component):
+        def update(self, dt):
+            calls.append("early")
+
+    class Late(Component):
+        def update(self, dt):
+            calls.append("late")
+
+    class Recorder(Actor):
+        def update_actor(self, dt):
+            calls.append("actor")
+
+    owner = Recorder(game)
+    Late(owner, update_order=300)
+    Early(owner, update_order=50)
+    # New actor joins at end of first tick; second tick runs everything
+    game.run_frames(1)
+    calls.clear()
+    game.run_frames(1)
+    assert calls == ["early", "late", "actor"]
+
+    systems = game.get_system_registry().get_systems()
+    assert isinstance(systems[0], MovementSystem)
+    assert [system.get_type() for system in systems[1:]] == [Early, Late]
+
+
+def test_pool_order_comes_from_first_component_of_type(game):
+    calls = []
+
+    class Tagged(Component):
+        def update(self, dt):
+            calls.append(self.get_update_order())
+
+    class Middle(Component):
+        def update(self, dt):
+            calls.append("middle")
+
+    owner = Actor(game)
+    Tagged(owner, update_order=100)
+    Middle(owner, update_order=150)
+    # Order 200 is ignored: whole type runs at its pool's order (100)
+    Tagged(owner, update_order=200)
+    game.run_frames(1)
+    assert calls == [100, 200, "middle"]
@@ -0,0 +1,62 @@
+import itertools
+
+from conftest import ROOT
+from texture import StubTexture
+from texture_atlas import TextureAtlas
+
+
+def rects(sizes, placements, pad):
+    # Padded rect of each placed image, per page
+    for name, (page, x, y) in placements.items():
+        width, height = sizes[name]
+        yield page, (x - pad, y - pad, x + width + pad, y + height + pad)
+
+
+def overlaps(a, b):
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+def test_pack_places_padded_images_without_overlap():
+    sizes = {"img%d" % i: (16 + 7 * (i % 5), 10 + 13 * (i % 3)) for i in range(40)}
+    atlas = TextureAtlas(max_page_size=256, padding=2)
+    placements, page_sizes = atlas.pack(sizes)
+
+    assert set(placements) == set(sizes)
+    by_page = {}
+    for page, rect in rects(sizes, placements, 1):
+        page_width, page_height = page_sizes[page]
+        assert rect[0] >= -1 and rect[1] >= -1
+        assert rect[2] <= page_width + 1 and rect[3] <= page_height + 1
+        by_page.setdefault(page, []).append(rect)
+    for page_rects in by_page.values():
+        for a, b in itertools.combinations(page_rects, 2):
+            assert not overlaps(a, b)
+
+
+def test_pack_spills_to_new_pages_and_skips_oversized():
+    sizes = {"big%d" % i: (100, 100) for i in range(6)}
+    sizes["huge"] = (300, 10)
+    placements, page_sizes = TextureAtlas(max_page_size=256, padding=2).pack(sizes)
+
+    assert "huge" not in placements
+    # 2 x 2 fit on a 256 page, so 6 need 2 pages
+    assert len(page_sizes) == 2
+    assert all(width <= 256 and height <= 256 for width, height in page_sizes)
+
+
+def test_pack_is_stable():
+    sizes = {"a": (32, 32), "b": (32, 32), "c": (64, 16)}
+    atlas = TextureAtlas()
+    assert atlas.pack(sizes) == atlas.pack(dict(reversed(list(sizes.items()))))
+
+
+# UV rect is (u, v, width, height) in page units
+def test_layout_regions_have_uv_rects_inside_page(monkeypatch):
+    monkeypatch.chdir(ROOT)
+    names = ["assets/ship.png", "assets/asteroid.png", "assets/laser.png"]
+    atlas = TextureAtlas()
+    atlas.layout(names, StubTexture)
+    for name in names:
+        u, v, width, height = atlas.get_region(name).get_uv_rect()
+        assert u >= 0.0 and v >= 0.0 and width > 0.0 and height > 0.0
+        assert u + width <= 1.0 and v + height <= 1.0
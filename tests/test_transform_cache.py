@@ -0,0 +1,83 @@
+import ctypes
+
+import pytest
+import sdl2
+
+from actor import Actor, State
+from maths import Matrix4, Vector2D
+
+
+@pytest.fixture
+def multiplies(monkeypatch):
+    calls = []
+    original = Matrix4.multiply
+    monkeypatch.setattr(Matrix4, "multiply", staticmethod(
+        lambda a, b, out: calls.append(out) or original(a, b, out)))
+    return calls
+
+
+def draw_all(game, alpha=0.5):
+    for sprite in game.get_sprites():
+        sprite.compute_world_matrix(alpha)
+
+
+def test_paused_sprites_do_no_matrix_math(game, multiplies):
+    keys = (ctypes.c_uint8 * sdl2.SDL_NUM_SCANCODES)()
+    for actor in game.get_actors():
+        actor.set_state(State.ePAUSED)
+    # First frame after pausing rebuilds what moved last tick
+    game.step_frame(keys, 1 / 60)
+    draw_all(game)
+    multiplies.clear()
+
+    game.step_frame(keys, 1 / 60)
+    draw_all(game)
+    assert multiplies == []
+
+
+def test_moving_sprites_blend_every_frame(game, multiplies):
+    keys = (ctypes.c_uint8 * sdl2.SDL_NUM_SCANCODES)()
+    game.step_frame(keys, 1 / 60)
+    draw_all(game)
+    multiplies.clear()
+
+    game.step_frame(keys, 1 / 60)
+    draw_all(game)
+    moving = [actor for actor in game.get_actors()
+              if actor.get_body() is not None and
+              (actor.get_body().get_velocity().x or actor.get_body().get_velocity().y)]
+    assert moving and len(multiplies) >= len(moving)
+
+
+def test_cached_sprite_matrix_is_reused(game, multiplies):
+    sprite = next(iter(game.get_sprites()))
+    owner = sprite.get_owner()
+    owner.set_state(State.ePAUSED)
+    owner.snap_previous_transform()
+    first = sprite.compute_world_matrix()
+    assert sprite.compute_world_matrix() is first
+    assert len(multiplies) == 1
+
+    # Moving the owner invalidates the cache
+    owner.set_position(Vector2D(owner.get_position().x + 1.0, owner.get_position().y))
+    owner.snap_previous_transform()
+    sprite.compute_world_matrix()
+    assert len(multiplies) == 2
+
+
+def test_unchanged_values_keep_transform_clean(game):
+    actor = Actor(game)
+    actor.set_position(Vector2D(5.0, 6.0))
+    actor.set_rotation(0.5)
+    actor.set_scale(2.0)
+    world = actor.get_world_transform()
+    assert not actor._m_recompute_world_transform
+
+    actor.set_position(Vector2D(5.0, 6.0))
+    actor.set_rotation(0.5)
+    actor.set_scale(2.0)
+    assert not actor._m_recompute_world_transform
+    assert actor.get_world_transform() is world
+
+    actor.set_scale(3.0)
+    assert actor._m_recompute_world_transform
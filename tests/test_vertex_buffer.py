@@ -0,0 +1,104 @@
+import ctypes
+from types import SimpleNamespace
+
+import pytest
+
+import vertex_buffer
+from vertex_buffer import VertexBuffer
+
+
+class StubGL:
+    """ Records buffer calls instead of talking to a driver """
+
+    GL_ARRAY_BUFFER = 0x8892
+
+    def __init__(self):
+        # Sizes passed to glBufferData, (offset, size) of glBufferSubData
+        self.allocations = []
+        self.writes = []
+
+    def glGenBuffers(self, count, buffer_id):
+        buffer_id._obj.value = 1
+
+    def glDeleteBuffers(self, count, buffer_id):
+        pass
+
+    def glBindBuffer(self, target, buffer_id):
+        pass
+
+    def glBufferData(self, target, size, data, usage):
+        self.allocations.append(size)
+
+    def glBufferSubData(self, target, offset, size, data):
+        self.writes.append((offset, size))
+
+
+@pytest.fixture
+def gl(monkeypatch):
+    stub = StubGL()
+    monkeypatch.setattr(vertex_buffer, "GL", stub)
+    return stub
+
+
+def floats(count):
+    return (ctypes.c_float * count)()
+
+
+def test_steady_frames_share_one_ring(gl):
+    buffer = VertexBuffer(StubGL.GL_ARRAY_BUFFER, "stream", alignment=12)
+    # Three 3-vertex frames fit after the first growth
+    offsets = [buffer.stream(floats(9)) for _ in range(VertexBuffer.RING_FRAMES)]
+    assert offsets == [0, 36, 72]
+    assert buffer.get_orphan_count() == 1
+    assert len(gl.allocations) == 1
+
+    # Full ring wraps to the start of fresh storage, same size
+    assert buffer.stream(floats(9)) == 0
+    assert buffer.get_orphan_count() == 2
+    assert gl.allocations[-1] == gl.allocations[0] == buffer.get_capacity()
+
+
+def test_ring_grows_at_least_double(gl):
+    buffer = VertexBuffer(StubGL.GL_ARRAY_BUFFER, "stream", capacity=64)
+    buffer.stream(floats(4))
+    buffer.stream(floats(100))
+    assert buffer.get_capacity() >= max(128, VertexBuffer.RING_FRAMES * 400)
+    # Grown storage starts empty
+    assert gl.writes[-1] == (0, 400)
+
+
+def test_stream_offsets_are_stride_aligned(gl):
+    stride = 20
+    buffer = VertexBuffer(StubGL.GL_ARRAY_BUFFER, "stream", capacity=1000, alignment=stride)
+    offsets = [buffer.stream(floats(count)) for count in (3, 7, 1, 5)]
+    assert all(offset % stride == 0 for offset in offsets)
+    # Ranges don't overlap
+    for (offset, size), (next_offset, _) in zip(gl.writes, gl.writes[1:]):
+        assert offset + size <= next_offset
+
+
+def test_update_outside_buffer_raises(gl):
+    buffer = VertexBuffer(StubGL.GL_ARRAY_BUFFER, "dynamic", capacity=16)
+    buffer.update(floats(4))
+    buffer.update(floats(2), byte_offset=8)
+    with pytest.raises(ValueError):
+        buffer.update(floats(2), byte_offset=12)
+    with pytest.raises(ValueError):
+        buffer.update(floats(1), byte_offset=-4)
+    assert gl.writes == [(0, 16), (8, 8)]
+
+
+def test_vertex_array_stream_ring_holds_several_frames(monkeypatch, gl):
+    import vertex_array
+    monkeypatch.setattr(vertex_array, "GL", SimpleNamespace(
+        GL_ARRAY_BUFFER=StubGL.GL_ARRAY_BUFFER, GL_ELEMENT_ARRAY_BUFFER=0x8893,
+        GL_FLOAT=0x1406, GL_FALSE=0,
+        glGenVertexArrays=lambda count, array_id: None,
+        glBindVertexArray=lambda array_id: None,
+        glEnableVertexAttribArray=lambda location: None,
+        glVertexAttribPointer=lambda *args: None))
+    array = vertex_array.VertexArray(None, 4, None, 6, mode="stream")
+    firsts = [array.stream_vertices(floats(4 * 5))
+              for _ in range(VertexBuffer.RING_FRAMES)]
+    assert firsts == [0, 4, 8]
+    assert array.get_vertex_buffer().get_orphan_count() == 0
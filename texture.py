@@ -3,6 +3,38 @@ import OpenGL.GL as GL
 import sdl2
 import sdl2.sdlimage as sdlimage
 import ctypes
+import struct
+from typing import Tuple  # For hinting
+
+
+# Width/height from a PNG file header (no decode), None if not a PNG
+def read_png_size(file_name: str) -> Tuple[int, int]:
+    try:
+        with open(file_name, "rb") as file_obj:
+            header = file_obj.read(24)
+    except OSError:
+        return None
+
+    # PNG signature (8 bytes), then IHDR chunk holds width/height
+    if len(header) < 24 or header[:8] != b"\x89PNG\r\n\x1a\n":
+        return None
+    return struct.unpack(">II", header[16:24])
+
+
+# Decode image file to an RGBA8 surface (caller frees it), None on failure
+def load_surface_rgba(file_name: str) -> sdl2.SDL_Surface:
+    surface: sdl2.SDL_Surface = sdlimage.IMG_Load(file_name.encode())
+    if not surface:
+        sdl2.SDL_Log(b"Failed to load image file: ", file_name.encode())
+        return None
+
+    # Byte order R, G, B, A whatever the file format was
+    rgba: sdl2.SDL_Surface = sdl2.SDL_ConvertSurfaceFormat(
+        surface, sdl2.SDL_PIXELFORMAT_RGBA32, 0)
+    sdl2.SDL_FreeSurface(surface)
+    if not rgba:
+        return None
+    return rgba
 
 
 class Texture:
@@ -55,14 +87,102 @@ class Texture:
 
         return True
 
+    # Allocate empty RGBA8 storage (e.g. an atlas page filled by update_region)
+    def create(self, width: int, height: int) -> None:
+        self._m_width = width
+        self._m_height = height
+
+        GL.glGenTextures(1, ctypes.byref(self._m_texture_id))
+        GL.glBindTexture(GL.GL_TEXTURE_2D, self._m_texture_id)
+
+        # Transparent black, so padding between regions stays invisible
+        zeros = (ctypes.c_ubyte * (width * height * 4))()
+        GL.glTexImage2D(GL.GL_TEXTURE_2D, 0, GL.GL_RGBA, width, height,
+                        0, GL.GL_RGBA, GL.GL_UNSIGNED_BYTE, zeros)
+
+        # Enable bilinear filtering
+        GL.glTexParameteri(
+            GL.GL_TEXTURE_2D, GL.GL_TEXTURE_MIN_FILTER, GL.GL_LINEAR)
+        GL.glTexParameteri(
+            GL.GL_TEXTURE_2D, GL.GL_TEXTURE_MAG_FILTER, GL.GL_LINEAR)
+
+    # Upload already-decoded RGBA8 pixels (e.g. mapped from an asset bundle)
+    def load_pixels(self, width: int, height: int, pixels: ctypes.Array) -> None:
+        self._m_width = width
+        self._m_height = height
+
+        GL.glGenTextures(1, ctypes.byref(self._m_texture_id))
+        GL.glBindTexture(GL.GL_TEXTURE_2D, self._m_texture_id)
+
+        GL.glTexImage2D(GL.GL_TEXTURE_2D, 0, GL.GL_RGBA, width, height,
+                        0, GL.GL_RGBA, GL.GL_UNSIGNED_BYTE, pixels)
+
+        # Enable bilinear filtering
+        GL.glTexParameteri(
+            GL.GL_TEXTURE_2D, GL.GL_TEXTURE_MIN_FILTER, GL.GL_LINEAR)
+        GL.glTexParameteri(
+            GL.GL_TEXTURE_2D, GL.GL_TEXTURE_MAG_FILTER, GL.GL_LINEAR)
+
+    # Copy RGBA8 pixels into a sub-rectangle (address or ctypes array)
+    def update_region(self, x: int, y: int, width: int, height: int, pixels: ctypes.c_void_p) -> None:
+        if isinstance(pixels, int):
+            pixels = ctypes.c_void_p(pixels)
+        GL.glBindTexture(GL.GL_TEXTURE_2D, self._m_texture_id)
+        GL.glTexSubImage2D(GL.GL_TEXTURE_2D, 0, x, y, width, height,
+                           GL.GL_RGBA, GL.GL_UNSIGNED_BYTE, pixels)
+
     def unload(self) -> None:
         GL.glDeleteTextures(1, self._m_texture_id)
 
-    def set_active(self) -> None:
-        GL.glBindTexture(GL.GL_TEXTURE_2D, self._m_texture_id)
+    # Bind (through state cache if given)
+    def set_active(self, state: GLState = None) -> None:
+        if state is not None:
+            state.bind_texture(self._m_texture_id.value)
+        else:
+            GL.glBindTexture(GL.GL_TEXTURE_2D, self._m_texture_id)
 
     def get_width(self) -> int:
         return self._m_width
 
     def get_height(self) -> int:
         return self._m_height
+
+    # Texture that must be bound to draw this one (itself, unlike atlas regions)
+    def get_page(self) -> Texture:
+        return self
+
+    # Sub-rectangle in UV space: (u offset, v offset, u size, v size)
+    def get_uv_rect(self) -> Tuple[float, float, float, float]:
+        return (0.0, 0.0, 1.0, 1.0)
+
+
+class StubTexture(Texture):
+    """
+    Texture stand-in for headless mode (no GL context).
+    Only reads width/height from PNG header; nothing is decoded or uploaded.
+    """
+
+    def load(self, file_name: str) -> bool:
+        size = read_png_size(file_name)
+        if size is None:
+            return False
+        self._m_width, self._m_height = size
+
+        return True
+
+    def create(self, width: int, height: int) -> None:
+        self._m_width = width
+        self._m_height = height
+
+    def load_pixels(self, width: int, height: int, pixels: ctypes.Array) -> None:
+        self._m_width = width
+        self._m_height = height
+
+    def update_region(self, x: int, y: int, width: int, height: int, pixels: ctypes.c_void_p) -> None:
+        pass
+
+    def unload(self) -> None:
+        pass
+
+    def set_active(self, state: GLState = None) -> None:
+        pass
@@ -0,0 +1,192 @@
+from __future__ import annotations
+from typing import Dict, List, Tuple     # For hinting
+import sdl2
+from texture import Texture, load_surface_rgba, read_png_size
+
+
+class AtlasRegion:
+    """
+    Sub-rectangle of an atlas page, usable wherever a Texture is.
+    Sprites on the same page draw without texture rebinds.
+    """
+
+    def __init__(self, page: Texture, x: int, y: int, width: int, height: int) -> None:
+        self._m_page: Texture = page
+        # Pixel rect inside page
+        self._m_x: int = x
+        self._m_y: int = y
+        self._m_width: int = width
+        self._m_height: int = height
+        # UV rect: (u offset, v offset, u size, v size), set once page size is known
+        self._m_uv_rect: Tuple[float, float, float, float] = (0.0, 0.0, 1.0, 1.0)
+
+    def delete(self) -> None:
+        pass
+
+    # Page owns GL texture, see TextureAtlas.unload()
+    def unload(self) -> None:
+        pass
+
+    def set_active(self, state: GLState = None) -> None:
+        self._m_page.set_active(state)
+
+    def get_width(self) -> int:
+        return self._m_width
+
+    def get_height(self) -> int:
+        return self._m_height
+
+    def get_page(self) -> Texture:
+        return self._m_page
+
+    def get_uv_rect(self) -> Tuple[float, float, float, float]:
+        return self._m_uv_rect
+
+    def get_pixel_rect(self) -> Tuple[int, int, int, int]:
+        return (self._m_x, self._m_y, self._m_width, self._m_height)
+
+    def _compute_uv_rect(self) -> None:
+        page_width: float = float(self._m_page.get_width())
+        page_height: float = float(self._m_page.get_height())
+        self._m_uv_rect = (self._m_x / page_width, self._m_y / page_height,
+                           self._m_width / page_width, self._m_height / page_height)
+
+
+class TextureAtlas:
+    """
+    Packs many images into one or a few atlas pages at load time.
+
+    Images are placed on shelves (rows), tallest first, with transparent
+    padding between them. Layout only needs image sizes (read from PNG
+    headers), so it is identical with or without an OpenGL context.
+    """
+
+    def __init__(self, max_page_size: int = 2048, padding: int = 2) -> None:
+        self._m_max_page_size: int = max_page_size
+        self._m_padding: int = padding
+
+        self._m_pages: List[Texture] = []
+        self._m_regions: Dict[str, AtlasRegion] = {}
+        # Laid out, not yet uploaded: (name, bundle holding its pixels or None)
+        self._m_pending: List[Tuple[str, AssetBundle]] = []
+
+    # Pack and upload images; page_class is Texture (or StubTexture when headless)
+    def load(self, file_names: List[str], page_class: type = Texture,
+             bundle: AssetBundle = None, preloader: TexturePreloader = None) -> bool:
+        self.layout(file_names, page_class, bundle)
+        return self.upload(preloader)
+
+    # Pack images and create (empty) pages; regions are usable from here on,
+    # pixels arrive with upload()
+    # [Images fresh in bundle skip PNG reads and decoding]
+    def layout(self, file_names: List[str], page_class: type = Texture,
+               bundle: AssetBundle = None) -> None:
+        bundled: Dict[str, bool] = {name: bundle is not None and bundle.has_fresh(name)
+                                    for name in file_names}
+
+        sizes: Dict[str, Tuple[int, int]] = {}
+        for file_name in file_names:
+            if bundled[file_name]:
+                size = bundle.get_image_size(file_name)
+            else:
+                size = read_png_size(file_name)
+            if size is None:
+                sdl2.SDL_Log(b"Atlas skipped unreadable image: ", file_name.encode())
+                continue
+            sizes[file_name] = size
+
+        placements, page_sizes = self.pack(sizes)
+
+        for width, height in page_sizes:
+            page: Texture = page_class()
+            page.create(width, height)
+            self._m_pages.append(page)
+
+        for file_name, (page_index, x, y) in placements.items():
+            width, height = sizes[file_name]
+            region = AtlasRegion(self._m_pages[page_index], x, y, width, height)
+            region._compute_uv_rect()
+            self._m_regions[file_name] = region
+
+            # Stub pages take no pixels
+            if page_class is Texture:
+                self._m_pending.append((file_name, bundle if bundled[file_name] else None))
+
+    # Copy pixels of every laid-out image into its rect (GL thread only)
+    # [Decoded surfaces come from preloader if it has them]
+    def upload(self, preloader: TexturePreloader = None) -> bool:
+        ok: bool = True
+        for file_name, bundle in self._m_pending:
+            region: AtlasRegion = self._m_regions[file_name]
+            x, y, width, height = region.get_pixel_rect()
+            if bundle is not None:
+                region.get_page().update_region(
+                    x, y, width, height, bundle.get_pixels(file_name))
+                continue
+
+            if preloader is not None and preloader.has(file_name):
+                surface: sdl2.SDL_Surface = preloader.get(file_name)
+            else:
+                surface = load_surface_rgba(file_name)
+            if surface is None:
+                ok = False
+                continue
+            region.get_page().update_region(
+                x, y, width, height, surface.contents.pixels)
+            sdl2.SDL_FreeSurface(surface)
+        self._m_pending.clear()
+        return ok
+
+    # Shelf packing: returns ({name: (page, x, y)}, [(page width, page height)])
+    def pack(self, sizes: Dict[str, Tuple[int, int]]) -> Tuple[Dict[str, Tuple[int, int, int]], List[Tuple[int, int]]]:
+        pad: int = self._m_padding
+        max_size: int = self._m_max_page_size
+
+        placements: Dict[str, Tuple[int, int, int]] = {}
+        page_sizes: List[Tuple[int, int]] = []
+
+        # Tallest first keeps shelves tight (name breaks ties, for a stable layout)
+        order = sorted(sizes, key=lambda name: (-sizes[name][1], name))
+
+        page: int = -1
+        shelf_x = shelf_y = shelf_height = used_width = max_size
+        for name in order:
+            width, height = sizes[name]
+            if width + 2 * pad > max_size or height + 2 * pad > max_size:
+                sdl2.SDL_Log(b"Image too large for atlas page: ", name.encode())
+                continue
+
+            # Next shelf when row is full, next page when page is full
+            if shelf_x + width + 2 * pad > max_size:
+                shelf_x = 0
+                shelf_y += shelf_height
+                shelf_height = 0
+            if shelf_y + height + 2 * pad > max_size:
+                if page >= 0:
+                    page_sizes.append((used_width, shelf_y + pad))
+                page += 1
+                shelf_x = shelf_y = shelf_height = used_width = 0
+
+            placements[name] = (page, shelf_x + pad, shelf_y + pad)
+            shelf_x += width + pad
+            shelf_height = max(shelf_height, height + pad)
+            used_width = max(used_width, shelf_x + pad)
+
+        if page >= 0:
+            page_sizes.append((used_width, shelf_y + shelf_height + pad))
+
+        return placements, page_sizes
+
+    def unload(self) -> None:
+        for page in self._m_pages:
+            page.unload()
+            page.delete()
+        self._m_pages.clear()
+        self._m_regions.clear()
+        self._m_pending.clear()
+
+    def get_region(self, file_name: str) -> AtlasRegion:
+        return self._m_regions.get(file_name)
+
+    def get_pages(self) -> List[Texture]:
+        return self._m_pages
@@ -0,0 +1,53 @@
+from __future__ import annotations
+from typing import Dict, Iterable     # For hinting
+from concurrent.futures import Future, ThreadPoolExecutor
+import sdl2
+
+from texture import load_surface_rgba
+
+
+class TexturePreloader:
+    """
+    DECODES IMAGES ON A THREAD POOL
+
+    Decoding (IMG_Load + RGBA conversion) runs in C with the GIL released,
+    so files decode in parallel while the main thread creates the window
+    and GL context. Only GL uploads are left for the main thread, which
+    takes each decoded surface with get().
+    """
+
+    def __init__(self, max_workers: int = None) -> None:
+        self._m_max_workers: int = max_workers
+        self._m_executor: ThreadPoolExecutor = None
+        self._m_futures: Dict[str, Future] = {}
+
+    # Queue files for decoding (returns at once)
+    def start(self, file_names: Iterable[str]) -> None:
+        if self._m_executor is None:
+            self._m_executor = ThreadPoolExecutor(max_workers=self._m_max_workers,
+                                                  thread_name_prefix="decode")
+        for file_name in file_names:
+            if file_name not in self._m_futures:
+                self._m_futures[file_name] = self._m_executor.submit(load_surface_rgba, file_name)
+
+    def has(self, file_name: str) -> bool:
+        return file_name in self._m_futures
+
+    # Decoded RGBA8 surface, waiting for it if needed (caller frees it)
+    # [None if decoding failed or file was never queued]
+    def get(self, file_name: str) -> sdl2.SDL_Surface:
+        future: Future = self._m_futures.pop(file_name, None)
+        if future is None:
+            return None
+        return future.result()
+
+    # Frees surfaces nobody took, stops threads
+    def shutdown(self) -> None:
+        for future in self._m_futures.values():
+            surface: sdl2.SDL_Surface = future.result()
+            if surface is not None:
+                sdl2.SDL_FreeSurface(surface)
+        self._m_futures.clear()
+        if self._m_executor is not None:
+            self._m_executor.shutdown()
+            self._m_executor = None
@@ -0,0 +1,160 @@
+from __future__ import annotations
+from typing import Callable, Deque, Dict, List, Tuple     # For hinting
+from collections import deque
+import functools
+import json
+import time
+
+# Recorded span: (name, category, start ns, duration ns, depth)
+SpanEvent = Tuple[str, str, int, int, int]
+
+
+class _NullSpan:
+    """ Shared do-nothing span returned while tracing is off """
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc) -> bool:
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    def __init__(self, tracer: Tracer, name: str, category: str) -> None:
+        self._m_tracer: Tracer = tracer
+        self._m_name: str = name
+        self._m_category: str = category
+        self._m_start: int = 0
+
+    def __enter__(self) -> None:
+        self._m_tracer._m_depth += 1
+        self._m_start = time.perf_counter_ns()
+
+    def __exit__(self, *exc) -> bool:
+        end: int = time.perf_counter_ns()
+        tracer: Tracer = self._m_tracer
+        tracer._m_depth -= 1
+        tracer._m_events.append((self._m_name, self._m_category, self._m_start,
+                                 end - self._m_start, tracer._m_depth))
+        return False
+
+
+class Tracer:
+    """
+    PER-FRAME TIMING SPANS
+
+    Spans nest (with tracer.span("name"): ...) and are grouped per frame;
+    the last max_frames frames are kept in a ring buffer. When disabled,
+    span() returns a shared no-op object and hot loops skip tracing
+    entirely after one is_enabled() check, so it can stay in release builds.
+    """
+
+    def __init__(self, max_frames: int = 300) -> None:
+        self._m_enabled: bool = False
+
+        # Ring buffer of finished frames: (frame number, events)
+        self._m_frames: Deque[Tuple[int, List[SpanEvent]]] = deque(
+            maxlen=max_frames)
+        # Events of frame in progress
+        self._m_events: List[SpanEvent] = []
+        self._m_depth: int = 0
+        self._m_frame_number: int = 0
+
+    def is_enabled(self) -> bool:
+        return self._m_enabled
+
+    def set_enabled(self, enabled: bool) -> None:
+        self._m_enabled = enabled
+        self._m_events = []
+        self._m_depth = 0
+
+    def begin_frame(self) -> None:
+        if self._m_enabled:
+            self._m_events = []
+            self._m_depth = 0
+
+    def end_frame(self) -> None:
+        if self._m_enabled:
+            self._m_frames.append((self._m_frame_number, self._m_events))
+            self._m_events = []
+        self._m_frame_number += 1
+
+    # Context manager timing the enclosed block
+    def span(self, name: str, category: str = "game"):
+        if not self._m_enabled:
+            return _NULL_SPAN
+        return _Span(self, name, category)
+
+    # Decorator form of span() (name defaults to function's qualified name)
+    def traced(self, name: str = None, category: str = "game") -> Callable:
+        def decorator(func: Callable) -> Callable:
+            span_name: str = name or func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self._m_enabled:
+                    return func(*args, **kwargs)
+                with _Span(self, span_name, category):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def clear(self) -> None:
+        self._m_frames.clear()
+        self._m_events = []
+
+    def get_frames(self) -> Deque[Tuple[int, List[SpanEvent]]]:
+        return self._m_frames
+
+    # Per span name: count, total ms, mean ms, max ms (over buffered frames)
+    def get_summary(self, category: str = None) -> Dict[str, Dict[str, float]]:
+        totals: Dict[str, List[float]] = {}
+        for _, events in self._m_frames:
+            for name, event_category, _, duration, _ in events:
+                if category is not None and event_category != category:
+                    continue
+                stats = totals.get(name)
+                if stats is None:
+                    stats = totals[name] = [0, 0, 0]
+                stats[0] += 1
+                stats[1] += duration
+                stats[2] = max(stats[2], duration)
+
+        summary: Dict[str, Dict[str, float]] = {}
+        for name, (count, total, longest) in sorted(totals.items(), key=lambda item: -item[1][1]):
+            summary[name] = {"count": count,
+                             "total_ms": total / 1e6,
+                             "mean_ms": total / count / 1e6,
+                             "max_ms": longest / 1e6}
+        return summary
+
+    # Human-readable table of get_summary()
+    def format_summary(self, category: str = None) -> str:
+        lines = ["{:<36} {:>8} {:>11} {:>10} {:>10}".format(
+            "span", "count", "total ms", "mean ms", "max ms")]
+        for name, stats in self.get_summary(category).items():
+            lines.append("{:<36} {:>8} {:>11.3f} {:>10.4f} {:>10.4f}".format(
+                name, stats["count"], stats["total_ms"], stats["mean_ms"], stats["max_ms"]))
+        return "\n".join(lines)
+
+    # Chrome trace-event JSON (chrome://tracing, Perfetto)
+    def export_chrome_trace(self, file_name: str) -> None:
+        trace_events = []
+        for frame_number, events in self._m_frames:
+            for name, category, start, duration, _ in events:
+                trace_events.append({
+                    "name": name,
+                    "cat": category,
+                    "ph": "X",                  # Complete event
+                    "ts": start / 1000.0,       # Microseconds
+                    "dur": duration / 1000.0,
+                    "pid": 0,
+                    "tid": 0,
+                    "args": {"frame": frame_number}})
+
+        with open(file_name, "w") as file_obj:
+            json.dump({"traceEvents": trace_events,
+                       "displayTimeUnit": "ms"}, file_obj)
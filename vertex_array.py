@@ -1,60 +1,120 @@
 from __future__ import annotations
 import OpenGL.GL as GL
 import ctypes
+from typing import List, Sequence     # For hinting
+from vertex_buffer import VertexBuffer
 
 
 class VertexArray:
     """
     This class encapsulates a mesh (AKA model).
+
+    Vertices are interleaved floats, attribute_sizes per vertex (default
+    position xyz + texture coord. uv). mode "dynamic" or "stream" makes the
+    vertex buffer updatable every frame (see VertexBuffer).
     """
 
-    def __init__(self, vertices: ctypes.Array, num_verts: int, indices: ctypes.Array, num_indices: int) -> None:
+    def __init__(self, vertices: ctypes.Array, num_verts: int, indices: ctypes.Array, num_indices: int,
+                 attribute_sizes: Sequence[int] = (3, 2), mode: str = "static") -> None:
         # Number of vertices & indices in the buffers
         self._m_num_verts: int = num_verts
         self._m_num_indices: int = num_indices
-        # OpenGL IDs of the buffers
-        self._m_vertex_buffer_id: ctypes.c_uint = ctypes.c_uint(0)
-        self._m_index_buffer_id: ctypes.c_uint = ctypes.c_uint(0)
+        # Bytes per vertex
+        self._m_vertex_stride: int = ctypes.sizeof(ctypes.c_float) * sum(attribute_sizes)
         # OpenGL ID of VertexArray object
         self._m_vertex_array_id: ctypes.c_uint = ctypes.c_uint(0)
+        # Per-instance buffer (None until added)
+        self._m_instance_buffer: VertexBuffer = None
+        self._m_instance_stride: int = 0
 
         # Create a GL vertex array object (GL returns ID not ref to object!)
         GL.glGenVertexArrays(1, ctypes.byref(self._m_vertex_array_id))
         GL.glBindVertexArray(self._m_vertex_array_id)
 
-        # Create vertex buffer, copy vertices to it
-        GL.glGenBuffers(1, ctypes.byref(self._m_vertex_buffer_id))
-        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self._m_vertex_buffer_id)
-        GL.glBufferData(GL.GL_ARRAY_BUFFER, self._m_num_verts *
-                        5 * ctypes.sizeof(ctypes.c_float), vertices, GL.GL_STATIC_DRAW)
+        # Create vertex buffer, copy vertices to it (if any yet)
+        # [A stream ring holds several frames of num_verts vertices]
+        capacity: int = num_verts * self._m_vertex_stride
+        if mode == "stream":
+            capacity *= VertexBuffer.RING_FRAMES
+        self._m_vertex_buffer: VertexBuffer = VertexBuffer(
+            GL.GL_ARRAY_BUFFER, mode, capacity, self._m_vertex_stride)
+        if vertices is not None:
+            self._m_vertex_buffer.update(vertices)
         # Create index buffer, copy indices to it
-        GL.glGenBuffers(1, ctypes.byref(self._m_index_buffer_id))
-        GL.glBindBuffer(GL.GL_ELEMENT_ARRAY_BUFFER, self._m_index_buffer_id)
-        GL.glBufferData(GL.GL_ELEMENT_ARRAY_BUFFER, self._m_num_indices *
-                        ctypes.sizeof(ctypes.c_uint), indices, GL.GL_STATIC_DRAW)
-
-        # Identify attributes in the vertex array (two attribs: pos, texture coord.)
-        GL.glEnableVertexAttribArray(0)
-        GL.glVertexAttribPointer(
-            0, 3, GL.GL_FLOAT, GL.GL_FALSE,
-            ctypes.sizeof(ctypes.c_float) * 5,  # Stride is 5 floats
-            None)
-        GL.glEnableVertexAttribArray(1)
-        GL.glVertexAttribPointer(
-            1, 2, GL.GL_FLOAT, GL.GL_FALSE,
-            ctypes.sizeof(ctypes.c_float) * 5,
-            ctypes.c_void_p(ctypes.sizeof(ctypes.c_float) * 3))  # Offset is 3 floats from start
+        self._m_index_buffer: VertexBuffer = VertexBuffer(
+            GL.GL_ELEMENT_ARRAY_BUFFER, "static", num_indices * ctypes.sizeof(ctypes.c_uint))
+        if indices is not None:
+            self._m_index_buffer.update(indices)
+
+        # Identify attributes in the vertex array (default two attribs: pos, texture coord.)
+        float_size: int = ctypes.sizeof(ctypes.c_float)
+        offset: int = 0
+        for location, size in enumerate(attribute_sizes):
+            GL.glEnableVertexAttribArray(location)
+            GL.glVertexAttribPointer(
+                location, size, GL.GL_FLOAT, GL.GL_FALSE,
+                self._m_vertex_stride,      # Stride is whole vertex
+                ctypes.c_void_p(offset))    # Offset of attribute in vertex
+            offset += float_size * size
 
     def delete(self) -> None:
         # Delete in reverse
-        GL.glDeleteBuffers(1, ctypes.byref(self._m_vertex_buffer_id))
-        GL.glDeleteBuffers(1, ctypes.byref(self._m_index_buffer_id))
+        if self._m_instance_buffer is not None:
+            self._m_instance_buffer.delete()
+        self._m_vertex_buffer.delete()
+        self._m_index_buffer.delete()
         GL.glDeleteVertexArrays(1, ctypes.byref(self._m_vertex_array_id))
 
-    # Which vertex array object to use
-    def set_active(self) -> None:
+    # Which vertex array object to use (through state cache if given)
+    def set_active(self, state: GLState = None) -> None:
+        if state is not None:
+            state.bind_vertex_array(self._m_vertex_array_id.value)
+        else:
+            GL.glBindVertexArray(self._m_vertex_array_id)
+
+    # Overwrite vertices from first_vertex on (dynamic/stream vertex buffers)
+    def update_vertices(self, data, first_vertex: int = 0, state: GLState = None) -> None:
+        self._m_vertex_buffer.update(data, first_vertex * self._m_vertex_stride, state)
+
+    # Append this frame's vertices to the ring; returns index of first one
+    # [Draw with it as first (glDrawArrays) or base vertex (glDrawElementsBaseVertex)]
+    def stream_vertices(self, data, state: GLState = None) -> int:
+        return self._m_vertex_buffer.stream(data, state) // self._m_vertex_stride
+
+    # Add per-instance float attributes at consecutive locations from 'location'
+    # [e.g. [4, 4, 4, 4, 4] is a mat4 (one vec4 per row) followed by a vec4]
+    def add_instance_buffer(self, location: int, attribute_sizes: List[int]) -> None:
         GL.glBindVertexArray(self._m_vertex_array_id)
 
+        self._m_instance_buffer = VertexBuffer(GL.GL_ARRAY_BUFFER, "stream")
+        self._m_instance_buffer.bind()
+
+        # Interleaved, advancing once per instance
+        float_size: int = ctypes.sizeof(ctypes.c_float)
+        self._m_instance_stride = float_size * sum(attribute_sizes)
+        offset: int = 0
+        for i, size in enumerate(attribute_sizes):
+            GL.glEnableVertexAttribArray(location + i)
+            GL.glVertexAttribPointer(
+                location + i, size, GL.GL_FLOAT, GL.GL_FALSE,
+                self._m_instance_stride,
+                ctypes.c_void_p(offset))
+            GL.glVertexAttribDivisor(location + i, 1)
+            offset += float_size * size
+
+    # Replace per-instance data (buffer orphaned so in-flight draws don't stall)
+    def set_instance_data(self, data: ctypes.Array, num_instances: int,
+                          state: GLState = None) -> None:
+        size: int = num_instances * self._m_instance_stride
+        self._m_instance_buffer.set_data(
+            memoryview(data).cast("B")[:size], state)
+
+    def get_vertex_buffer(self) -> VertexBuffer:
+        return self._m_vertex_buffer
+
+    def get_instance_buffer(self) -> VertexBuffer:
+        return self._m_instance_buffer
+
     def get_num_indices(self) -> int:
         return self._m_num_indices
 
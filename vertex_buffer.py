@@ -0,0 +1,118 @@
+from __future__ import annotations
+import OpenGL.GL as GL
+import ctypes
+import numpy as np
+
+
+# Zero-copy uint8 view of ctypes arrays, NumPy arrays, bytes, memoryviews...
+# [Non-contiguous NumPy arrays are the only inputs that get copied]
+def as_byte_array(data) -> np.ndarray:
+    if isinstance(data, np.ndarray):
+        return np.ascontiguousarray(data).reshape(-1).view(np.uint8)
+    return np.frombuffer(data, dtype=np.uint8)
+
+
+class VertexBuffer:
+    """
+    GL BUFFER OBJECT WITH STATIC, DYNAMIC OR STREAMING UPDATES
+
+    static:  filled once (GL_STATIC_DRAW).
+    dynamic: updated in place by byte range with glBufferSubData.
+    stream:  per-frame data appended ring-buffer style; when the ring is
+             full the storage is orphaned, so the driver hands out fresh
+             memory instead of waiting for draws still reading the old one.
+    The buffer object itself is created once and reused.
+    """
+
+    USAGES = {"static": GL.GL_STATIC_DRAW,
+              "dynamic": GL.GL_DYNAMIC_DRAW,
+              "stream": GL.GL_STREAM_DRAW}
+    # Frames of data a stream ring holds before it wraps (orphans)
+    RING_FRAMES = 3
+
+    def __init__(self, target: int = GL.GL_ARRAY_BUFFER, mode: str = "static",
+                 capacity: int = 0, alignment: int = 4) -> None:
+        self._m_target: int = target
+        self._m_mode: str = mode
+        self._m_usage: int = self.USAGES[mode]
+        # Size of GL storage and next free byte of ring (stream mode)
+        self._m_capacity: int = 0
+        self._m_head: int = 0
+        # Streamed ranges start at multiples of this (e.g. vertex size)
+        self._m_alignment: int = alignment
+        self._m_orphan_count: int = 0
+
+        self._m_buffer_id: ctypes.c_uint = ctypes.c_uint(0)
+        GL.glGenBuffers(1, ctypes.byref(self._m_buffer_id))
+        if capacity > 0:
+            self.allocate(capacity)
+
+    def delete(self) -> None:
+        GL.glDeleteBuffers(1, ctypes.byref(self._m_buffer_id))
+
+    def bind(self, state: GLState = None) -> None:
+        if state is not None and self._m_target == GL.GL_ARRAY_BUFFER:
+            state.bind_array_buffer(self._m_buffer_id.value)
+        else:
+            GL.glBindBuffer(self._m_target, self._m_buffer_id)
+
+    # New (undefined) storage of given size; old storage is orphaned
+    def allocate(self, capacity: int, state: GLState = None) -> None:
+        self.bind(state)
+        GL.glBufferData(self._m_target, capacity, None, self._m_usage)
+        self._m_capacity = capacity
+        self._m_head = 0
+
+    # Replace whole contents (storage orphaned, grown if data is larger)
+    def set_data(self, data, state: GLState = None) -> None:
+        array: np.ndarray = as_byte_array(data)
+        self.bind(state)
+        if array.nbytes > self._m_capacity:
+            self._m_capacity = array.nbytes
+        GL.glBufferData(self._m_target, self._m_capacity, None, self._m_usage)
+        if array.nbytes:
+            GL.glBufferSubData(self._m_target, 0, array.nbytes, array)
+        self._m_head = 0
+
+    # Overwrite byte range [byte_offset, byte_offset + size of data)
+    def update(self, data, byte_offset: int = 0, state: GLState = None) -> None:
+        array: np.ndarray = as_byte_array(data)
+        if byte_offset < 0 or byte_offset + array.nbytes > self._m_capacity:
+            raise ValueError("Update of {} bytes at {} outside buffer of {} bytes".format(
+                array.nbytes, byte_offset, self._m_capacity))
+        self.bind(state)
+        GL.glBufferSubData(self._m_target, byte_offset, array.nbytes, array)
+
+    # Append to ring, returns byte offset data was written at
+    def stream(self, data, state: GLState = None) -> int:
+        array: np.ndarray = as_byte_array(data)
+        size: int = array.nbytes
+        if size > self._m_capacity:
+            # Grow to several frames (at least doubling): a steady frame
+            # size then only orphans once per RING_FRAMES frames
+            padded: int = size + (-size % self._m_alignment)
+            self.allocate(max(self.RING_FRAMES * padded, 2 * self._m_capacity), state)
+            self._m_orphan_count += 1
+        elif self._m_head + size > self._m_capacity:
+            self.allocate(self._m_capacity, state)
+            self._m_orphan_count += 1
+        else:
+            self.bind(state)
+
+        offset: int = self._m_head
+        GL.glBufferSubData(self._m_target, offset, size, array)
+        self._m_head = offset + size + (-size % self._m_alignment)
+        return offset
+
+    def get_id(self) -> int:
+        return self._m_buffer_id.value
+
+    def get_capacity(self) -> int:
+        return self._m_capacity
+
+    def get_mode(self) -> str:
+        return self._m_mode
+
+    # Times stream() had to orphan or grow the ring
+    def get_orphan_count(self) -> int:
+        return self._m_orphan_count
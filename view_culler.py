@@ -0,0 +1,76 @@
+from __future__ import annotations
+from typing import Dict, List   # For hinting
+
+
+class ViewCuller:
+    """
+    PICKS THE SPRITES THAT OVERLAP THE CAMERA RECTANGLE
+
+    Each sprite's bounding circle (texture size times owner's world scale)
+    is tested against the view, widened by a margin that covers movement
+    between the current tick and the blended position actually drawn.
+    Sprites of root actors are tested from position and scale alone, so
+    culled sprites never build a world matrix.
+
+    Every sprite is tested each frame: sprites move every tick, so a grid
+    would be re-binned each frame too, and that measured slower than the
+    plain test (see benchmarks/bench_suite.py, "culling").
+    """
+
+    def __init__(self, half_width: float = 512.0, half_height: float = 384.0,
+                 margin: float = 32.0) -> None:
+        # View rectangle: center and half extents (world units)
+        self._m_x: float = 0.0
+        self._m_y: float = 0.0
+        self._m_half_width: float = half_width
+        self._m_half_height: float = half_height
+        self._m_margin: float = margin
+
+        self._m_visible_count: int = 0
+        self._m_total_count: int = 0
+
+    def set_view(self, x: float, y: float, half_width: float, half_height: float) -> None:
+        self._m_x = x
+        self._m_y = y
+        self._m_half_width = half_width
+        self._m_half_height = half_height
+
+    # Visible sprites of each draw order, in draw order
+    def cull(self, layers: Dict[int, Dict[SpriteComponent, None]],
+             draw_orders: List[int]) -> List[List[SpriteComponent]]:
+        x: float = self._m_x
+        y: float = self._m_y
+        reach_x: float = self._m_half_width + self._m_margin
+        reach_y: float = self._m_half_height + self._m_margin
+
+        visible: List[List[SpriteComponent]] = []
+        total: int = 0
+        count: int = 0
+        for draw_order in draw_orders:
+            layer: Dict[SpriteComponent, None] = layers[draw_order]
+            total += len(layer)
+            sprites: List[SpriteComponent] = []
+            for sprite in layer:
+                sprite_x, sprite_y, radius = sprite.get_bounds()
+                if abs(sprite_x - x) <= reach_x + radius and \
+                        abs(sprite_y - y) <= reach_y + radius:
+                    sprites.append(sprite)
+            count += len(sprites)
+            visible.append(sprites)
+
+        self._m_visible_count = count
+        self._m_total_count = total
+        return visible
+
+    def is_visible(self, sprite: SpriteComponent) -> bool:
+        x, y, radius = sprite.get_bounds()
+        reach: float = radius + self._m_margin
+        return abs(x - self._m_x) <= self._m_half_width + reach and \
+            abs(y - self._m_y) <= self._m_half_height + reach
+
+    # Sprites drawn / sprites considered, last cull
+    def get_visible_count(self) -> int:
+        return self._m_visible_count
+
+    def get_total_count(self) -> int:
+        return self._m_total_count
@@ -0,0 +1,145 @@
+from __future__ import annotations
+from typing import Iterable, List, NamedTuple     # For hinting
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import ctypes
+import os
+import random
+import time
+import sdl2
+
+from game import Game
+from replay import InputReplayer
+
+
+class WorldJob(NamedTuple):
+    seed: int
+    num_frames: int
+    # Replay log to play instead of the bot (its seed/tick rate win)
+    replay_file: str = None
+    tick_rate: int = 60
+
+
+class WorldResult(NamedTuple):
+    seed: int
+    frames: int
+    elapsed: float          # Seconds spent simulating (setup excluded)
+    checksum: int           # Final Game.compute_state_checksum
+    asteroids: int
+    actors: int
+    diverged_frame: int     # Replays only (-1: matched recording)
+    pid: int                # Worker process that ran the world
+
+
+class ScriptedBot:
+    """ Presses/releases ship keys at random (own generator, seeded per world) """
+
+    KEYS = (sdl2.SDL_SCANCODE_W, sdl2.SDL_SCANCODE_S, sdl2.SDL_SCANCODE_A,
+            sdl2.SDL_SCANCODE_D, sdl2.SDL_SCANCODE_SPACE)
+
+    def __init__(self, seed: int, toggle_chance: float = 0.05) -> None:
+        self._m_random: random.Random = random.Random(seed)
+        self._m_toggle_chance: float = toggle_chance
+        self._m_keyb_state: ctypes.Array = (ctypes.c_uint8 * sdl2.SDL_NUM_SCANCODES)()
+
+    def get_keys(self) -> ctypes.Array:
+        for key in self.KEYS:
+            if self._m_random.random() < self._m_toggle_chance:
+                self._m_keyb_state[key] ^= 1
+        return self._m_keyb_state
+
+
+# Runs one self-contained headless world (top-level, so workers can pickle it)
+def run_world(job: WorldJob) -> WorldResult:
+    replayer: InputReplayer = None
+    if job.replay_file is not None:
+        replayer = InputReplayer(job.replay_file)
+        game = Game(headless=True, tick_rate=replayer.get_tick_rate(),
+                    seed=replayer.get_seed())
+    else:
+        game = Game(headless=True, tick_rate=job.tick_rate, seed=job.seed)
+    game.initialize()
+
+    diverged_frame: int = -1
+    if replayer is not None:
+        replay_result = replayer.run(game)
+        frames, elapsed = replay_result.frames, replay_result.elapsed
+        diverged_frame = replay_result.diverged_frame
+    else:
+        bot = ScriptedBot(job.seed)
+        frame_time: float = 1.0 / job.tick_rate
+        start: float = time.perf_counter()
+        for _ in range(job.num_frames):
+            game.step_frame(bot.get_keys(), frame_time)
+        elapsed = time.perf_counter() - start
+        frames = job.num_frames
+
+    result = WorldResult(game.get_seed(), frames, elapsed, game.compute_state_checksum(),
+                         len(game.get_asteroids()), len(game.get_actors()),
+                         diverged_frame, os.getpid())
+    game.shutdown()
+    return result
+
+
+class WorldRunner:
+    """
+    RUNS MANY INDEPENDENT WORLDS ACROSS A PROCESS POOL
+
+    Worlds share nothing (each game owns its generator and data), so they
+    scale with cores; results come back in job order.
+    """
+
+    def __init__(self, workers: int = None) -> None:
+        self._m_workers: int = workers or os.cpu_count() or 1
+        self._m_elapsed: float = 0.0
+
+    def run(self, jobs: Iterable[WorldJob]) -> List[WorldResult]:
+        jobs = list(jobs)
+        start: float = time.perf_counter()
+        if self._m_workers == 1:
+            results = [run_world(job) for job in jobs]
+        else:
+            # Several jobs per task keeps pickling overhead low
+            chunk_size: int = max(1, len(jobs) // (self._m_workers * 4))
+            with ProcessPoolExecutor(max_workers=self._m_workers) as executor:
+                results = list(executor.map(run_world, jobs, chunksize=chunk_size))
+        self._m_elapsed = time.perf_counter() - start
+        return results
+
+    def get_workers(self) -> int:
+        return self._m_workers
+
+    # Wall time of last run() (pool startup included)
+    def get_elapsed(self) -> float:
+        return self._m_elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run many headless worlds in parallel")
+    parser.add_argument("--worlds", type=int, default=100)
+    parser.add_argument("--frames", type=int, default=600,
+                        help="frames per world (bot-driven worlds)")
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None,
+                        help="processes (default: one per core)")
+    parser.add_argument("--replay", metavar="FILE",
+                        help="replay this log in every world instead of bots")
+    args = parser.parse_args()
+
+    jobs = [WorldJob(args.first_seed + i, args.frames, args.replay)
+            for i in range(args.worlds)]
+    runner = WorldRunner(args.workers)
+    results = runner.run(jobs)
+
+    frames: int = sum(result.frames for result in results)
+    cpu_time: float = sum(result.elapsed for result in results)
+    diverged: int = sum(1 for result in results if result.diverged_frame >= 0)
+    print("{} worlds, {} frames on {} workers in {:.3f}s ({:.0f} frames/s, {:.0f} frames/s per worker)".format(
+        len(results), frames, runner.get_workers(), runner.get_elapsed(),
+        frames / runner.get_elapsed(), frames / cpu_time if cpu_time > 0 else 0.0))
+    if args.replay:
+        print("{} of {} replays diverged".format(diverged, len(results)))
+
+
+if __name__ == "__main__":
+    main()